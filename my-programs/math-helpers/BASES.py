@@ -11,10 +11,86 @@ conversion result for every base from the target down to base 1.
 Easter Eggs from original:
 - "Enrer" typo (should be "Enter")
 
+convert_decimal_to_base() used to peel off one digit at a time with % and
+//, and each of those goes over the whole number, so a number with a
+million digits took hours. It now splits the number in two around a power
+of the base, base^(64·2^k), converts both halves the same way and puts
+them side by side. Those powers are squared from one another and kept
+per base, along with their reciprocals, so each split is a multiplication
+rather than a long division. to_bases() converts one number into many
+bases at once: bases 2, 8 and 16 come from Python's own linear-time
+formatting, and for long numbers a base like 27 only regroups the digits
+already worked out in base 3. The "show all bases" loop uses it instead
+of converting from scratch for every base:
+
+  python BASES.py               # convert interactively
+  python BASES.py --benchmark   # 1,000 to 1,000,000-digit numbers
+
+Given a file (or - for standard input), it converts every line of it
+from one base to another instead, fractions and minus signs included,
+a chunk at a time, with long input spread over a pool of worker
+processes. The numbers come out in the order they went in, memory stays
+the same however long the input is, and the lines per second go to
+standard error, along with a "line N: ..." message for each line that is
+not a number (its output line is left empty):
+
+  python BASES.py numbers.txt --from 10 --to 16 > hex.txt
+  python BASES.py --generate 1000000 --from 16 | python BASES.py - --from 16 --to 3
+
 Press Ctrl+C to quit.
 """
 
+import argparse
+import math
+import os
+import random
 import sys
+import time
+from typing import NamedTuple
+
+from stream_pool import map_chunks, peak_memory_mb, read_chunks
+from timing import format_seconds, timed
+
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Numbers below base^LEAF_DIGITS are converted two digits at a time
+LEAF_DIGITS = 64
+# Powers of the base shorter than this many bits are divided by with divmod;
+# longer ones by multiplying by a cached reciprocal, which is faster
+RECIPROCAL_BITS = 20_000
+
+# For each base, [digits, base**digits, reciprocal or None] for digits =
+# LEAF_DIGITS, 2·LEAF_DIGITS, 4·LEAF_DIGITS, ...
+POWER_CACHE: dict = {}
+# For each base, its digit pairs "00" to "ZZ"
+PAIR_CACHE: dict = {}
+# base**digits for (base, digits), for scaling fractions
+SCALE_CACHE: dict = {}
+
+# Below this many bits, to_bases() converts into each base on its own:
+# regrouping another base's digits only pays off for longer numbers
+REGROUP_BITS = 32_000
+# Bases that Python formats itself in linear time
+FORMAT_SPECS = {2: "b", 8: "o", 16: "X"}
+
+# Digit strings up to this long are read with int(); longer ones are split
+# in two around a cached power of the base and read the same way
+PARSE_DIGITS = 2048
+
+# Streaming: a chunk sent to a worker ends after this many lines or
+# characters, whichever comes first
+CHUNK_LINES = 2000
+CHUNK_CHARS = 1_000_000
+
+# Benchmark: decimal digits in the numbers converted to base 10, and in
+# those converted into every base from 2 to 36 at once
+BENCHMARK_DIGITS = [1_000, 10_000, 100_000, 1_000_000]
+BATCH_DIGITS = [1_000, 10_000, 100_000]
+# Largest numbers timed with the digit-at-a-time loop and with plain divmod
+# splitting; beyond them they take minutes
+DIGIT_LOOP_LIMIT = 10_000
+DIVMOD_LIMIT = 100_000
 
 
 def convert_decimal_to_base(decimal_number: int, target_base: int) -> str:
@@ -29,6 +105,13 @@ def convert_decimal_to_base(decimal_number: int, target_base: int) -> str:
         The number as a string in the new base.
         Uses letters A-Z for digits 10-35.
     """
+    if target_base < 2:
+        return str(decimal_number)
+    return to_base(decimal_number, target_base)
+
+
+def convert_digit_by_digit(decimal_number: int, target_base: int) -> str:
+    """convert_decimal_to_base() one digit at a time, as the original did (for the benchmark)."""
     if decimal_number == 0:
         return "0"
     if target_base < 2:
@@ -57,6 +140,429 @@ def convert_decimal_to_base(decimal_number: int, target_base: int) -> str:
     return "-" + result if decimal_number < 0 else result
 
 
+def digit_pairs(base: int) -> list[str]:
+    """Every two-digit string in base, "00" up to the largest, in order."""
+    pairs = PAIR_CACHE.get(base)
+    if pairs is None:
+        pairs = [DIGITS[high] + DIGITS[low] for high in range(base) for low in range(base)]
+        PAIR_CACHE[base] = pairs
+    return pairs
+
+
+def reciprocal(power: int) -> int:
+    """
+    About 2**(2k) / power, for power with k bits, found by Newton's method
+    from the reciprocal of its top half, so it costs a few multiplications
+    instead of one long division. May be a few units off.
+    """
+    bits = power.bit_length()
+    if bits <= RECIPROCAL_BITS:
+        return (1 << (2 * bits)) // power
+    shift = bits - (bits // 2 + 1)
+    estimate = reciprocal(power >> shift) << shift
+    error = (1 << (2 * bits)) - power * estimate
+    return estimate + ((estimate * error) >> (2 * bits))
+
+
+def base_powers(base: int, number: int) -> list:
+    """base's cached [digits, power, reciprocal] entries, extended until the last power exceeds √number."""
+    powers = POWER_CACHE.setdefault(base, [])
+    if not powers:
+        powers.append([LEAF_DIGITS, base ** LEAF_DIGITS, None])
+    while powers[-1][1].bit_length() * 2 <= number.bit_length() + 1:
+        digits, power, _ = powers[-1]
+        powers.append([2 * digits, power * power, None])
+    return powers
+
+
+def split(number: int, entry: list, use_reciprocal: bool = True) -> tuple[int, int]:
+    """divmod(number, power) for a base_powers() entry, for number below power²."""
+    digits, power, inverse = entry
+    if not use_reciprocal or power.bit_length() <= RECIPROCAL_BITS:
+        return divmod(number, power)
+    if inverse is None:
+        inverse = entry[2] = reciprocal(power)
+    # number / power = number · inverse / 2**(2k); the low k - 1 bits of
+    # number hardly matter to that, so they are left out of the product
+    bits = power.bit_length()
+    quotient = ((number >> (bits - 1)) * inverse) >> (bits + 1)
+    remainder = number - quotient * power
+    # The reciprocal is only nearly right; the quotient is then off by a few
+    while remainder < 0:
+        quotient -= 1
+        remainder += power
+    while remainder >= power:
+        quotient += 1
+        remainder -= power
+    return quotient, remainder
+
+
+def _convert(number: int, base: int, powers: list, level: int, width: int,
+             use_reciprocal: bool) -> str:
+    """
+    number in base, below powers[level + 1]'s power, padded with zeros to
+    width digits (no padding for width 0).
+    """
+    if level < 0:
+        pairs = digit_pairs(base)
+        square = base * base
+        chunks = []
+        while number:
+            number, pair = divmod(number, square)
+            chunks.append(pairs[pair])
+        text = "".join(reversed(chunks))
+        return text.rjust(width, "0") if width else text.lstrip("0")
+    high, low = split(number, powers[level], use_reciprocal)
+    if not width and not high:
+        return _convert(low, base, powers, level - 1, 0, use_reciprocal)
+    digits = powers[level][0]
+    return (_convert(high, base, powers, level - 1, width - digits if width else 0, use_reciprocal)
+            + _convert(low, base, powers, level - 1, digits, use_reciprocal))
+
+
+def to_base(number: int, base: int, use_reciprocal: bool = True) -> str:
+    """
+    number written in base (2-36), with a leading "-" if it is negative.
+
+    Divides and conquers around base_powers(); use_reciprocal=False splits
+    with plain divmod instead (for the benchmark).
+    """
+    if not 2 <= base <= 36:
+        raise ValueError(f"base must be from 2 to 36, not {base}")
+    size = abs(number)
+    powers = base_powers(base, size)
+    text = _convert(size, base, powers, len(powers) - 1, 0, use_reciprocal) or "0"
+    return "-" + text if number < 0 else text
+
+
+def root_base(base: int) -> tuple[int, int]:
+    """(root, exponent) with root ** exponent == base and root as small as possible."""
+    for root in range(2, base):
+        power, exponent = root, 1
+        while power < base:
+            power *= root
+            exponent += 1
+        if power == base:
+            return root, exponent
+    return base, 1
+
+
+def regroup(text: str, base: int, exponent: int) -> str:
+    """Digits in base, rewritten in base**exponent by taking them exponent at a time."""
+    sign = "-" if text.startswith("-") else ""
+    text = text.lstrip("-")
+    text = text.rjust(-(-len(text) // exponent) * exponent, "0")
+    target = base ** exponent
+    values = {}
+    digits = []
+    for index in range(0, len(text), exponent):
+        group = text[index:index + exponent]
+        digit = values.get(group)
+        if digit is None:
+            digit = values[group] = DIGITS[int(group, base) % target]
+        digits.append(digit)
+    return sign + ("".join(digits).lstrip("0") or "0")
+
+
+def to_bases(number: int, bases) -> dict:
+    """
+    number in each of bases, as {base: digits}. Bases 2, 8 and 16 come
+    from Python's own formatting, which takes linear time. From
+    REGROUP_BITS up, the other bases that are powers of a smaller one
+    (4, 9, 25, 27, 32, 36) regroup that base's digits instead of
+    converting again; below it, converting each base is quicker.
+    """
+    results = {}
+    batch = number.bit_length() >= REGROUP_BITS
+    for base in sorted(set(bases)):
+        if base in FORMAT_SPECS:
+            results[base] = format(number, FORMAT_SPECS[base])
+            continue
+        root, exponent = root_base(base) if batch else (base, 1)
+        if root not in results:
+            results[root] = to_base(number, root)
+        if exponent > 1:
+            results[base] = regroup(results[root], root, exponent)
+    return {base: results[base] for base in bases}
+
+
+def scale(base: int, digits: int) -> int:
+    """base**digits, cached."""
+    power = SCALE_CACHE.get((base, digits))
+    if power is None:
+        power = SCALE_CACHE[base, digits] = base ** digits
+    return power
+
+
+def _parse(text: str, base: int, powers: list, level: int) -> int:
+    """The value of a digit string at most 2·powers[level + 1]'s digits long."""
+    while level >= 0 and powers[level][0] >= len(text):
+        level -= 1
+    if level < 0:
+        return int(text, base)
+    digits, power, _ = powers[level]
+    return (_parse(text[:-digits], base, powers, level - 1) * power
+            + _parse(text[-digits:], base, powers, level - 1))
+
+
+def from_base(text: str, base: int) -> int:
+    """
+    The value of a string of digits (no sign) in base (2-36).
+
+    int() is quadratic for long strings outside the power-of-two bases, so
+    those are split in half around the same cached powers to_base() uses.
+    """
+    if not (text.isascii() and text.isalnum()):
+        raise ValueError(f"not a number in base {base}: {text[:40]!r}")
+    if len(text) <= PARSE_DIGITS or base & (base - 1) == 0:
+        return int(text, base)
+    powers = POWER_CACHE.setdefault(base, [])
+    if not powers:
+        powers.append([LEAF_DIGITS, base ** LEAF_DIGITS, None])
+    while powers[-1][0] * 2 < len(text):
+        digits, power, _ = powers[-1]
+        powers.append([2 * digits, power * power, None])
+    return _parse(text, base, powers, len(powers) - 1)
+
+
+def convert_number(text: str, source_base: int, target_base: int,
+                   precision: int | None = None) -> str:
+    """
+    A number like "-1A.8" in source_base, written in target_base.
+
+    A fractional part is rounded to precision digits, or by default to as
+    many as it takes to keep the input's precision, with trailing zeros
+    dropped.
+    """
+    text = text.strip()
+    sign = text[:1] if text[:1] in ("+", "-") else ""
+    whole, point, fraction = text[len(sign):].partition(".")
+    if not whole and not fraction:
+        raise ValueError(f"not a number: {text[:40]!r}")
+    integer = from_base(whole, source_base) if whole else 0
+
+    fraction_text = ""
+    if point and fraction:
+        places = len(fraction)
+        if precision is None:
+            precision = math.ceil(places * math.log(source_base) / math.log(target_base))
+        # Round fraction / source_base**places to precision digits
+        denominator = scale(source_base, places)
+        scaled = ((2 * from_base(fraction, source_base) * scale(target_base, precision) + denominator)
+                  // (2 * denominator))
+        if scaled == scale(target_base, precision):
+            integer += 1
+            scaled = 0
+        if scaled:
+            fraction_text = "." + to_base(scaled, target_base).rjust(precision, "0").rstrip("0")
+
+    result = to_base(integer, target_base) + fraction_text
+    return "-" + result if sign == "-" and result != "0" else result
+
+
+class StreamOptions(NamedTuple):
+    """What every worker needs to know besides its lines."""
+
+    source_base: int
+    target_base: int
+    precision: int | None
+
+
+def convert_chunk(first_line: int, lines: list, options: StreamOptions) -> tuple[list, list]:
+    """
+    Output lines for a chunk of input lines, and an error message for each
+    line that was not a number. Those lines come out empty, so output line
+    N still goes with input line N.
+    """
+    output = []
+    errors = []
+    for line_number, line in enumerate(lines, first_line):
+        if not line.strip():
+            output.append("")
+            continue
+        try:
+            output.append(convert_number(line, options.source_base, options.target_base,
+                                         options.precision))
+        except ValueError as error:
+            output.append("")
+            errors.append(f"line {line_number}: {error}")
+    return output, errors
+
+
+def run_stream(source, output, args: argparse.Namespace):
+    """Convert every line of source into output and report to standard error."""
+    started = time.perf_counter()
+    options = StreamOptions(args.source_base, args.target_base, args.precision)
+    lines = (line.rstrip("\r\n") for line in source)
+    count = characters = errors = 0
+    chunks = read_chunks(lines, args.chunk_lines, CHUNK_CHARS)
+    for text, messages in map_chunks(convert_chunk, chunks, options, args.workers):
+        output.write("\n".join(text))
+        output.write("\n")
+        for message in messages:
+            print(message, file=sys.stderr)
+        count += len(text)
+        characters += sum(len(line) for line in text)
+        errors += len(messages)
+    output.flush()
+
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    report = (f"{count:,} lines in {elapsed:.2f} s ({count / elapsed:,.0f} lines/s, "
+              f"{characters / elapsed / 1e6:.1f} M digits/s out, "
+              f"{args.workers} worker{'s' if args.workers != 1 else ''}): "
+              f"base {args.source_base} to base {args.target_base}, {errors:,} errors")
+    memory = peak_memory_mb()
+    if memory is not None:
+        report += f"; peak memory {memory[0]:.1f} MB"
+        if args.workers > 1:
+            report += f", largest worker {memory[1]:.1f} MB"
+    print(report, file=sys.stderr)
+
+
+def generate_numbers(count: int, base: int, digits: int, seed: int, output):
+    """Write count random numbers in base, with up to digits digits before and after the point."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        number = to_base(rng.randrange(base ** rng.randint(1, digits)), base)
+        if rng.random() < 0.5:
+            number += "." + "".join(rng.choice(DIGITS[:base]) for _ in range(rng.randint(1, digits)))
+        if rng.random() < 0.5:
+            number = "-" + number
+        output.write(number + "\n")
+
+
+def run_benchmark(seed: int):
+    """Time the conversions from 1,000 to 1,000,000 digits, checking they agree."""
+    rng = random.Random(seed)
+    print("Into base 10 (first = working out the powers of 10 too, again = cached)")
+    print(f"{'digits':>10}  {'digit loop':>10}  {'divmod':>10}  {'first':>10}  {'again':>10}")
+    for digits in BENCHMARK_DIGITS:
+        number = rng.randrange(10 ** (digits - 1), 10 ** digits)
+        POWER_CACHE.clear()
+        expected, first = timed(to_base, number, 10)
+        _, again = timed(to_base, number, 10)
+        if len(expected) != digits:
+            raise AssertionError(f"{len(expected)} digits instead of {digits}")
+        times = []
+        for function, limit in ((convert_digit_by_digit, DIGIT_LOOP_LIMIT),
+                                (lambda value, base: to_base(value, base, False), DIVMOD_LIMIT)):
+            if digits > limit:
+                times.append("-")
+                continue
+            result, elapsed = timed(function, number, 10)
+            if result != expected:
+                raise AssertionError(f"conversions disagree at {digits:,} digits")
+            times.append(format_seconds(elapsed))
+        print(f"{digits:>10,}  {times[0]:>10}  {times[1]:>10}  {format_seconds(first):>10}  "
+              f"{format_seconds(again):>10}")
+
+    print("\nInto every base from 2 to 36")
+    print(f"{'digits':>10}  {'digit loop':>10}  {'to_base()':>10}  {'to_bases()':>10}")
+    bases = range(2, 37)
+    for digits in BATCH_DIGITS:
+        number = rng.randrange(10 ** (digits - 1), 10 ** digits)
+        POWER_CACHE.clear()
+        PAIR_CACHE.clear()
+        batch, batch_time = timed(to_bases, number, bases)
+        POWER_CACHE.clear()
+        PAIR_CACHE.clear()
+        single, single_time = timed(lambda: {base: to_base(number, base) for base in bases})
+        if batch != single:
+            raise AssertionError(f"to_bases() and to_base() disagree at {digits:,} digits")
+        loop_time = "-"
+        if digits <= DIGIT_LOOP_LIMIT:
+            loop, elapsed = timed(lambda: {base: convert_digit_by_digit(number, base) for base in bases})
+            if loop != batch:
+                raise AssertionError(f"to_bases() and the digit loop disagree at {digits:,} digits")
+            loop_time = format_seconds(elapsed)
+        print(f"{digits:>10,}  {loop_time:>10}  {format_seconds(single_time):>10}  "
+              f"{format_seconds(batch_time):>10}")
+
+    print(f"\n- = skipped: over {DIGIT_LOOP_LIMIT:,} digits for the digit loop, "
+          f"over {DIVMOD_LIMIT:,} for divmod splitting")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="BASES.py - Number Base Conversion (Python port of BASES.BAS)",
+    )
+    parser.add_argument(
+        "input", nargs="?",
+        help="Convert every line of this file instead (- for standard input)",
+    )
+    parser.add_argument(
+        "--from", dest="source_base", type=int, default=10, metavar="BASE",
+        help="Base of the numbers in the file (default: 10)",
+    )
+    parser.add_argument(
+        "--to", dest="target_base", type=int, metavar="BASE",
+        help="Base to write them in (2-36)",
+    )
+    parser.add_argument(
+        "--precision", type=int,
+        help="Digits after the point (default: as many as the input's)",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-",
+        help="Write the converted numbers here (default: - for standard output)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="Worker processes for long input; 1 converts in this process (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--chunk-lines", type=int, default=CHUNK_LINES,
+        help=f"Lines per chunk sent to a worker (default: {CHUNK_LINES})",
+    )
+    parser.add_argument(
+        "--generate", type=int, metavar="LINES", default=0,
+        help="Instead, write LINES random numbers in the --from base",
+    )
+    parser.add_argument(
+        "--digits", type=int, default=20,
+        help="With --generate, up to this many digits each side of the point (default: 20)",
+    )
+    parser.add_argument(
+        "--benchmark", action="store_true",
+        help="Check and time the conversions on numbers of up to a million digits",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="Seed for the benchmark's or --generate's numbers (default: 0)",
+    )
+    args = parser.parse_args()
+    if not 2 <= args.source_base <= 36:
+        parser.error("--from must be from 2 to 36")
+    if args.input is not None:
+        if args.target_base is None:
+            parser.error("--to is needed to convert a file")
+        if not 2 <= args.target_base <= 36:
+            parser.error("--to must be from 2 to 36")
+    if args.workers < 1 or args.chunk_lines < 1 or args.digits < 1:
+        parser.error("--workers, --chunk-lines and --digits must be at least 1")
+    if args.precision is not None and args.precision < 0:
+        parser.error("--precision must not be negative")
+    return args
+
+
+def run_files(args: argparse.Namespace):
+    """--generate or convert a file, as the arguments say."""
+    output = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        if args.generate:
+            generate_numbers(args.generate, args.source_base, args.digits, args.seed, output)
+            return
+        source = sys.stdin if args.input == "-" else open(args.input, newline="")
+        with source:
+            run_stream(source, output, args)
+    except OSError as error:
+        sys.exit(f"BASES.py: error: {error}")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
 def wait_for_keypress():
     """Wait for any keypress to continue."""
     try:
@@ -75,6 +581,14 @@ def wait_for_keypress():
 
 
 def main():
+    args = parse_args()
+    if args.benchmark:
+        run_benchmark(args.seed)
+        return
+    if args.generate or args.input is not None:
+        run_files(args)
+        return
+
     print("=" * 45)
     print("  Number Base Conversion")
     print("=" * 45)
@@ -109,8 +623,10 @@ def main():
             print("\nPress any key to see next base...")
             print("-" * 45)
 
-            for current_base in range(target_base, 1, -1):
-                converted = convert_decimal_to_base(decimal_number, current_base)
+            all_bases = range(target_base, 1, -1)
+            converted_bases = to_bases(decimal_number, all_bases)
+            for current_base in all_bases:
+                converted = converted_bases[current_base]
                 print(f"Base {current_base:2}: {converted}")
 
                 if current_base > 2:
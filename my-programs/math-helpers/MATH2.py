@@ -9,9 +9,41 @@ Easter Eggs from original:
 - Original used cryptic "L:", "1:", "2:" prompts
 - Displayed "Pime" typo when unfactorable (should be "Prime")
 
+find_factor_pair() used to try every m and n up to |c|, about c² steps,
+so a constant of a million never came back. It now tests whether the
+discriminant b² - 4c is a perfect square, which is instant even for
+constants hundreds of digits long. The old search (and a search of the
+divisors of c up to √c, from math_kernel.py) are kept for the benchmark,
+which checks that all three give the same answers:
+
+  python MATH2.py               # factor interactively
+  python MATH2.py --benchmark   # timings from 2-digit to 1000-digit constants
+
 Press Ctrl+C to quit.
 """
 
+import argparse
+import time
+from math import isqrt
+
+import math_kernel
+from timing import format_seconds
+
+
+# Largest constants timed with the original c² search and the divisor
+# search; beyond them a single call takes minutes (the divisor search has
+# to factor c, which Pollard rho cannot do quickly for 50-digit factors)
+SCAN_LIMIT = 10 ** 5
+DIVISOR_LIMIT = 10 ** 42
+
+# Benchmark constants: c = m * (m + 2) for m with this many digits, so the
+# factor pair is the last divisor pair before √c. 3037000493 makes c
+# just under 2**63, the largest 64-bit integer.
+BENCHMARK_FACTORS = [10 ** 1 + 1, 10 ** 2 + 1, 10 ** 3 + 1, 10 ** 6 + 1,
+                     3037000493, 10 ** 20 + 1, 10 ** 50 + 1, 10 ** 500 + 1]
+# Keep calling a method until this much time has passed
+BENCHMARK_SECONDS = 0.2
+
 
 def find_factor_pair(middle_coef: int, constant: int) -> tuple[int, int] | None:
     """
@@ -22,11 +54,66 @@ def find_factor_pair(middle_coef: int, constant: int) -> tuple[int, int] | None:
     - m * n = c (constant term)
     - m + n = b (middle coefficient)
 
+    m and n are the roots of t² - bt + c, so they are whole numbers exactly
+    when the discriminant b² - 4c is a perfect square. One isqrt() answers
+    that for any size of c, where the original searched every m and n up
+    to |c|.
+
     Returns (m, n) if found, None if unfactorable.
     """
     if constant == 0:
         return None
 
+    discriminant = middle_coef * middle_coef - 4 * constant
+    if discriminant < 0:
+        return None
+    root = isqrt(discriminant)
+    if root * root != discriminant:
+        return None
+    # b² - 4c has the same parity as b², so b ± root is always even
+    return search_order(middle_coef, constant,
+                        (middle_coef - root) // 2, (middle_coef + root) // 2)
+
+
+def search_order(middle_coef: int, constant: int, smaller: int, larger: int) -> tuple[int, int]:
+    """
+    Put a factor pair in the order the original search found it.
+
+    The original counted the size of the first factor up from 1 in each
+    sign case, so it found the pair with the smaller first factor by
+    absolute value: (2, 3) for x² + 5x + 6, (-2, -3) for x² - 5x + 6,
+    (3, -2) for x² + x - 6 and (-3, 2) for x² - x - 6.
+    """
+    if (constant > 0) == (middle_coef > 0):
+        return (smaller, larger)
+    return (larger, smaller)
+
+
+def divisor_factor_pair(middle_coef: int, constant: int) -> tuple[int, int] | None:
+    """find_factor_pair() by trying each divisor of c up to √|c| (for the benchmark)."""
+    if constant == 0:
+        return None
+    size = abs(constant)
+    root = isqrt(size)
+    for divisor in math_kernel.divisors(size):
+        if divisor > root:
+            break
+        cofactor = size // divisor
+        if constant > 0:
+            pairs = ((divisor, cofactor), (-divisor, -cofactor))
+        else:
+            pairs = ((divisor, -cofactor), (-divisor, cofactor))
+        for first, second in pairs:
+            if first + second == middle_coef:
+                return search_order(middle_coef, constant, min(first, second), max(first, second))
+    return None
+
+
+def scan_factor_pair(middle_coef: int, constant: int) -> tuple[int, int] | None:
+    """The original search: every m and n from 1 to |c| in each sign case (for the benchmark)."""
+    if constant == 0:
+        return None
+
     # Determine the search range based on the sign of the constant
     if constant > 0:
         # Both factors have the same sign
@@ -68,7 +155,75 @@ def format_binomial(variable: str, constant: int) -> str:
         return f"({variable} - {abs(constant)})"
 
 
+def time_call(function, middle_coef: int, constant: int) -> float:
+    """Seconds per call of function(middle_coef, constant), with math_kernel's caches empty."""
+    calls = 0
+    started = time.perf_counter()
+    while True:
+        math_kernel.clear_caches()
+        function(middle_coef, constant)
+        calls += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= BENCHMARK_SECONDS:
+            return elapsed / calls
+
+
+def check_agreement():
+    """Compare the three methods on every small quadratic; raise if they differ."""
+    count = 0
+    for middle_coef in range(-100, 101):
+        for constant in range(-200, 201):
+            expected = divisor_factor_pair(middle_coef, constant)
+            if find_factor_pair(middle_coef, constant) != expected:
+                raise AssertionError(f"discriminant and divisor search disagree on "
+                                     f"b={middle_coef}, c={constant}")
+            if abs(middle_coef) <= 20 and abs(constant) <= 40:
+                if scan_factor_pair(middle_coef, constant) != expected:
+                    raise AssertionError(f"original search disagrees on "
+                                         f"b={middle_coef}, c={constant}")
+            count += 1
+    print(f"Same factor pairs, signs and order from all methods on {count:,} quadratics.\n")
+
+
+def run_benchmark():
+    """Time the three methods on ever larger constants."""
+    check_agreement()
+    print(f"{'digits in c':>11}  {'original c²':>12}  {'divisors √c':>12}  {'discriminant':>12}")
+    for factor in BENCHMARK_FACTORS:
+        constant = factor * (factor + 2)
+        middle_coef = 2 * factor + 2
+        times = []
+        for function, limit in ((scan_factor_pair, SCAN_LIMIT),
+                                (divisor_factor_pair, DIVISOR_LIMIT),
+                                (find_factor_pair, None)):
+            if limit is not None and constant > limit:
+                times.append("-")
+            else:
+                times.append(format_seconds(time_call(function, middle_coef, constant)))
+        bits = " (64-bit)" if constant.bit_length() == 63 else ""
+        print(f"{len(str(constant)):>11}  {times[0]:>12}  {times[1]:>12}  {times[2]:>12}{bits}")
+    print(f"\n- = skipped: over {SCAN_LIMIT:,} for the original search, "
+          f"over {DIVISOR_LIMIT:.0e} for the divisor search")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="MATH2.py - Simple Quadratic Factoring (Python port of MATH2.BAS)",
+    )
+    parser.add_argument(
+        "--benchmark", action="store_true",
+        help="Check the factoring methods agree, then time them from small to huge constants",
+    )
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+    if args.benchmark:
+        run_benchmark()
+        return
+
     print("=" * 45)
     print("  Simple Quadratic Factoring")
     print("  Factor x² + bx + c into (x + m)(x + n)")
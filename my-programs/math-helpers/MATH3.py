@@ -7,21 +7,111 @@ Purpose: Factor quadratics of the form ax² + bx + c into (px + m)(qx + n)
          where p * q = a (handles leading coefficients)
 
 This is the advanced version of MATH2.py that handles leading coefficients.
-The algorithm tries all factor pairs of 'a' to find valid factorizations.
+The original tried every factor pair of 'a' against every factor pair of
+'c', about a² · c² steps, so coefficients in the low thousands hung. One
+of its four sign cases also multiplied by a where it meant q, which made
+6x² - 5x + 1 "Prime", and it never factored a negative a.
+
+find_factorization() now works from the roots instead: ax² + bx + c
+factors over the integers exactly when b² - 4ac is a perfect square, each
+root -m/p in lowest terms gives a factor (px + m), and the gcd content
+left over (4x² + 8x + 4 is 4 times (x + 1)²) goes into the second factor.
+That is a handful of big-integer operations for any size of coefficient.
+
+  python MATH3.py               # factor interactively
+  python MATH3.py --verify      # check against brute force and random products
+  python MATH3.py --benchmark   # timings from 1-digit to 1000-digit coefficients
 
 Press Ctrl+C to quit.
 """
 
+import argparse
+import random
+import time
+from math import gcd, isqrt
+
+import math_kernel
+from timing import format_seconds
+
+
+# --verify: every a, b, c with |a| <= VERIFY_LEADING and |b|, |c| <= VERIFY_RANGE
+# against brute force, then VERIFY_PRODUCTS random (px + m)(qx + n) with
+# up to VERIFY_DIGITS digits per number
+VERIFY_LEADING = 12
+VERIFY_RANGE = 30
+VERIFY_PRODUCTS = 20000
+VERIFY_DIGITS = 40
+
+# Largest a and c in each benchmark row (2**63 - 1 is the largest 64-bit
+# integer); the original search only runs up to SCAN_LIMIT
+BENCHMARK_SIZES = [10, 30, 100, 1000, 10 ** 6, 2 ** 63 - 1, 10 ** 50, 10 ** 100, 10 ** 1000]
+SCAN_LIMIT = 1000
+# Keep calling a method until this much time has passed
+BENCHMARK_SECONDS = 0.2
+
 
 def find_factorization(leading_coef: int, middle_coef: int, constant: int) -> tuple[int, int, int, int] | None:
     """
     Find a factorization for ax² + bx + c.
 
-    Searches for p, q, m, n such that:
+    Finds p, q, m, n such that:
     - p * q = a (factor pairs of leading coefficient)
     - m * n = c (factor pairs of constant)
     - p*n + q*m = b (cross multiplication gives middle term)
 
+    p is positive and no larger than |q|, and (px + m) has no common factor;
+    any that ax² + bx + c has is part of (qx + n).
+
+    Returns (p, m, q, n) for (px + m)(qx + n) if found, None if unfactorable.
+    """
+    if leading_coef == 0 or constant == 0:
+        return None
+
+    discriminant = middle_coef * middle_coef - 4 * leading_coef * constant
+    if discriminant < 0:
+        return None
+    root = isqrt(discriminant)
+    if root * root != discriminant:
+        return None
+
+    # The roots are -(b ± root) / 2a, so the factors are (2ax + b ± root),
+    # each divided by its own gcd and turned to a positive x coefficient
+    factors = []
+    for numerator in (middle_coef - root, middle_coef + root):
+        common = gcd(2 * leading_coef, numerator)
+        x_coef, const = 2 * leading_coef // common, numerator // common
+        if x_coef < 0:
+            x_coef, const = -x_coef, -const
+        factors.append((x_coef, const))
+    (first_var_coef, first_const), (second_var_coef, second_const) = sorted(factors)
+
+    # Gauss's lemma: the two primitive factors multiply to ax² + bx + c
+    # divided by its content, which carries the sign of a
+    content = leading_coef // (first_var_coef * second_var_coef)
+    return (first_var_coef, first_const, content * second_var_coef, content * second_const)
+
+
+def divisors(number: int) -> list[int]:
+    """Every divisor of number, positive and negative (cached in math_kernel)."""
+    positive = math_kernel.divisors(number)
+    return [*positive, *(-d for d in positive)]
+
+
+def brute_force_factorable(leading_coef: int, middle_coef: int, constant: int) -> bool:
+    """Whether any divisors p of a and m of c give p*n + q*m = b (for --verify)."""
+    for first_var_coef in divisors(leading_coef):
+        second_var_coef = leading_coef // first_var_coef
+        for first_const in divisors(constant):
+            if first_var_coef * (constant // first_const) + second_var_coef * first_const == middle_coef:
+                return True
+    return False
+
+
+def scan_factorization(leading_coef: int, middle_coef: int, constant: int) -> tuple[int, int, int, int] | None:
+    """
+    The original search, kept for the benchmark: every factor pair of a
+    against every factor pair of c, in four sign cases.
+
     Returns (p, m, q, n) for (px + m)(qx + n) if found, None if unfactorable.
     """
     if leading_coef == 0 or constant == 0:
@@ -78,9 +168,11 @@ def find_factorization(leading_coef: int, middle_coef: int, constant: int) -> tu
 
 
 def format_binomial_with_coefficient(var_coef: int, variable: str, constant: int) -> str:
-    """Format a binomial factor like (2x + 3) or (x - 2)."""
+    """Format a binomial factor like (2x + 3), (x - 2) or (-x + 1)."""
     if var_coef == 1:
         var_part = variable
+    elif var_coef == -1:
+        var_part = f"-{variable}"
     else:
         var_part = f"{var_coef}{variable}"
 
@@ -97,6 +189,8 @@ def format_quadratic(variable: str, leading: int, middle: int, constant: int) ->
     # Leading term
     if leading == 1:
         result = f"{variable}²"
+    elif leading == -1:
+        result = f"-{variable}²"
     else:
         result = f"{leading}{variable}²"
 
@@ -115,7 +209,128 @@ def format_quadratic(variable: str, leading: int, middle: int, constant: int) ->
     return result
 
 
+def expands_to(factors: tuple[int, int, int, int], leading_coef: int, middle_coef: int,
+               constant: int) -> bool:
+    """Whether (px + m)(qx + n) multiplies out to ax² + bx + c."""
+    first_var_coef, first_const, second_var_coef, second_const = factors
+    return (first_var_coef * second_var_coef == leading_coef
+            and first_const * second_const == constant
+            and first_var_coef * second_const + second_var_coef * first_const == middle_coef)
+
+
+def run_verify(seed: int):
+    """Check find_factorization() against brute force and random products; raise on a mismatch."""
+    count = 0
+    for leading_coef in range(-VERIFY_LEADING, VERIFY_LEADING + 1):
+        for middle_coef in range(-VERIFY_RANGE, VERIFY_RANGE + 1):
+            for constant in range(-VERIFY_RANGE, VERIFY_RANGE + 1):
+                if leading_coef == 0 or constant == 0:
+                    continue
+                result = find_factorization(leading_coef, middle_coef, constant)
+                factorable = brute_force_factorable(leading_coef, middle_coef, constant)
+                if (result is not None) != factorable or (
+                        result and not expands_to(result, leading_coef, middle_coef, constant)):
+                    raise AssertionError(f"wrong answer {result} for "
+                                         f"{format_quadratic('x', leading_coef, middle_coef, constant)}")
+                count += 1
+    print(f"Agrees with brute force on all {count:,} quadratics with |a| <= {VERIFY_LEADING} "
+          f"and |b|, |c| <= {VERIFY_RANGE}.")
+
+    # Multiply out random factors, then factor the product again
+    rng = random.Random(seed)
+    for _ in range(VERIFY_PRODUCTS):
+        first_var_coef, first_const, second_var_coef, second_const = (
+            rng.choice((-1, 1)) * rng.randrange(1, 10 ** rng.randint(1, VERIFY_DIGITS))
+            for _ in range(4))
+        leading_coef = first_var_coef * second_var_coef
+        middle_coef = first_var_coef * second_const + second_var_coef * first_const
+        constant = first_const * second_const
+        result = find_factorization(leading_coef, middle_coef, constant)
+        if result is None or not expands_to(result, leading_coef, middle_coef, constant):
+            raise AssertionError(f"wrong answer {result} for ({first_var_coef}x + {first_const})"
+                                 f"({second_var_coef}x + {second_const})")
+        if result[0] <= 0 or result[0] > abs(result[2]) or gcd(result[0], result[1]) != 1:
+            raise AssertionError(f"{result} is not in the documented form")
+    print(f"Factored {VERIFY_PRODUCTS:,} random products with up to {VERIFY_DIGITS} digits "
+          f"per number back correctly (seed {seed}).")
+
+
+def time_call(function, *coefficients: int) -> float:
+    """Seconds per call of function(*coefficients)."""
+    calls = 0
+    started = time.perf_counter()
+    while True:
+        function(*coefficients)
+        calls += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= BENCHMARK_SECONDS:
+            return elapsed / calls
+
+
+def size_label(size: int) -> str:
+    """A benchmark size like 1,000, 2**63 - 1 or 10**50."""
+    if size == 2 ** 63 - 1:
+        return "2**63 - 1"
+    if size < 10 ** 7:
+        return f"{size:,}"
+    return f"10**{len(str(size)) - 1}"
+
+
+def run_benchmark(seed: int):
+    """Time the original search and the discriminant method on ever larger coefficients."""
+    rng = random.Random(seed)
+    print(f"{'':>12}  {'original search':^23}  {'discriminant':^23}")
+    print(f"{'a, c up to':>12}  {'factorable':>11} {'prime':>11}  {'factorable':>11} {'prime':>11}")
+    for size in BENCHMARK_SIZES:
+        # (px + m)(qx + n) with p, q, m and n between √size / 2 and √size
+        high = isqrt(size)
+        first_var_coef, first_const, second_var_coef, second_const = (
+            rng.randint(high // 2 + 1, high) for _ in range(4))
+        leading_coef = first_var_coef * second_var_coef
+        middle_coef = first_var_coef * second_const + second_var_coef * first_const
+        constant = first_const * second_const
+
+        times = []
+        for function in (scan_factorization, find_factorization):
+            if function is scan_factorization and max(leading_coef, constant) > SCAN_LIMIT:
+                times += ["-", "-"]
+                continue
+            # One more in the middle term makes b² - 4ac a non-square
+            for middle in (middle_coef, middle_coef + 1):
+                times.append(format_seconds(time_call(function, leading_coef, middle, constant)))
+        print(f"{size_label(size):>12}  {times[0]:>11} {times[1]:>11}  {times[2]:>11} {times[3]:>11}")
+    print(f"\n- = skipped: the original search only runs up to a, c = {SCAN_LIMIT:,}")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="MATH3.py - Advanced Quadratic Factoring (Python port of MATH3.BAS)",
+    )
+    parser.add_argument(
+        "--verify", action="store_true",
+        help="Check the factoring against brute force and random products, then exit",
+    )
+    parser.add_argument(
+        "--benchmark", action="store_true",
+        help="Time the original search and the discriminant method from small to huge coefficients",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="Seed for the random quadratics of --verify and --benchmark (default: 0)",
+    )
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+    if args.verify or args.benchmark:
+        if args.verify:
+            run_verify(args.seed)
+        if args.benchmark:
+            run_benchmark(args.seed)
+        return
+
     print("=" * 50)
     print("  Advanced Quadratic Factoring")
     print("  Factor ax² + bx + c into (px + m)(qx + n)")
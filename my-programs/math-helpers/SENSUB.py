@@ -11,13 +11,90 @@ Easter Eggs from original:
 Synthetic division is a shortcut method for dividing a polynomial by a
 linear factor (x - c). This program displays the traditional table format.
 
+The original left it to the user to guess c. With --roots the program
+finds every rational root itself. By the rational root theorem each one
+is ±p/q with p dividing the constant term and q the leading coefficient,
+but listing those means factoring both, which can take minutes for
+numbers of 30 digits or so. Instead the real roots are first estimated
+numerically (NumPy's companion-matrix eigenvalues) and sharpened with
+Newton's method in exact integer arithmetic, until only one fraction
+with a denominator that divides the leading coefficient is close
+enough; that one is checked exactly. The polynomial is then deflated by
+each root with perform_synthetic_division() for as long as the
+remainder stays 0, which also gives each root's multiplicity.
+
+Without NumPy every candidate ±p/q is evaluated together in one Horner
+pass, first modulo two large primes to throw out almost all of them
+cheaply and then exactly for the few that are left; that search is
+skipped when the coefficients are too big to factor quickly.
+evaluate_many() is the same Horner pass for any list of points:
+
+  python SENSUB.py               # divide by (x - c) for a c you choose
+  python SENSUB.py --long        # divide by any polynomial (polynomial.py)
+  python SENSUB.py --roots       # find the rational roots, with the tables
+  python SENSUB.py --benchmark   # degree-100 polynomials, thousands of candidates
+
 Press Ctrl+C to quit.
 """
 
-
-def get_polynomial_coefficients(highest_degree: int) -> list[float]:
+import argparse
+import itertools
+import random
+from fractions import Fraction
+from math import gcd, lcm
+from typing import NamedTuple
+
+import math_kernel
+import polynomial
+from timing import format_seconds, timed
+
+
+# Primes below 2**30, so that two products of residues add up within int64
+# in NumPy; a candidate is only checked exactly if the polynomial is 0
+# modulo both
+RESIDUE_PRIMES = (1073741789, 1073741783)
+
+# Eigenvalues this close to the real axis, relative to their size, are
+# taken as estimates of real roots (a multiple root comes out as a small
+# ring of eigenvalues around it), and Newton steps allowed per estimate
+REAL_TOLERANCE = 0.05
+NEWTON_STEPS = 100
+# Listing every ±p/q means factoring the constant and leading coefficients;
+# past this many digits that can take minutes, so the search is skipped
+FACTOR_DIGITS = 20
+
+# Benchmark polynomials: their degree, the rational roots planted in them,
+# and the constant and leading coefficients of the rest, chosen to have
+# plenty of divisors and so plenty of candidates
+BENCHMARK_DEGREE = 100
+BENCHMARK_ROOTS = [Fraction(2, 3), Fraction(-5), Fraction(7, 2), Fraction(1), Fraction(1),
+                   Fraction(1), Fraction(-1, 4), Fraction(9, 8), Fraction(-3, 5)]
+BENCHMARK_CONSTANT = 2 ** 4 * 3 ** 3 * 5 * 7 * 11 * 13
+BENCHMARK_LEADING = 2 ** 3 * 3 ** 2 * 5
+BENCHMARK_POINTS = 100_000
+# (x - p)(x - q) with p and q primes of this many digits: pq is hopeless to factor
+BENCHMARK_PRIME_DIGITS = 20
+
+
+class RootSearch(NamedTuple):
+    """What find_rational_roots() found."""
+
+    # Every rational root, repeated by its multiplicity, in increasing order
+    roots: list
+    # Whole-number coefficients of what is left once they are divided out
+    remaining: list
+    # Real root estimates refined, or candidates ±p/q from the rational
+    # root theorem, and how many fractions were checked exactly
+    candidates: int
+    checked: int
+    # "numeric", "candidates", or "skipped" when neither could be done
+    method: str = "numeric"
+
+
+def get_polynomial_coefficients(highest_degree: int, parse=float) -> list[float]:
     """
-    Get polynomial coefficients from user, from highest degree to constant.
+    Get polynomial coefficients from user, from highest degree to constant,
+    each typed-in value read with parse.
 
     For a polynomial like 2x³ + 3x² - x + 5, the user enters:
     - Coefficient for x³: 2
@@ -37,36 +114,50 @@ def get_polynomial_coefficients(highest_degree: int) -> list[float]:
         else:
             prompt = f"  Coefficient for x^{power}: "
 
-        coefficient = float(input(prompt))
+        coefficient = parse(input(prompt))
         coefficients.append(coefficient)
 
     return coefficients
 
 
-def perform_synthetic_division(coefficients: list[float], divisor: float) -> list[float]:
+def synthetic_division_rows(coefficients: list[float], divisor: float) -> tuple[list, list]:
     """
-    Perform synthetic division and return the result coefficients.
-
-    The result has one less degree than the input polynomial.
-    The last value is the remainder.
+    The carry row and the result row of synthetic division, worked out once
+    for both perform_synthetic_division() and the table.
     """
     result = [0.0] * len(coefficients)
+    carries = [0.0] * len(coefficients)
     result[0] = coefficients[0]  # Bring down first coefficient
 
     for i in range(1, len(coefficients)):
-        carry_value = result[i - 1] * divisor
-        result[i] = carry_value + coefficients[i]
+        carries[i] = result[i - 1] * divisor
+        result[i] = carries[i] + coefficients[i]
 
-    return result
+    return carries, result
+
+
+def perform_synthetic_division(coefficients: list[float], divisor: float) -> list[float]:
+    """
+    Perform synthetic division and return the result coefficients.
+
+    The result has one less degree than the input polynomial.
+    The last value is the remainder.
+    """
+    return synthetic_division_rows(coefficients, divisor)[1]
 
 
 def display_synthetic_division_table(coefficients: list[float], divisor: float):
-    """Display the synthetic division in traditional table format."""
-    result_row = [0.0] * len(coefficients)
-    carry_row = [0.0] * len(coefficients)
+    """
+    Display the synthetic division in traditional table format.
+
+    Whole-number and Fraction coefficients and divisors are shown exactly,
+    fractions as p/q.
+    """
+    carry_row, result_row = synthetic_division_rows(coefficients, divisor)
 
     # Calculate spacing - need to accommodate all numbers
-    column_width = 10
+    cells = [format_number(value) for value in coefficients + carry_row[1:] + result_row]
+    column_width = max(10, max(len(cell) for cell in cells) + 2)
 
     # Print header
     print()
@@ -74,36 +165,29 @@ def display_synthetic_division_table(coefficients: list[float], divisor: float):
     print()
 
     # Print divisor and original coefficients
-    divisor_label = f"{divisor:g}]"
-    print(f"{divisor_label:>6}", end="")
+    divisor_label = f"{format_number(divisor)}]"
+    label_width = max(6, len(divisor_label))
+    print(f"{divisor_label:>{label_width}}", end="")
     for coef in coefficients:
-        print(f"{coef:>{column_width}g}", end="")
+        print(f"{format_number(coef):>{column_width}}", end="")
     print()
 
-    # Bring down first coefficient
-    result_row[0] = coefficients[0]
-
-    # Calculate carries and results
-    for i in range(1, len(coefficients)):
-        carry_row[i] = result_row[i - 1] * divisor
-        result_row[i] = carry_row[i] + coefficients[i]
-
     # Print the carry row (values being added)
-    print(" " * 6, end="")  # Space for divisor
+    print(" " * label_width, end="")  # Space for divisor
     for i, carry in enumerate(carry_row):
         if i == 0:
             print(" " * column_width, end="")  # No carry for first column
         else:
-            print(f"{carry:>{column_width}g}", end="")
+            print(f"{format_number(carry):>{column_width}}", end="")
     print()
 
     # Print divider line
-    print("-" * (6 + column_width * len(coefficients)))
+    print("-" * (label_width + column_width * len(coefficients)))
 
     # Print result row
-    print(" " * 6, end="")
+    print(" " * label_width, end="")
     for value in result_row:
-        print(f"{value:>{column_width}g}", end="")
+        print(f"{format_number(value):>{column_width}}", end="")
     print()
 
     # Show interpretation
@@ -114,24 +198,38 @@ def display_synthetic_division_table(coefficients: list[float], divisor: float):
         for i, coef in enumerate(result_row[:-1]):
             power = quotient_degree - i
             if power == 0:
-                quotient_terms.append(f"{coef:g}")
+                quotient_terms.append(format_number(coef))
             elif power == 1:
-                quotient_terms.append(f"{coef:g}x")
+                quotient_terms.append(format_coefficient(coef, "x"))
             else:
-                quotient_terms.append(f"{coef:g}x^{power}")
+                quotient_terms.append(format_coefficient(coef, f"x^{power}"))
 
         quotient_str = " + ".join(quotient_terms).replace("+ -", "- ")
         remainder = result_row[-1]
 
         print(f"Quotient:  {quotient_str}")
-        print(f"Remainder: {remainder:g}")
+        print(f"Remainder: {format_number(remainder)}")
 
         if remainder == 0:
-            print(f"\nSince remainder is 0, (x - {divisor:g}) is a factor!")
+            print(f"\nSince remainder is 0, (x - {format_number(divisor)}) is a factor!")
 
     return result_row
 
 
+def format_number(value) -> str:
+    """A coefficient for display: floats like 2.5, whole numbers and fractions like 1/3 exactly."""
+    if isinstance(value, (int, Fraction)):
+        return str(value)
+    return f"{value:g}"
+
+
+def format_coefficient(value, variable: str) -> str:
+    """value times variable, with fractions in brackets: 3x, (1/3)x, -(2/5)x."""
+    if isinstance(value, Fraction) and value.denominator != 1:
+        return f"({value}){variable}" if value > 0 else f"-({-value}){variable}"
+    return f"{format_number(value)}{variable}"
+
+
 def format_polynomial(coefficients: list[float], variable: str = "x") -> str:
     """Format a polynomial for display."""
     degree = len(coefficients) - 1
@@ -143,27 +241,544 @@ def format_polynomial(coefficients: list[float], variable: str = "x") -> str:
             continue
 
         if power == 0:
-            terms.append(f"{coef:g}")
+            terms.append(format_number(coef))
         elif power == 1:
             if coef == 1:
                 terms.append(variable)
             elif coef == -1:
                 terms.append(f"-{variable}")
             else:
-                terms.append(f"{coef:g}{variable}")
+                terms.append(format_coefficient(coef, variable))
         else:
             if coef == 1:
                 terms.append(f"{variable}^{power}")
             elif coef == -1:
                 terms.append(f"-{variable}^{power}")
             else:
-                terms.append(f"{coef:g}{variable}^{power}")
+                terms.append(format_coefficient(coef, f"{variable}^{power}"))
 
     result = " + ".join(terms).replace("+ -", "- ")
     return result if result else "0"
 
 
+def display_long_division_table(dividend: list, divisor: list) -> tuple[list, list]:
+    """
+    Display long division by any polynomial as a table, one column per
+    power, from the working polynomial.long_division() kept. Returns
+    (quotient, remainder).
+    """
+    division = polynomial.long_division(dividend, divisor)
+    column_width = 10
+    label_width = 12
+    degree = len(dividend) - 1
+    quotient_degree = len(division.quotient) - 1
+
+    def row(label: str, values: list, start: int) -> str:
+        cells = " " * (column_width * start) + "".join(f"{format_number(value):>{column_width}}"
+                                                       for value in values)
+        return f"{label:<{label_width}}{cells}"
+
+    print()
+    print("Long Division Table:")
+    print()
+    powers = [("1" if power == 0 else "x" if power == 1 else f"x^{power}")
+              for power in range(degree, -1, -1)]
+    print(" " * label_width + "".join(f"{power:>{column_width}}" for power in powers))
+    print(row("Dividend", dividend, 0))
+    for step, (coef, subtracted) in enumerate(division.steps):
+        if coef:
+            term = format_polynomial([coef] + [0] * (quotient_degree - step))
+            print(row(f"- ({term})·D", subtracted, step))
+    print("-" * (label_width + column_width * len(dividend)))
+    remainder = division.remainder
+    print(row("Remainder", remainder, len(dividend) - len(remainder)))
+
+    print()
+    print(f"D = {format_polynomial(divisor)}")
+    print(f"Quotient:  {format_polynomial(division.quotient)}")
+    print(f"Remainder: {format_polynomial(remainder)}")
+    if remainder == [0]:
+        print(f"\nSince remainder is 0, ({format_polynomial(divisor)}) is a factor!")
+    return division.quotient, remainder
+
+
+def get_exact_coefficients(highest_degree: int) -> list:
+    """
+    get_polynomial_coefficients(), but each value exactly as typed ("0.1",
+    "1e-9" or "2/3"), as a whole number or a Fraction, so that division and
+    root finding are exact.
+    """
+    exact = get_polynomial_coefficients(highest_degree, lambda text: Fraction(text.strip()))
+    return [int(coef) if coef.denominator == 1 else coef for coef in exact]
+
+
+def integer_coefficients(coefficients) -> list[int]:
+    """
+    The same polynomial with whole-number coefficients: fractions cleared,
+    common factor divided out and the leading coefficient positive.
+    """
+    coefficients = [Fraction(coef) for coef in coefficients]
+    scale = lcm(*(coef.denominator for coef in coefficients))
+    whole = [coef.numerator * (scale // coef.denominator) for coef in coefficients]
+    content = gcd(*whole) or 1
+    if whole[0] < 0:
+        content = -content
+    return [coef // content for coef in whole]
+
+
+def root_bound(coefficients: list[int]) -> Fraction:
+    """Cauchy's bound: every root x has |x| < 1 + max |aᵢ / aₙ|."""
+    return 1 + Fraction(max(abs(coef) for coef in coefficients[1:]), abs(coefficients[0]))
+
+
+def rational_root_candidates(coefficients: list[int]) -> list[tuple[int, int]]:
+    """
+    Every ±p/q in lowest terms, as (±p, q), with p dividing the constant
+    term and q the leading coefficient, inside root_bound(). The constant
+    must not be 0.
+    """
+    bound = root_bound(coefficients)
+    constant_divisors = math_kernel.divisors(coefficients[-1])
+    positive = []
+    for denominator in math_kernel.divisors(coefficients[0]):
+        # p/q < bound for every p up to this
+        largest = (bound.numerator * denominator - 1) // bound.denominator
+        positive += [(numerator, denominator) for numerator in constant_divisors
+                     if numerator <= largest and gcd(numerator, denominator) == 1]
+    return positive + [(-numerator, denominator) for numerator, denominator in positive]
+
+
+def homogeneous_horner(coefficients: list[int], numerators: list, denominators: list,
+                       modulus: int | None = None) -> list:
+    """
+    qⁿ·P(p/q) for every p/q at once, by Horner's rule with powers of q,
+    which keeps everything a whole number; modulo modulus if one is given.
+    Uses NumPy when there is a modulus and NumPy is installed.
+    """
+    if modulus is not None:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None:
+            # Residues below 2**30: p·value + coef·power fits in int64
+            p = np.array([numerator % modulus for numerator in numerators], dtype=np.int64)
+            q = np.array([denominator % modulus for denominator in denominators], dtype=np.int64)
+            power = np.ones_like(q)
+            value = np.full_like(p, coefficients[0] % modulus)
+            for coef in coefficients[1:]:
+                power = power * q % modulus
+                value = (value * p + coef % modulus * power) % modulus
+            return value.tolist()
+        numerators = [numerator % modulus for numerator in numerators]
+        denominators = [denominator % modulus for denominator in denominators]
+
+    powers = [1] * len(numerators)
+    values = [coefficients[0]] * len(numerators)
+    for coef in coefficients[1:]:
+        powers = [power * q for power, q in zip(powers, denominators)]
+        values = [value * p + coef * power for value, p, power in zip(values, numerators, powers)]
+        if modulus is not None:
+            powers = [power % modulus for power in powers]
+            values = [value % modulus for value in values]
+    return values
+
+
+def evaluate_many(coefficients, points) -> list:
+    """
+    The polynomial at every point, in one Horner pass over all of them.
+
+    With whole-number or Fraction coefficients and points the answers are
+    exact Fractions; otherwise floats, worked out by NumPy if it is there.
+    """
+    exact = (int, Fraction)
+    if all(isinstance(coef, exact) for coef in coefficients) and \
+            all(isinstance(point, exact) for point in points):
+        scale = lcm(*(Fraction(coef).denominator for coef in coefficients))
+        whole = [int(coef * scale) for coef in coefficients]
+        points = [Fraction(point) for point in points]
+        values = homogeneous_horner(whole, [point.numerator for point in points],
+                                    [point.denominator for point in points])
+        degree = len(coefficients) - 1
+        return [Fraction(value, point.denominator ** degree * scale)
+                for value, point in zip(values, points)]
+
+    try:
+        import numpy as np
+    except ImportError:
+        values = [0.0] * len(points)
+        for coef in coefficients:
+            values = [value * point + coef for value, point in zip(values, points)]
+        return values
+    points = np.asarray(points, dtype=float)
+    values = np.zeros_like(points)
+    for coef in coefficients:
+        values = values * points + coef
+    return values.tolist()
+
+
+def real_root_estimates(coefficients: list[int]) -> list[float] | None:
+    """
+    Estimates of the real roots: the real parts of the eigenvalues
+    numpy.roots() finds near the real axis. None without NumPy, or when
+    the coefficients are too far apart in size for floats.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    # Floats stop at about 2**1024
+    shift = max(0, max(abs(coef).bit_length() for coef in coefficients) - 1000)
+    floats = [float(Fraction(coef, 1 << shift)) for coef in coefficients]
+    if not floats[0]:
+        return None
+    estimates = {float(root.real) for root in np.roots(floats)
+                 if np.isfinite(root) and abs(root.imag) <= REAL_TOLERANCE * (1 + abs(root))}
+    return sorted(estimates)
+
+
+def refine_root(coefficients: list[int], estimate: float, bits: int) -> Fraction | None:
+    """
+    Sharpen a root estimate to about bits binary places by Newton's method
+    on P/P', whose roots are all simple, so it converges quickly even to
+    a multiple root. x is kept as X / 2**k and every step is worked out in
+    whole numbers with homogeneous_horner(); k doubles as it converges.
+    """
+    degree = len(coefficients) - 1
+    derivative = [coef * (degree - index) for index, coef in enumerate(coefficients[:-1])]
+    second = [coef * (degree - 1 - index) for index, coef in enumerate(derivative[:-1])] or [0]
+    scale = 64
+    value = round(Fraction(estimate) * (1 << scale))
+    for _ in range(NEWTON_STEPS):
+        point = ([value], [1 << scale])
+        # qⁿP, qⁿ⁻¹P' and qⁿ⁻²P'' at value / q, with q = 2**scale
+        at_value = homogeneous_horner(coefficients, *point)[0]
+        if at_value == 0:
+            break
+        slope = homogeneous_horner(derivative, *point)[0]
+        bend = homogeneous_horner(second, *point)[0]
+        # x - PP' / (P'² - PP''), in units of 1 / q
+        numerator = at_value * slope
+        denominator = slope * slope - at_value * bend
+        if denominator == 0:
+            return None
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        step = (2 * numerator + denominator) // (2 * denominator)
+        value -= step
+        if scale < bits and abs(step) < 1 << (scale // 2):
+            value <<= min(2 * scale, bits) - scale
+            scale = min(2 * scale, bits)
+        elif scale >= bits and abs(step) <= 1:
+            break
+    return Fraction(value, 1 << scale)
+
+
+def numeric_candidates(coefficients: list[int]) -> tuple[list, int] | None:
+    """
+    The fractions ±p/q that real_root_estimates() and refine_root() point
+    to, with q dividing the leading coefficient and p the constant, and
+    how many estimates there were; None without NumPy.
+
+    Two fractions with denominators up to |aₙ| are at least 1/aₙ² apart,
+    so once an estimate is within half that of a rational root, the root
+    is the closest such fraction and limit_denominator() finds it.
+    """
+    estimates = real_root_estimates(coefficients)
+    if estimates is None:
+        return None
+    leading, constant = coefficients[0], coefficients[-1]
+    bits = 2 * abs(leading).bit_length() + 8
+    candidates = set()
+    for estimate in estimates:
+        refined = refine_root(coefficients, estimate, bits)
+        if refined is None:
+            continue
+        candidate = refined.limit_denominator(abs(leading))
+        if candidate and leading % candidate.denominator == 0 and constant % candidate.numerator == 0:
+            candidates.add(candidate)
+    return sorted(candidates), len(estimates)
+
+
+def deflate(remaining: list[int], found: list, roots: list) -> list[int]:
+    """
+    Divide each root in found out of remaining for as long as the remainder
+    is 0, adding it to roots each time; returns what is left.
+    """
+    for root in found:
+        while len(remaining) > 1:
+            *quotient, remainder = perform_synthetic_division([Fraction(coef) for coef in remaining], root)
+            if remainder != 0:
+                break
+            roots.append(root)
+            remaining = integer_coefficients(quotient)
+    return remaining
+
+
+def find_rational_roots(coefficients, numeric: bool = True) -> RootSearch:
+    """
+    Every rational root of the polynomial, with its multiplicity.
+
+    The fractions numeric_candidates() points to are checked exactly, and
+    the polynomial is deflated by each root found. That repeats on what is
+    left until a round finds nothing new, since roots that were crowded
+    together stand apart once their neighbors are divided out.
+
+    Without NumPy, or with numeric=False, every candidate from the rational
+    root theorem is run through homogeneous_horner() modulo each of
+    RESIDUE_PRIMES instead, and only those that give 0 every time are
+    checked exactly. Every root of the deflated polynomial was a root all
+    along, so one pass over the candidates finds them all. If the constant
+    or leading coefficient is over FACTOR_DIGITS digits, the search is
+    skipped.
+    """
+    remaining = integer_coefficients(coefficients)
+    roots = []
+    while len(remaining) > 1 and remaining[-1] == 0:
+        roots.append(Fraction(0))
+        remaining.pop()
+    if len(remaining) < 2:
+        return RootSearch(roots, remaining, 0, 0)
+
+    estimates = checked = 0
+    while numeric and len(remaining) > 1:
+        result = numeric_candidates(remaining)
+        if result is None:
+            break
+        candidates, count = result
+        estimates += count
+        checked += len(candidates)
+        values = homogeneous_horner(remaining, [candidate.numerator for candidate in candidates],
+                                    [candidate.denominator for candidate in candidates])
+        found = [candidate for candidate, value in zip(candidates, values) if value == 0]
+        remaining = deflate(remaining, found, roots)
+        if not found:
+            return RootSearch(sorted(roots), remaining, estimates, checked)
+    if len(remaining) < 2:
+        return RootSearch(sorted(roots), remaining, estimates, checked)
+
+    if max(len(str(abs(remaining[0]))), len(str(abs(remaining[-1])))) > FACTOR_DIGITS:
+        return RootSearch(sorted(roots), remaining, 0, 0, "skipped")
+    candidates = rational_root_candidates(remaining)
+    numerators = [numerator for numerator, _ in candidates]
+    denominators = [denominator for _, denominator in candidates]
+    survivors = list(range(len(candidates)))
+    for prime in RESIDUE_PRIMES:
+        residues = homogeneous_horner(remaining, [numerators[i] for i in survivors],
+                                      [denominators[i] for i in survivors], prime)
+        survivors = [index for index, residue in zip(survivors, residues) if residue == 0]
+    values = homogeneous_horner(remaining, [numerators[i] for i in survivors],
+                                [denominators[i] for i in survivors])
+    found = [Fraction(*candidates[index]) for index, value in zip(survivors, values) if value == 0]
+    remaining = deflate(remaining, found, roots)
+    return RootSearch(sorted(roots), remaining, len(candidates), len(survivors), "candidates")
+
+
+def find_rational_roots_by_hand(coefficients) -> list[Fraction]:
+    """
+    find_rational_roots()'s roots the way the original program had them
+    found: one synthetic division per candidate (for --benchmark).
+    """
+    remaining = integer_coefficients(coefficients)
+    roots = []
+    while len(remaining) > 1 and remaining[-1] == 0:
+        roots.append(Fraction(0))
+        remaining.pop()
+    if len(remaining) < 2:
+        return roots
+    for candidate in rational_root_candidates(remaining):
+        candidate = Fraction(*candidate)
+        while len(remaining) > 1:
+            *quotient, remainder = perform_synthetic_division([Fraction(coef) for coef in remaining],
+                                                              candidate)
+            if remainder != 0:
+                break
+            roots.append(candidate)
+            remaining = integer_coefficients(quotient)
+    return sorted(roots)
+
+
+def benchmark_polynomial(rng: random.Random) -> list[int]:
+    """A degree-BENCHMARK_DEGREE polynomial with BENCHMARK_ROOTS among its roots."""
+    rest_degree = BENCHMARK_DEGREE - len(BENCHMARK_ROOTS)
+    product = ([BENCHMARK_LEADING] + [rng.randint(-1000, 1000) for _ in range(rest_degree - 1)]
+                  + [BENCHMARK_CONSTANT])
+    for root in BENCHMARK_ROOTS:
+        product = polynomial.multiply(product, [root.denominator, -root.numerator])
+    return product
+
+
+def run_benchmark(seed: int):
+    """Time the root search and bulk evaluation on degree-100 polynomials."""
+    rng = random.Random(seed)
+    coefficients = benchmark_polynomial(rng)
+
+    def search_from_scratch(numeric: bool):
+        math_kernel.clear_caches()
+        return find_rational_roots(coefficients, numeric)
+
+    # Best of three, so that importing NumPy is not counted
+    search, search_time = min((timed(search_from_scratch, True) for _ in range(3)),
+                              key=lambda result: result[1])
+    every, every_time = min((timed(search_from_scratch, False) for _ in range(3)),
+                            key=lambda result: result[1])
+    by_hand, by_hand_time = timed(find_rational_roots_by_hand, coefficients)
+    planted = sorted(BENCHMARK_ROOTS)
+    if search.roots != by_hand or every.roots != by_hand or \
+            any(root not in search.roots for root in planted):
+        raise AssertionError(f"root searches disagree: {search.roots}, {every.roots} and {by_hand}")
+    if any(value != 0 for value in evaluate_many(coefficients, search.roots)):
+        raise AssertionError("a root found is not a root")
+
+    digits = max(len(str(abs(coef))) for coef in coefficients)
+    print(f"Degree {len(coefficients) - 1}, coefficients up to {digits} digits, "
+          f"{len(planted)} rational roots planted")
+    if search.method == "numeric":
+        print(f"  {search.candidates} real root estimates, {search.checked} fractions checked exactly")
+        print(f"  estimate, refine, then deflation {format_seconds(search_time):>10}")
+    print(f"  {every.candidates:,} candidates ±p/q, {every.checked} left to check exactly "
+          f"after the modular pass")
+    print(f"  one Horner pass, then deflation  {format_seconds(every_time):>10}")
+    print(f"  one synthetic division each      {format_seconds(by_hand_time):>10}")
+    print(f"  roots: {', '.join(str(root) for root in search.roots)}")
+
+    # A quadratic whose constant is the product of two big primes
+    first, second = (next(number for number in itertools.count(rng.randrange(
+        10 ** (BENCHMARK_PRIME_DIGITS - 1), 10 ** BENCHMARK_PRIME_DIGITS)) if math_kernel.is_prime(number))
+        for _ in range(2))
+    quadratic = polynomial.multiply([1, -first], [1, -second])
+    search, search_time = timed(find_rational_roots, quadratic)
+    if search.method == "numeric" and search.roots != sorted([Fraction(first), Fraction(second)]):
+        raise AssertionError(f"wrong roots for {quadratic}: {search.roots}")
+    print(f"\n{format_polynomial(quadratic)}, constant {first} · {second}:")
+    print(f"  roots {', '.join(str(root) for root in search.roots) or '(search skipped)'} "
+          f"in {format_seconds(search_time)} ({search.method})")
+
+    points = [rng.uniform(-1, 1) for _ in range(BENCHMARK_POINTS)]
+    floats = [float(coef) / BENCHMARK_CONSTANT for coef in coefficients]
+    _, bulk_time = timed(evaluate_many, floats, points)
+    _, loop_time = timed(lambda: [perform_synthetic_division(floats, point)[-1] for point in points])
+    exact_points = [Fraction(rng.randint(-99, 99), rng.randint(1, 99)) for _ in range(1000)]
+    exact, exact_time = timed(evaluate_many, coefficients, exact_points)
+    if exact[:20] != [perform_synthetic_division([Fraction(coef) for coef in coefficients], point)[-1]
+                      for point in exact_points[:20]]:
+        raise AssertionError("evaluate_many() and perform_synthetic_division() disagree")
+    print(f"\nEvaluating it at {len(points):,} float points:")
+    print(f"  evaluate_many()                  {format_seconds(bulk_time):>10}")
+    print(f"  one synthetic division each      {format_seconds(loop_time):>10}")
+    print(f"and exactly at {len(exact_points):,} fractions p/q: {format_seconds(exact_time)}")
+
+
+def run_long_division():
+    """Ask for a polynomial and any divisor polynomial, and show the long division."""
+    print("=" * 50)
+    print("  Polynomial Long Division")
+    print("=" * 50)
+    print("Press Ctrl+C to exit.\n")
+    try:
+        highest_degree = int(input("Enter the highest degree of the polynomial: "))
+        print(f"\nEnter coefficients (from x^{highest_degree} down to constant):")
+        dividend = get_exact_coefficients(highest_degree)
+        divisor_degree = int(input("\nEnter the highest degree of the divisor: "))
+        print(f"\nEnter divisor coefficients (from x^{divisor_degree} down to constant):")
+        divisor = get_exact_coefficients(divisor_degree)
+        if not divisor[0]:
+            print("The divisor's leading coefficient must not be 0.")
+            return
+        if divisor_degree > highest_degree:
+            print("The divisor's degree is higher: the quotient is 0 and the polynomial is the remainder.")
+            return
+        print(f"\nPolynomial: {format_polynomial(dividend)}")
+        print(f"Dividing by: ({format_polynomial(divisor)})")
+        display_long_division_table(dividend, divisor)
+    except ValueError:
+        print("Please enter valid numbers.")
+    except KeyboardInterrupt:
+        print("\nGoodbye!")
+
+
+def run_roots():
+    """Ask for a polynomial and show its rational roots, dividing each one out."""
+    print("=" * 50)
+    print("  Rational Root Finder")
+    print("=" * 50)
+    print("Press Ctrl+C to exit.\n")
+    try:
+        highest_degree = int(input("Enter the highest degree of the polynomial: "))
+        print(f"\nEnter coefficients (from x^{highest_degree} down to constant):")
+        coefficients = get_exact_coefficients(highest_degree)
+        if not coefficients[0]:
+            print("The leading coefficient must not be 0.")
+            return
+        print(f"\nPolynomial: {format_polynomial(coefficients)}")
+
+        search = find_rational_roots(coefficients)
+        if search.method == "skipped":
+            print(f"Search skipped: without NumPy the constant and leading coefficients must be "
+                  f"factored, and over {FACTOR_DIGITS} digits that can take minutes.")
+            return
+        if search.method == "numeric":
+            print(f"{search.candidates} real root estimates, "
+                  f"{search.checked} fractions ±p/q near them checked exactly")
+        else:
+            print(f"{search.candidates:,} candidates ±p/q from the rational root theorem")
+        remaining = integer_coefficients(coefficients)
+        for root in search.roots:
+            if root == 0:
+                remaining = remaining[:-1]
+                print("\nx = 0 is a root: divide out x")
+                continue
+            remaining = integer_coefficients(display_synthetic_division_table(remaining, root)[:-1])
+
+        print()
+        if search.roots:
+            print("Rational roots: " + ", ".join(str(root) for root in search.roots))
+        else:
+            print("No rational roots.")
+        if len(search.remaining) > 1:
+            print(f"Left over: {format_polynomial(search.remaining)}")
+    except ValueError:
+        print("Please enter valid numbers.")
+    except KeyboardInterrupt:
+        print("\nGoodbye!")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="SENSUB.py - Synthetic Division (Python port of SENSUB.BAS)",
+    )
+    parser.add_argument(
+        "--long", action="store_true",
+        help="Divide by any polynomial (long division) instead of by (x - c)",
+    )
+    parser.add_argument(
+        "--roots", action="store_true",
+        help="Find every rational root of a polynomial instead of dividing by one (x - c)",
+    )
+    parser.add_argument(
+        "--benchmark", action="store_true",
+        help="Check and time the root search and bulk evaluation on degree-100 polynomials",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="Seed for the random polynomial of --benchmark (default: 0)",
+    )
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+    if args.benchmark:
+        run_benchmark(args.seed)
+        return
+    if args.long:
+        run_long_division()
+        return
+    if args.roots:
+        run_roots()
+        return
+
     print("=" * 50)
     print("  Synthetic Division Calculator")
     print("=" * 50)
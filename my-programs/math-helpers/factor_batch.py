@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+factor_batch.py - Batch factoring for MATH2.py and MATH3.py
+
+Not a conversion of any single .BAS file. MATH2.BAS and MATH3.BAS asked
+for one quadratic at a time with INPUT; this factors a whole worksheet of
+them. Rows are read from a file or standard input and factored in chunks,
+and the answers are written as soon as they are ready, in the order of the
+input, so a worksheet of any length takes the same small amount of memory.
+Rows that cannot be read are reported on standard error as "line N: ...",
+so the answers stay machine-readable, and when it is done the rows per
+second and the peak memory go there too.
+
+A row of worksheet-sized numbers factors in a few microseconds, about as
+long as it takes to send it to another process and back, so rows are
+factored in this process by default. --workers spreads the chunks over a
+process pool, which only pays off with several free cores and big
+coefficients (see --digits).
+
+Each row is b,c for x² + bx + c (factored with MATH2.py, like the original
+program) or a,b,c for ax² + bx + c (MATH3.py), either as CSV, optionally
+under a header naming the a, b and c columns, or as JSON lines such as
+{"a": 2, "b": 7, "c": 3} or [2, 7, 3].
+
+Usage:
+  python factor_batch.py worksheet.csv
+  python factor_batch.py worksheet.jsonl --format jsonl > answers.jsonl
+  cat worksheet.csv | python factor_batch.py - --workers 4 2> errors.txt
+  python factor_batch.py --generate 100000 > worksheet.csv   # a test worksheet
+"""
+
+import argparse
+import csv
+import io
+import itertools
+import json
+import random
+import sys
+import time
+from typing import NamedTuple
+
+from MATH2 import find_factor_pair, format_binomial
+from MATH3 import find_factorization, format_binomial_with_coefficient, format_quadratic
+from stream_pool import map_chunks, peak_memory_mb, read_chunks
+
+
+# Rows sent to a worker at a time
+CHUNK_ROWS = 2000
+
+OUTPUT_FORMATS = ("text", "csv", "jsonl")
+
+
+class BatchOptions(NamedTuple):
+    """What every worker needs to know besides its rows."""
+
+    variable: str
+    output_format: str
+    # Positions of the a, b and c columns (a may be None), or None for bare rows
+    columns: tuple | None
+
+
+def parse_row(line: str, columns: tuple | None) -> tuple[int, int, int]:
+    """(a, b, c) from one CSV or JSON line; a is 1 for b,c rows."""
+    text = line.strip()
+    if text.startswith("{"):
+        row = json.loads(text)
+        if "b" not in row or "c" not in row:
+            raise ValueError("needs at least b and c")
+        values = [row.get("a", 1), row["b"], row["c"]]
+    elif text.startswith("["):
+        values = json.loads(text)
+        if not isinstance(values, list):
+            raise ValueError("expected a JSON list")
+    else:
+        fields = next(csv.reader([text]))
+        if columns is not None:
+            fields = ["1" if index is None else fields[index] for index in columns]
+        values = [field.strip() for field in fields]
+    if len(values) == 2:
+        values = [1, *values]
+    if len(values) != 3:
+        raise ValueError(f"expected b,c or a,b,c, got {len(values)} values")
+    if text.startswith(("{", "[")):
+        # JSON numbers must already be whole: no 2.9, "3" or true
+        for value in values:
+            if type(value) is not int:
+                raise ValueError(f"{json.dumps(value)} is not an integer")
+    leading, middle, constant = (int(value) for value in values)
+    if leading == 0 or constant == 0:
+        raise ValueError("a and c must not be 0")
+    return leading, middle, constant
+
+
+def factor_row(leading: int, middle: int, constant: int, variable: str) -> tuple[tuple | None, str]:
+    """The factors (p, m, q, n) of a quadratic, or None, and the result as text."""
+    if leading == 1:
+        # x² + bx + c: MATH2.py's answer and wording
+        pair = find_factor_pair(middle, constant)
+        if pair is None:
+            return None, "Prime"
+        first_const, second_const = pair
+        return ((1, first_const, 1, second_const),
+                format_binomial(variable, first_const) + format_binomial(variable, second_const))
+
+    factors = find_factorization(leading, middle, constant)
+    if factors is None:
+        return None, "Prime"
+    first_var_coef, first_const, second_var_coef, second_const = factors
+    return factors, (format_binomial_with_coefficient(first_var_coef, variable, first_const)
+                     + format_binomial_with_coefficient(second_var_coef, variable, second_const))
+
+
+def format_result(line_number: int, line: str, options: BatchOptions) -> tuple[str, str]:
+    """
+    One output line for one input line, and whether it was "factored", "prime" or an "error".
+
+    For an error the line is a "line N: ..." message for standard error,
+    not an answer.
+    """
+    try:
+        leading, middle, constant = parse_row(line, options.columns)
+    except (ValueError, IndexError, TypeError) as error:
+        return f"line {line_number}: {error}", "error"
+
+    factors, result = factor_row(leading, middle, constant, options.variable)
+    outcome = "prime" if factors is None else "factored"
+    if options.output_format == "jsonl":
+        return json.dumps({"line": line_number, "a": leading, "b": middle, "c": constant,
+                           "factors": factors, "result": result}), outcome
+    if options.output_format == "csv":
+        numbers = ",".join(str(number) for number in factors) if factors else ",,,"
+        return f"{leading},{middle},{constant},{numbers},{csv_field(result)}", outcome
+    return f"{format_quadratic(options.variable, leading, middle, constant)} = {result}", outcome
+
+
+def csv_field(text: str) -> str:
+    """text quoted for CSV if it needs it."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow([text])
+    return buffer.getvalue().rstrip("\r\n")
+
+
+def factor_chunk(first_line: int, lines: list, options: BatchOptions) -> tuple[list, list, dict]:
+    """Output lines and error messages for a chunk of input lines, and how many of each outcome."""
+    output = []
+    errors = []
+    counts = {"factored": 0, "prime": 0, "error": 0}
+    for line_number, line in enumerate(lines, first_line):
+        if not line.strip():
+            continue
+        text, outcome = format_result(line_number, line, options)
+        (errors if outcome == "error" else output).append(text)
+        counts[outcome] += 1
+    return output, errors, counts
+
+
+def header_columns(line: str) -> tuple | None:
+    """Column positions of a, b and c if line is a CSV header naming them, else None."""
+    if line.lstrip().startswith(("{", "[")):
+        return None
+    names = [field.strip().lower() for field in next(csv.reader([line]), [])]
+    if "b" not in names or "c" not in names:
+        return None
+    return (names.index("a") if "a" in names else None, names.index("b"), names.index("c"))
+
+
+def run_batch(source, output, args: argparse.Namespace):
+    """Factor every row of source into output and report to standard error."""
+    started = time.perf_counter()
+    lines = iter(source)
+    first = next(lines, "")
+    columns = header_columns(first)
+    if columns is None:
+        # No header: the first line is a row like the rest
+        lines = itertools.chain([first], lines)
+        first_line = 1
+    else:
+        first_line = 2
+    options = BatchOptions(args.variable, args.format, columns)
+
+    if options.output_format == "csv":
+        output.write("a,b,c,p,m,q,n,result\n")
+    totals = {"factored": 0, "prime": 0, "error": 0}
+    chunks = read_chunks(lines, args.chunk_rows, first_line=first_line)
+    for text, errors, counts in map_chunks(factor_chunk, chunks, options, args.workers):
+        if text:
+            output.write("\n".join(text))
+            output.write("\n")
+        for message in errors:
+            print(message, file=sys.stderr)
+        for outcome, count in counts.items():
+            totals[outcome] += count
+    output.flush()
+
+    elapsed = time.perf_counter() - started
+    rows = sum(totals.values())
+    report = (f"{rows:,} rows in {elapsed:.2f} s ({rows / max(elapsed, 1e-9):,.0f} rows/s, "
+              f"{args.workers} worker{'s' if args.workers != 1 else ''}): "
+              f"{totals['factored']:,} factored, {totals['prime']:,} prime, "
+              f"{totals['error']:,} errors")
+    memory = peak_memory_mb()
+    if memory is not None:
+        report += f"; peak memory {memory[0]:.1f} MB"
+        if args.workers > 1:
+            report += f", largest worker {memory[1]:.1f} MB"
+    print(report, file=sys.stderr)
+
+
+def generate_worksheet(rows: int, digits: int, seed: int, output):
+    """Write rows random a,b,c quadratics, about half of them factorable."""
+    rng = random.Random(seed)
+    high = 10 ** max(1, digits // 2)
+    output.write("a,b,c\n")
+    for _ in range(rows):
+        first_var_coef, second_var_coef = rng.randint(1, high), rng.choice((1, rng.randint(1, high)))
+        first_const, second_const = (rng.choice((-1, 1)) * rng.randint(1, high) for _ in range(2))
+        middle = first_var_coef * second_const + second_var_coef * first_const
+        if rng.random() < 0.5:
+            middle += 1  # most likely prime now
+        output.write(f"{first_var_coef * second_var_coef},{middle},{first_const * second_const}\n")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Factor a worksheet of quadratics with MATH2.py and MATH3.py",
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-",
+        help="CSV or JSON lines file of b,c or a,b,c rows (default: - for standard input)",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-",
+        help="Write the answers here (default: - for standard output)",
+    )
+    parser.add_argument(
+        "--format", choices=OUTPUT_FORMATS, default="text",
+        help="Answer format (default: text)",
+    )
+    parser.add_argument(
+        "--variable", default="x",
+        help="Variable letter in text answers (default: x)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Worker processes; 1 factors in this process (default: 1)",
+    )
+    parser.add_argument(
+        "--chunk-rows", type=int, default=CHUNK_ROWS,
+        help=f"Rows per chunk sent to a worker (default: {CHUNK_ROWS})",
+    )
+    parser.add_argument(
+        "--generate", type=int, metavar="ROWS", default=0,
+        help="Instead, write a random a,b,c worksheet of ROWS rows",
+    )
+    parser.add_argument(
+        "--digits", type=int, default=6,
+        help="With --generate, about this many digits in a and c (default: 6)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="With --generate, the random seed (default: 0)",
+    )
+    args = parser.parse_args()
+    if args.workers < 1 or args.chunk_rows < 1:
+        parser.error("--workers and --chunk-rows must be at least 1")
+    return args
+
+
+def main():
+    args = parse_args()
+    output = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        if args.generate:
+            generate_worksheet(args.generate, args.digits, args.seed, output)
+            return
+        source = sys.stdin if args.input == "-" else open(args.input, newline="")
+        with source:
+            run_batch(source, output, args)
+    except OSError as error:
+        sys.exit(f"factor_batch.py: error: {error}")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
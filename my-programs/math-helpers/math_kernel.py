@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+math_kernel.py - Shared divisor and factorization cache for the math helpers
+
+Not a conversion of any single .BAS file. MATH2.py's divisor search and
+MATH3.py's brute-force check both list the divisors of the same few
+constants over and over, because worksheets keep reusing them. This
+module factors an integer once and keeps the answer:
+
+- prime_factors(n) tries the small primes from a sieve that is only
+  built the first time it is needed, then finishes big cofactors with a
+  Miller-Rabin test and Pollard's rho, so 64-bit numbers take about a
+  millisecond instead of a √n loop (Pollard's rho still slows down once
+  the second-largest prime factor passes 15 digits or so).
+- divisors(n) is built from the prime factors.
+- Both are kept in bounded LRU caches that count their hits and misses
+  (cache_stats()), and the factorizations can be saved to a JSON file and
+  loaded again by the next run (load_cache() / save_cache()).
+
+gcd and lcm are not cached: math.gcd on worksheet-sized numbers is
+quicker than looking the answer up (the benchmark shows both).
+
+Usage:
+  python math_kernel.py 360 9223372036854775807      # factors and divisor counts
+  python math_kernel.py 360 --cache kernel.json      # keep factorizations between runs
+  python math_kernel.py --benchmark                  # cold, cached and reloaded passes
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import tempfile
+import time
+from collections import OrderedDict
+from math import gcd, isqrt
+
+from timing import timed
+
+
+# Primes below this come from the sieve; anything left after dividing
+# them out is tested with Miller-Rabin
+SIEVE_LIMIT = 1 << 16
+
+# Entries kept in each cache before the least recently used goes
+FACTOR_CACHE_SIZE = 65536
+DIVISOR_CACHE_SIZE = 4096
+
+# Miller-Rabin witnesses; these are exact for every n below 3.3 * 10**24
+# and wrong for larger n with vanishing odds
+WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Benchmark: BENCHMARK_LOOKUPS constants drawn from BENCHMARK_DISTINCT
+# different ones of about BENCHMARK_DIGITS digits, as a worksheet would
+BENCHMARK_LOOKUPS = 20000
+BENCHMARK_DISTINCT = 500
+BENCHMARK_DIGITS = 12
+
+
+class LRUCache:
+    """A dictionary that keeps only its maxsize most recently used entries, and counts lookups."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """The value for key, or None; counts a hit or a miss."""
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+
+FACTOR_CACHE = LRUCache(FACTOR_CACHE_SIZE)
+DIVISOR_CACHE = LRUCache(DIVISOR_CACHE_SIZE)
+
+_small_primes = None
+
+
+def small_primes() -> list[int]:
+    """Every prime below SIEVE_LIMIT, sieved on the first call."""
+    global _small_primes
+    if _small_primes is None:
+        sieve = bytearray([1]) * SIEVE_LIMIT
+        sieve[0:2] = b"\0\0"
+        for number in range(2, isqrt(SIEVE_LIMIT - 1) + 1):
+            if sieve[number]:
+                sieve[number * number::number] = bytes(len(range(number * number, SIEVE_LIMIT, number)))
+        _small_primes = [number for number in range(SIEVE_LIMIT) if sieve[number]]
+    return _small_primes
+
+
+def is_prime(number: int) -> bool:
+    """Miller-Rabin with the fixed WITNESSES."""
+    if number < 2:
+        return False
+    for witness in WITNESSES:
+        if number % witness == 0:
+            return number == witness
+    odd, twos = number - 1, 0
+    while odd % 2 == 0:
+        odd //= 2
+        twos += 1
+    for witness in WITNESSES:
+        value = pow(witness, odd, number)
+        if value in (1, number - 1):
+            continue
+        for _ in range(twos - 1):
+            value = value * value % number
+            if value == number - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def pollard_rho(number: int) -> int:
+    """A nontrivial factor of the odd composite number (Brent's variant)."""
+    rng = random.Random(number)
+    while True:
+        value = rng.randrange(2, number)
+        increment = rng.randrange(1, number)
+        factor = power = steps = 1
+        saved = value
+        while factor == 1:
+            saved = value
+            for _ in range(power):
+                value = (value * value + increment) % number
+            steps = 0
+            while steps < power and factor == 1:
+                product = 1
+                for _ in range(min(128, power - steps)):
+                    value = (value * value + increment) % number
+                    product = product * abs(saved - value) % number
+                steps += 128
+                factor = gcd(product, number)
+            power *= 2
+        if factor != number:
+            return factor
+
+
+def _split(number: int, factors: dict):
+    """Add the prime factors of number (no small primes left in it) to factors."""
+    if number == 1:
+        return
+    if is_prime(number):
+        factors[number] = factors.get(number, 0) + 1
+        return
+    root = isqrt(number)
+    if root * root == number:
+        # Pollard's rho is slow on perfect squares
+        for prime, exponent in prime_factors(root):
+            factors[prime] = factors.get(prime, 0) + 2 * exponent
+        return
+    factor = pollard_rho(number)
+    _split(factor, factors)
+    _split(number // factor, factors)
+
+
+def prime_factors(number: int) -> tuple:
+    """((prime, exponent), ...) for |number| in increasing order; () for 0 and ±1."""
+    number = abs(number)
+    cached = FACTOR_CACHE.get(number)
+    if cached is not None:
+        return cached
+
+    factors = {}
+    remaining = number
+    if remaining > 1:
+        for prime in small_primes():
+            if prime * prime > remaining:
+                break
+            if remaining % prime == 0:
+                exponent = 0
+                while remaining % prime == 0:
+                    remaining //= prime
+                    exponent += 1
+                factors[prime] = exponent
+        if remaining >= SIEVE_LIMIT * SIEVE_LIMIT:
+            _split(remaining, factors)
+        elif remaining > 1:
+            factors[remaining] = factors.get(remaining, 0) + 1
+    result = tuple(sorted(factors.items()))
+    FACTOR_CACHE.put(number, result)
+    return result
+
+
+def divisors(number: int) -> tuple:
+    """Every positive divisor of |number|, in increasing order; () for 0."""
+    number = abs(number)
+    cached = DIVISOR_CACHE.get(number)
+    if cached is not None:
+        return cached
+
+    result = [1] if number else []
+    for prime, exponent in prime_factors(number):
+        result = [divisor * prime ** power for divisor in result for power in range(exponent + 1)]
+    result = tuple(sorted(result))
+    DIVISOR_CACHE.put(number, result)
+    return result
+
+
+def cache_stats() -> dict:
+    """{cache name: (hits, misses, entries)} for the factorization and divisor caches."""
+    return {name: (cache.hits, cache.misses, len(cache.entries))
+            for name, cache in (("factorizations", FACTOR_CACHE), ("divisors", DIVISOR_CACHE))}
+
+
+def clear_caches():
+    """Empty both caches and reset their counts."""
+    FACTOR_CACHE.clear()
+    DIVISOR_CACHE.clear()
+
+
+def load_cache(path: str) -> int:
+    """Load factorizations saved by save_cache(); returns how many. A missing file is empty."""
+    try:
+        with open(path) as file:
+            saved = json.load(file)
+    except FileNotFoundError:
+        return 0
+    for number, factors in saved.items():
+        FACTOR_CACHE.put(int(number), tuple((prime, exponent) for prime, exponent in factors))
+    return len(saved)
+
+
+def save_cache(path: str) -> int:
+    """Write the cached factorizations to path as JSON; returns how many."""
+    # Divisor lists are not saved: they are quick to rebuild and can be huge
+    with open(path, "w") as file:
+        json.dump({str(number): factors for number, factors in FACTOR_CACHE.entries.items()}, file)
+    return len(FACTOR_CACHE.entries)
+
+
+def format_factors(factors: tuple) -> str:
+    """Prime factors like 2^3 · 3^2 · 5."""
+    return " · ".join(f"{prime}^{exponent}" if exponent > 1 else str(prime)
+                      for prime, exponent in factors) or "1"
+
+
+def time_pass(numbers: list) -> float:
+    """Seconds to list the divisors of every number."""
+    started = time.perf_counter()
+    for number in numbers:
+        divisors(number)
+    return time.perf_counter() - started
+
+
+def format_stats() -> str:
+    """Hit/miss counts of both caches, on one line."""
+    return ", ".join(f"{name} {hits:,} hits / {misses:,} misses"
+                     for name, (hits, misses, _) in cache_stats().items())
+
+
+def run_benchmark(seed: int, cache_file: str | None):
+    """Repeated passes over a worksheet of constants: cold, cached, and reloaded from a file."""
+    rng = random.Random(seed)
+    low, high = 10 ** (BENCHMARK_DIGITS - 1), 10 ** BENCHMARK_DIGITS
+    distinct = [rng.randrange(low, high) for _ in range(BENCHMARK_DISTINCT)]
+    numbers = [rng.choice(distinct) for _ in range(BENCHMARK_LOOKUPS)]
+    print(f"Divisors of {BENCHMARK_LOOKUPS:,} constants ({BENCHMARK_DISTINCT} distinct, "
+          f"{BENCHMARK_DIGITS} digits each):\n")
+
+    # Cold: nothing cached, not even the sieve
+    global _small_primes
+    _small_primes = None
+    _, sieve = timed(small_primes)
+    print(f"  sieve of primes below {SIEVE_LIMIT:,}: {1000 * sieve:.1f} ms (first use only)")
+
+    # Caches that keep nothing: every lookup factors from scratch
+    clear_caches()
+    for cache in (FACTOR_CACHE, DIVISOR_CACHE):
+        cache.maxsize = 0
+    uncached = time_pass(numbers)
+    print(f"  no cache     {1000 * uncached:8.1f} ms")
+    FACTOR_CACHE.maxsize, DIVISOR_CACHE.maxsize = FACTOR_CACHE_SIZE, DIVISOR_CACHE_SIZE
+
+    for label in ("first pass", "second pass"):
+        for cache in (FACTOR_CACHE, DIVISOR_CACHE):
+            cache.hits = cache.misses = 0
+        elapsed = time_pass(numbers)
+        print(f"  {label:<12} {1000 * elapsed:8.1f} ms  {uncached / elapsed:5.0f}x  ({format_stats()})")
+
+    # A new run: only what the cache file kept
+    path = cache_file or os.path.join(tempfile.gettempdir(), "math_kernel_benchmark.json")
+    saved = save_cache(path)
+    clear_caches()
+    _, loaded = timed(load_cache, path)
+    reloaded = time_pass(numbers)
+    print(f"  next run     {1000 * reloaded:8.1f} ms  {uncached / reloaded:5.0f}x  ({format_stats()})")
+    print(f"               after loading {saved:,} factorizations from {path} in {1000 * loaded:.1f} ms")
+    if cache_file is None:
+        os.remove(path)
+
+    # gcd is cheaper to compute than to look up
+    pairs = [(rng.randrange(1, 10 ** 6), rng.randrange(1, 10 ** 6)) for _ in range(BENCHMARK_LOOKUPS)]
+    lookup = LRUCache(len(pairs))
+    for pair in pairs:
+        lookup.put(pair, gcd(*pair))
+    started = time.perf_counter()
+    for first, second in pairs:
+        gcd(first, second)
+    computed = time.perf_counter() - started
+    started = time.perf_counter()
+    for pair in pairs:
+        lookup.get(pair)
+    looked_up = time.perf_counter() - started
+    print(f"\n  gcd of 6-digit pairs: {1e9 * computed / len(pairs):.0f} ns computed, "
+          f"{1e9 * looked_up / len(pairs):.0f} ns from a cache, so gcd and lcm stay uncached")
+
+
+def parse_number(text: str) -> int:
+    """An integer, or a power like 2**61-1."""
+    power = re.fullmatch(r"(\d+)\*\*(\d+)([+-]\d+)?", text.replace(" ", ""))
+    if power:
+        return int(power[1]) ** int(power[2]) + int(power[3] or 0)
+    try:
+        return int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an integer: {text!r}")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Factor integers and list their divisors, with a shared cache",
+    )
+    parser.add_argument(
+        "numbers", nargs="*", type=parse_number,
+        help="Integers to factor (powers like 2**61-1 are allowed)",
+    )
+    parser.add_argument(
+        "--cache", metavar="FILE",
+        help="Load factorizations from FILE first and save them back afterwards",
+    )
+    parser.add_argument(
+        "--benchmark", action="store_true",
+        help="Time repeated passes over a worksheet of constants",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="Seed for the benchmark's constants (default: 0)",
+    )
+    args = parser.parse_args()
+    if not args.numbers and not args.benchmark:
+        parser.error("give some numbers, or --benchmark")
+    return args
+
+
+def main():
+    args = parse_args()
+    if args.benchmark:
+        run_benchmark(args.seed, args.cache)
+        return
+
+    if args.cache:
+        load_cache(args.cache)
+    for number in args.numbers:
+        if number == 0:
+            print("0 = 0  (every integer divides it)")
+            continue
+        factors, elapsed = timed(prime_factors, number)
+        count = 1
+        for _, exponent in factors:
+            count *= exponent + 1
+        print(f"{number} = {format_factors(factors)}  ({count:,} divisors, {1000 * elapsed:.2f} ms)")
+    print(format_stats())
+    if args.cache:
+        print(f"Saved {save_cache(args.cache):,} factorizations to {args.cache}")
+
+
+if __name__ == "__main__":
+    main()
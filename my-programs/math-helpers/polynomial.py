@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+polynomial.py - Polynomial multiplication and long division for SENSUB.py
+
+Not a conversion of any single .BAS file. SENSUB.BAS could only divide by
+a linear factor (x - c). This module divides by any polynomial and
+multiplies polynomials of any size. Coefficients are lists from the
+highest power down to the constant, the same as in SENSUB.py.
+
+- multiply() uses schoolbook multiplication for short factors. Longer
+  ones go through the fastest exact method available:
+  - NumPy's FFT, for floats and for whole numbers small enough that the
+    rounded answer is certain;
+  - Kronecker substitution, for any other whole numbers: pack each
+    factor into one big integer, multiply once, unpack;
+  - Karatsuba, for Fractions.
+- divide() is long division. With whole numbers and a divisor whose
+  leading coefficient is 1 or -1, everything stays whole. Otherwise it
+  uses Fractions for exact input and floats for float input.
+- long_division() also keeps the rows subtracted at each step. SENSUB.py
+  draws its long-division table from them instead of dividing again.
+
+Usage:
+  python polynomial.py "2 3 0 0 5" "1 0 -1"   # product, quotient and remainder
+  python polynomial.py --benchmark             # degrees 10 to 100,000
+"""
+
+import argparse
+import random
+from fractions import Fraction
+from typing import NamedTuple
+
+from timing import format_seconds, timed
+
+
+# Below this many coefficients in the shorter factor, schoolbook is fastest
+KARATSUBA_CUTOFF = 32
+# Whole-number products go through the float FFT only if every coefficient
+# of the answer is below 2**FFT_EXACT_BITS, far enough under 2**53 that
+# rounding the FFT's answer is sure to give it exactly
+FFT_EXACT_BITS = 40
+
+# Benchmark: degrees, coefficients from -BENCHMARK_COEFFICIENT to
+# BENCHMARK_COEFFICIENT, and the divisor's degree
+BENCHMARK_DEGREES = [10, 100, 1000, 10_000, 100_000]
+BENCHMARK_COEFFICIENT = 1000
+BENCHMARK_DIVISOR_DEGREE = 10
+# Largest degrees timed with the slow methods; beyond them they take minutes
+NAIVE_LIMIT = 3000
+KARATSUBA_LIMIT = 10_000
+
+
+class LongDivision(NamedTuple):
+    """long_division()'s answer and the working that led to it."""
+
+    quotient: list
+    remainder: list
+    # (coefficient of the quotient, that coefficient × divisor) per step
+    steps: list
+
+
+def trim(coefficients: list) -> list:
+    """coefficients without leading zeros; [0] for the zero polynomial."""
+    for index, coef in enumerate(coefficients):
+        if coef:
+            return list(coefficients[index:])
+    return [0]
+
+
+def multiply_naive(first: list, second: list) -> list:
+    """first × second the schoolbook way: every coefficient times every other."""
+    product = [0] * (len(first) + len(second) - 1)
+    for i, a in enumerate(first):
+        if a:
+            for j, b in enumerate(second):
+                product[i + j] += a * b
+    return product
+
+
+def _karatsuba(first: list, second: list) -> list:
+    """first × second for equally long lists, lowest power first."""
+    size = len(first)
+    if size <= KARATSUBA_CUTOFF:
+        return multiply_naive(first, second)
+    # first = low + high·x^half, and the same for second
+    half = size // 2
+    pad = [0] * (size - 2 * half)
+    first_low, first_high = first[:half], first[half:]
+    second_low, second_high = second[:half], second[half:]
+    low = _karatsuba(first_low, second_low)
+    high = _karatsuba(first_high, second_high)
+    # (low + high) × (low + high), less low and high, is the cross term:
+    # three half-size products instead of four
+    cross = _karatsuba([a + b for a, b in zip(first_low + pad, first_high)],
+                       [a + b for a, b in zip(second_low + pad, second_high)])
+
+    product = [0] * (2 * size - 1)
+    for index, value in enumerate(low):
+        product[index] += value
+        product[index + half] -= value
+    for index, value in enumerate(high):
+        product[index + 2 * half] += value
+        product[index + half] -= value
+    for index, value in enumerate(cross):
+        product[index + half] += value
+    return product
+
+
+def multiply_karatsuba(first: list, second: list) -> list:
+    """first × second by Karatsuba's three-multiplications-for-four split; any numbers."""
+    size = max(len(first), len(second))
+    # Lowest power first, padded with zero high powers to the same length
+    product = _karatsuba(first[::-1] + [0] * (size - len(first)),
+                         second[::-1] + [0] * (size - len(second)))
+    return product[:len(first) + len(second) - 1][::-1]
+
+
+def product_bound(first: list, second: list) -> int:
+    """A bound on every coefficient of first × second."""
+    return (max(abs(coef) for coef in first) * max(abs(coef) for coef in second)
+            * min(len(first), len(second)))
+
+
+def multiply_kronecker(first: list[int], second: list[int]) -> list[int]:
+    """
+    first × second for whole numbers, exactly, with one big-integer
+    multiplication: each factor is read as a number in base 2**(8·width),
+    one coefficient per digit, with width wide enough for any coefficient
+    of the product.
+    """
+    bound = product_bound(first, second)
+    if bound == 0:
+        return [0] * (len(first) + len(second) - 1)
+    width = bound.bit_length() // 8 + 1
+    # Adding offset to every digit makes it non-negative
+    offset = 1 << (8 * width - 1)
+    offset_digit = offset.to_bytes(width, "big")
+
+    def pack(coefficients: list[int]) -> int:
+        data = b"".join((coef + offset).to_bytes(width, "big") for coef in coefficients)
+        return int.from_bytes(data, "big") - int.from_bytes(offset_digit * len(coefficients), "big")
+
+    size = len(first) + len(second) - 1
+    product = pack(first) * pack(second) + int.from_bytes(offset_digit * size, "big")
+    data = product.to_bytes(width * size, "big")
+    return [int.from_bytes(data[index:index + width], "big") - offset
+            for index in range(0, width * size, width)]
+
+
+def multiply_fft(first: list, second: list) -> list:
+    """
+    first × second with NumPy's FFT. Whole-number answers are rounded,
+    which is only exact while product_bound() is below 2**FFT_EXACT_BITS.
+    """
+    import numpy as np
+
+    size = len(first) + len(second) - 1
+    length = 1 << (size - 1).bit_length()
+    product = np.fft.irfft(np.fft.rfft(np.asarray(first, dtype=float), length)
+                           * np.fft.rfft(np.asarray(second, dtype=float), length), length)[:size]
+    if all(isinstance(coef, int) for coef in first) and all(isinstance(coef, int) for coef in second):
+        return np.rint(product).astype(np.int64).tolist()
+    return product.tolist()
+
+
+def multiply(first: list, second: list) -> list:
+    """first × second, by whichever method is fastest for these coefficients."""
+    if min(len(first), len(second)) <= KARATSUBA_CUTOFF:
+        return multiply_naive(first, second)
+    whole = all(isinstance(coef, int) for coef in first) and \
+        all(isinstance(coef, int) for coef in second)
+    floats = not whole and all(isinstance(coef, (int, float)) for coef in first) and \
+        all(isinstance(coef, (int, float)) for coef in second)
+    if whole or floats:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            if floats or product_bound(first, second).bit_length() <= FFT_EXACT_BITS:
+                return multiply_fft(first, second)
+    if whole:
+        return multiply_kronecker(first, second)
+    return multiply_karatsuba(first, second)
+
+
+def _long_division(dividend: list, divisor: list, steps: list | None) -> tuple[list, list]:
+    """divide(); appends each step to steps if it is a list."""
+    divisor = trim(divisor)
+    if divisor == [0]:
+        raise ZeroDivisionError("division by the zero polynomial")
+    lead = divisor[0]
+    whole = all(isinstance(coef, int) for coef in dividend) and \
+        all(isinstance(coef, int) for coef in divisor)
+    if whole and lead in (1, -1):
+        inverse = lead  # 1/1 and 1/-1: stays whole
+    elif all(isinstance(coef, (int, Fraction)) for coef in dividend) and \
+            all(isinstance(coef, (int, Fraction)) for coef in divisor):
+        inverse = Fraction(1, 1) / lead
+    else:
+        inverse = 1 / lead
+
+    remainder = list(dividend)
+    tail = divisor[1:]
+    length = len(divisor)
+    quotient = []
+    for index in range(len(dividend) - length + 1):
+        coef = remainder[index] * inverse
+        quotient.append(coef)
+        if coef:
+            end = index + length
+            remainder[index + 1:end] = [r - coef * d for r, d in zip(remainder[index + 1:end], tail)]
+            if steps is not None:
+                steps.append((coef, [coef * d for d in divisor]))
+        elif steps is not None:
+            steps.append((coef, [0] * length))
+    if not quotient:
+        return [0], trim(remainder)
+    return quotient, trim(remainder[len(quotient):])
+
+
+def divide(dividend: list, divisor: list) -> tuple[list, list]:
+    """(quotient, remainder) of dividend ÷ divisor by long division."""
+    return _long_division(dividend, divisor, None)
+
+
+def long_division(dividend: list, divisor: list) -> LongDivision:
+    """divide(), keeping what is subtracted at each step for a table."""
+    steps = []
+    quotient, remainder = _long_division(dividend, divisor, steps)
+    return LongDivision(quotient, remainder, steps)
+
+
+def divide_naive(dividend: list, divisor: list) -> tuple[list, list]:
+    """divide() the textbook way, in Fractions throughout (for the benchmark)."""
+    remainder = [Fraction(coef) for coef in dividend]
+    divisor = [Fraction(coef) for coef in trim(divisor)]
+    quotient = []
+    for index in range(len(remainder) - len(divisor) + 1):
+        coef = remainder[index] / divisor[0]
+        quotient.append(coef)
+        for offset, value in enumerate(divisor):
+            remainder[index + offset] -= coef * value
+    return quotient or [Fraction(0)], trim(remainder[len(quotient):])
+
+
+def random_polynomial(rng: random.Random, degree: int) -> list[int]:
+    """A degree-degree polynomial with whole coefficients up to BENCHMARK_COEFFICIENT."""
+    return [rng.choice((-1, 1)) * rng.randint(1, BENCHMARK_COEFFICIENT)] + \
+        [rng.randint(-BENCHMARK_COEFFICIENT, BENCHMARK_COEFFICIENT) for _ in range(degree)]
+
+
+def run_benchmark(seed: int):
+    """Time every multiplication and the two divisions from degree 10 to 100,000; check they agree."""
+    rng = random.Random(seed)
+    try:
+        multiply_fft([1], [1])  # imports NumPy and sets up its FFT before anything is timed
+        have_numpy = True
+    except ImportError:
+        have_numpy = False
+
+    print(f"Multiplying two polynomials of the same degree, coefficients up to {BENCHMARK_COEFFICIENT}")
+    print(f"{'degree':>8}  {'schoolbook':>10}  {'Karatsuba':>10}  {'Kronecker':>10}  "
+          f"{'FFT':>10}  {'FFT, floats':>11}")
+    for degree in BENCHMARK_DEGREES:
+        first, second = random_polynomial(rng, degree), random_polynomial(rng, degree)
+        expected, kronecker_time = timed(multiply_kronecker, first, second)
+        times = []
+        for function, limit in ((multiply_naive, NAIVE_LIMIT), (multiply_karatsuba, KARATSUBA_LIMIT)):
+            if degree > limit:
+                times.append("-")
+                continue
+            product, elapsed = timed(function, first, second)
+            if product != expected:
+                raise AssertionError(f"{function.__name__} is wrong at degree {degree}")
+            times.append(format_seconds(elapsed))
+        times.append(format_seconds(kronecker_time))
+        if have_numpy:
+            product, elapsed = timed(multiply_fft, first, second)
+            if product != expected:
+                raise AssertionError(f"multiply_fft is wrong at degree {degree}")
+            times.append(format_seconds(elapsed))
+            times.append(format_seconds(timed(multiply_fft, [float(coef) for coef in first],
+                                              [float(coef) for coef in second])[1]))
+        else:
+            times += ["-", "-"]
+        print(f"{degree:>8,}  {times[0]:>10}  {times[1]:>10}  {times[2]:>10}  "
+              f"{times[3]:>10}  {times[4]:>11}")
+
+    # Random dividends would have quotients with coefficients thousands of
+    # digits long; these are built as quotient × divisor + remainder instead
+    print(f"\nDividing by a degree-{BENCHMARK_DIVISOR_DEGREE} polynomial with leading coefficient 1")
+    print(f"{'degree':>8}  {'Fractions':>10}  {'divide()':>10}")
+    for degree in BENCHMARK_DEGREES:
+        divisor = [1] + random_polynomial(rng, BENCHMARK_DIVISOR_DEGREE)[1:]
+        expected = (random_polynomial(rng, degree - BENCHMARK_DIVISOR_DEGREE),
+                    random_polynomial(rng, BENCHMARK_DIVISOR_DEGREE - 1))
+        dividend = multiply(expected[0], divisor)
+        dividend[-len(expected[1]):] = [d + r for d, r in zip(dividend[-len(expected[1]):], expected[1])]
+
+        result, elapsed = timed(divide, dividend, divisor)
+        if result != expected:
+            raise AssertionError(f"divide() is wrong at degree {degree}")
+        times = [format_seconds(elapsed)]
+        if degree > NAIVE_LIMIT:
+            times.insert(0, "-")
+        else:
+            result, elapsed = timed(divide_naive, dividend, divisor)
+            if result != expected:
+                raise AssertionError(f"divide_naive() is wrong at degree {degree}")
+            times.insert(0, format_seconds(elapsed))
+        print(f"{degree:>8,}  {times[0]:>10}  {times[1]:>10}")
+
+    print(f"\n- = skipped: schoolbook and Fractions over degree {NAIVE_LIMIT:,}, Karatsuba over "
+          f"{KARATSUBA_LIMIT:,}" + ("" if have_numpy else "; FFT needs NumPy"))
+
+
+def parse_polynomial(text: str) -> list:
+    """Coefficients from text like "2 3 -1/2 5" (highest power first)."""
+    values = [Fraction(value) for value in text.replace(",", " ").split()]
+    if not values:
+        raise argparse.ArgumentTypeError("no coefficients")
+    return [int(value) if value.denominator == 1 else value for value in values]
+
+
+def format_coefficients(coefficients: list) -> str:
+    """Coefficients as text, the way parse_polynomial() reads them."""
+    return " ".join(str(coef) for coef in coefficients)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Multiply and divide polynomials (coefficients from the highest power down)",
+    )
+    parser.add_argument(
+        "polynomials", nargs="*", type=parse_polynomial,
+        help='Two polynomials, each as quoted coefficients like "2 3 0 -1/2"',
+    )
+    parser.add_argument(
+        "--benchmark", action="store_true",
+        help="Time the multiplication and division methods from degree 10 to 100,000",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="Seed for the benchmark's polynomials (default: 0)",
+    )
+    args = parser.parse_args()
+    if not args.benchmark and len(args.polynomials) != 2:
+        parser.error("give two polynomials, or --benchmark")
+    return args
+
+
+def main():
+    args = parse_args()
+    if args.benchmark:
+        run_benchmark(args.seed)
+        return
+
+    first, second = args.polynomials
+    print(f"Product:   {format_coefficients(multiply(first, second))}")
+    try:
+        quotient, remainder = divide(first, second)
+    except ZeroDivisionError as error:
+        print(f"Quotient:  ({error})")
+        return
+    print(f"Quotient:  {format_coefficients(quotient)}")
+    print(f"Remainder: {format_coefficients(remainder)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+stream_pool.py - Shared chunked process pool for the streaming math helpers
+
+Not a conversion of any single .BAS file. factor_batch.py and BASES.py
+both read a file of any length, split it into chunks of lines, work on
+the chunks in a process pool and write the answers in input order. This
+module is the part of that which does not care what the lines hold:
+
+- read_chunks() cuts lines into (first line number, lines) chunks.
+- map_chunks() runs function(first_line, lines, options) on each chunk
+  and yields the results in input order, keeping at most
+  CHUNKS_PER_WORKER chunks per worker in flight, so the next chunk is
+  only read once the oldest is written. Input that fits in one chunk,
+  or a single worker, stays in this process.
+- peak_memory_mb() is the peak memory for the report at the end.
+
+There is no command line; run factor_batch.py or BASES.py instead.
+"""
+
+import itertools
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Chunks in flight per worker
+CHUNKS_PER_WORKER = 2
+
+
+def read_chunks(lines, chunk_lines: int, chunk_chars: int | None = None, first_line: int = 1):
+    """(first line number, lines) for each chunk_lines lines or chunk_chars characters."""
+    chunk = []
+    characters = 0
+    for line in lines:
+        chunk.append(line)
+        characters += len(line)
+        if len(chunk) >= chunk_lines or (chunk_chars is not None and characters >= chunk_chars):
+            yield first_line, chunk
+            first_line += len(chunk)
+            chunk = []
+            characters = 0
+    if chunk:
+        yield first_line, chunk
+
+
+def map_chunks(function, chunks, options, workers: int):
+    """
+    Yield function(first_line, lines, options) for each chunk, in input order.
+
+    function and options must be picklable: with several workers and more
+    than one chunk, each call runs in a worker process.
+    """
+    chunks = iter(chunks)
+    first = list(itertools.islice(chunks, 2))
+    if workers <= 1 or len(first) < 2:
+        for first_line, lines in itertools.chain(first, chunks):
+            yield function(first_line, lines, options)
+        return
+
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for first_line, lines in itertools.chain(first, chunks):
+            pending.append(pool.submit(function, first_line, lines, options))
+            if len(pending) >= workers * CHUNKS_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def peak_memory_mb() -> tuple[float, float] | None:
+    """Peak resident memory of this process and of its largest finished child, in MB."""
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    unit = 1 / 1024 ** 2 if sys.platform == "darwin" else 1 / 1024
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit)
@@ -0,0 +1,11 @@
+"""
+Tests for the math helpers: python -m pytest my-programs/math-helpers/tests
+
+The helpers are scripts run from their own folder, not an installed
+package, so that folder goes on the import path here.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
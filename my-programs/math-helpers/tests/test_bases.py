@@ -0,0 +1,84 @@
+"""Tests for BASES's divide-and-conquer conversion and the streaming converter."""
+
+import random
+
+import pytest
+
+from BASES import (DIGITS, REGROUP_BITS, StreamOptions, convert_chunk, convert_decimal_to_base,
+                   convert_digit_by_digit, convert_number, from_base, to_base, to_bases)
+
+
+@pytest.mark.parametrize("base", range(2, 37))
+def test_matches_the_digit_loop(base):
+    rng = random.Random(base)
+    for number in [0, 1, base - 1, base, base ** 64 - 1, base ** 64, base ** 129 + 1]:
+        assert to_base(number, base) == convert_digit_by_digit(number, base)
+    for _ in range(50):
+        number = rng.randrange(10 ** rng.randint(1, 800))
+        expected = convert_digit_by_digit(number, base)
+        assert to_base(number, base) == expected
+        assert to_base(number, base, use_reciprocal=False) == expected
+
+
+def test_long_numbers_read_back():
+    rng = random.Random(0)
+    number = rng.randrange(3 ** 4000)  # every string under int()'s 4,300-digit limit
+    for base in (3, 10, 36):
+        assert int(to_base(number, base), base) == number
+    assert to_base(number, 10) == str(number)
+
+
+def test_negative_and_invalid():
+    assert to_base(-255, 16) == "-FF"
+    with pytest.raises(ValueError):
+        to_base(5, 37)
+
+
+@pytest.mark.parametrize("bits", [10, 1000, REGROUP_BITS + 1000])
+def test_to_bases_matches_to_base(bits):
+    rng = random.Random(bits)
+    number = -rng.getrandbits(bits)
+    bases = range(2, 37)
+    assert to_bases(number, bases) == {base: to_base(number, base) for base in bases}
+
+
+def test_convert_decimal_to_base_keeps_the_original_answers():
+    assert convert_decimal_to_base(255, 2) == "11111111"
+    assert convert_decimal_to_base(35, 36) == DIGITS[35]
+
+
+@pytest.mark.parametrize("base", [2, 7, 10, 16, 36])
+def test_from_base_reads_long_strings(base):
+    rng = random.Random(base)
+    number = rng.getrandbits(40000)
+    assert from_base(to_base(number, base), base) == number
+
+
+@pytest.mark.parametrize("source_base, target_base", [(10, 16), (16, 3), (3, 10), (36, 2)])
+def test_convert_number_round_trip(source_base, target_base):
+    rng = random.Random(source_base * target_base)
+    for _ in range(300):
+        number = rng.randrange(-source_base ** 30, source_base ** 30)
+        text = to_base(number, source_base)
+        converted = convert_number(text, source_base, target_base)
+        assert converted == to_base(number, target_base)
+        assert convert_number(converted, target_base, source_base) == text
+
+
+def test_convert_number_fractions():
+    assert convert_number("-1A.8", 16, 10) == "-26.5"
+    assert convert_number("0.1", 10, 2, precision=4) == "0.001"
+    assert convert_number("0.FF", 16, 10, precision=1) == "1"
+    assert convert_number("-0.0", 10, 2) == "0"
+    assert convert_number("007", 10, 16) == "7"
+    with pytest.raises(ValueError):
+        convert_number(".", 10, 2)
+    with pytest.raises(ValueError):
+        convert_number("12", 2, 10)
+
+
+def test_convert_chunk_keeps_lines_in_step():
+    options = StreamOptions(10, 16, None)
+    output, errors = convert_chunk(5, ["255", "", "zz", "-16"], options)
+    assert output == ["FF", "", "", "-10"]
+    assert errors == ["line 7: invalid literal for int() with base 10: 'zz'"]
@@ -0,0 +1,110 @@
+"""Tests for CHAPTER4's exact solver and the original elimination program."""
+
+import random
+from fractions import Fraction
+
+import pytest
+
+from CHAPTER4 import (DEPENDENT, INCONSISTENT, UNIQUE, read_number, solve_by_elimination,
+                      solve_system, solve_with_fractions)
+
+
+def random_rows(rng: random.Random, size: int) -> list:
+    """size random equations with fraction entries; about half of them made singular."""
+    rows = [[Fraction(rng.randint(-5, 5), rng.randint(1, 3)) for _ in range(size + 1)]
+            for _ in range(size)]
+    if size > 1 and rng.random() < 0.5:
+        weights = [rng.randint(-2, 2) for _ in range(size - 1)]
+        rows[-1] = [sum(weight * row[column] for weight, row in zip(weights, rows))
+                    for column in range(size + 1)]
+        rows[-1][size] += rng.choice((0, 1))
+    return rows
+
+
+@pytest.mark.parametrize("size", range(1, 7))
+def test_agrees_with_fraction_elimination(size):
+    rng = random.Random(size)
+    for _ in range(200):
+        rows = random_rows(rng, size)
+        solution = solve_system(rows)
+        assert (solution.status, solution.values) == solve_with_fractions(rows)
+        if solution.status == UNIQUE:
+            for row in rows:
+                assert sum(coefficient * value for coefficient, value in zip(row, solution.values)) == row[-1]
+
+
+def test_statuses():
+    assert solve_system([[1, 1, 2], [2, 2, 4]]).status == DEPENDENT
+    assert solve_system([[1, 1, 2], [2, 2, 5]]).status == INCONSISTENT
+    assert solve_system([[0, 0, 0], [0, 0, 1]]).status == INCONSISTENT
+    assert solve_system([["1/2", "0.25", 1], [1, -1, 0]]).values == (Fraction(4, 3), Fraction(4, 3))
+
+
+def test_determinant():
+    assert solve_system([[2, 1, 0], [1, 3, 0]]).determinant == 5
+    assert solve_system([["1/2", 0, 0], [0, 3, 0]]).determinant == Fraction(3, 2)
+
+
+@pytest.mark.parametrize("eliminate_x", [True, False])
+def test_elimination_matches_exact_solver(eliminate_x, capsys):
+    # Including zero and fractional coefficients, which used to trip the steps up
+    rng = random.Random(int(eliminate_x))
+    values = [0, 1, -1, 2, -3, 0.5, -2.5, 4]
+    checked = 0
+    while checked < 500:
+        system = [[rng.choice(values) for _ in range(3)] for _ in range(2)]
+        exact = solve_system(system)
+        if exact.status != UNIQUE:
+            continue
+        x_value, y_value = solve_by_elimination(*system[0], *system[1], eliminate_x=eliminate_x)
+        assert x_value == pytest.approx(float(exact.values[0]))
+        assert y_value == pytest.approx(float(exact.values[1]))
+        checked += 1
+    capsys.readouterr()
+
+
+@pytest.mark.parametrize("text", ["inf", "-inf", "nan", "x"])
+def test_read_number_rejects(text, monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda prompt: text)
+    with pytest.raises(ValueError):
+        read_number("a₁: ")
+
+
+def test_read_number(monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda prompt: " 2.5 ")
+    assert read_number("a₁: ") == 2.5
+
+
+def test_solve_batch_matches_solve_system():
+    np = pytest.importorskip("numpy")
+    from CHAPTER4 import batch_statuses, random_batch, solve_batch
+
+    for systems in (random_batch(0, 5000), random_batch(1, 5000) / 4):
+        solution = solve_batch(systems)
+        statuses = batch_statuses(solution)
+        for index in range(0, len(systems), 7):
+            exact = solve_system(systems[index].tolist())
+            assert statuses[index] == exact.status
+            if exact.status == UNIQUE:
+                assert solution.x[index] == pytest.approx(float(exact.values[0]))
+                assert solution.y[index] == pytest.approx(float(exact.values[1]))
+            else:
+                assert np.isnan(solution.x[index]) and np.isnan(solution.y[index])
+
+
+def test_solve_batch_out_of_int64_range():
+    pytest.importorskip("numpy")
+    from CHAPTER4 import BATCH_INT_LIMIT, batch_statuses, solve_batch
+
+    big = BATCH_INT_LIMIT * 4
+    systems = [[[big, big, big], [big, big + 1, big]],
+               [[big, big, 1], [big, big, 2]]]
+    assert batch_statuses(solve_batch(systems)) == [UNIQUE, INCONSISTENT]
+
+
+def test_solve_batch_rejects_non_finite():
+    pytest.importorskip("numpy")
+    from CHAPTER4 import solve_batch
+
+    with pytest.raises(ValueError):
+        solve_batch([[[1, 1, 2], [1, -1, float("inf")]]])
@@ -0,0 +1,64 @@
+"""Tests for factor_batch's row parsing, chunk results and the ordered process pool."""
+
+import json
+
+import pytest
+
+from factor_batch import BatchOptions, factor_chunk, generate_worksheet, header_columns, parse_row
+from stream_pool import map_chunks, read_chunks
+
+
+TEXT = BatchOptions("x", "text", None)
+
+
+def test_parse_row_formats():
+    assert parse_row("5,6", None) == (1, 5, 6)
+    assert parse_row(" 2, -7, 3 ", None) == (2, -7, 3)
+    assert parse_row('{"b": 5, "c": 6}', None) == (1, 5, 6)
+    assert parse_row("[2, -7, 3]", None) == (2, -7, 3)
+    assert parse_row("9,2,-7,3", header_columns("id,a,b,c")) == (2, -7, 3)
+    assert parse_row("-7,3", header_columns("b,c")) == (1, -7, 3)
+
+
+@pytest.mark.parametrize("line", ["2.9,3", "x,3", "[2.9, 3]", '["5", 6]', "[true, 6]",
+                                  '{"b": 5}', "1,2,3,4", "0,5,6", "5,0"])
+def test_parse_row_rejects(line):
+    with pytest.raises(ValueError):
+        parse_row(line, None)
+
+
+def test_factor_chunk_keeps_errors_apart():
+    output, errors, counts = factor_chunk(10, ["5,6", "", "5,oops", "2,5", "[0, 2, 3]"], TEXT)
+    assert output == ["x² + 5x + 6 = (x + 2)(x + 3)", "x² + 2x + 5 = Prime"]
+    assert errors == ["line 12: invalid literal for int() with base 10: 'oops'",
+                      "line 14: a and c must not be 0"]
+    assert counts == {"factored": 1, "prime": 1, "error": 2}
+
+
+def test_factor_chunk_jsonl():
+    output, _, _ = factor_chunk(1, ["2,-7,3"], BatchOptions("y", "jsonl", None))
+    row = json.loads(output[0])
+    assert (row["line"], row["a"], row["b"], row["c"]) == (1, 2, -7, 3)
+    first_var_coef, first_const, second_var_coef, second_const = row["factors"]
+    assert (first_var_coef * second_var_coef, first_var_coef * second_const
+            + first_const * second_var_coef, first_const * second_const) == (2, -7, 3)
+
+
+def test_read_chunks_numbers_lines():
+    chunks = list(read_chunks(iter("abcdefg"), 3))
+    assert chunks == [(1, list("abc")), (4, list("def")), (7, ["g"])]
+    assert [first for first, _ in read_chunks(["xx"] * 5, 10, chunk_chars=4)] == [1, 3, 5]
+
+
+def test_workers_give_the_same_output(tmp_path):
+    path = tmp_path / "worksheet.csv"
+    with open(path, "w", encoding="utf-8") as worksheet:
+        generate_worksheet(3000, 3, 0, worksheet)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    columns = header_columns(lines[0])
+    options = BatchOptions("x", "csv", columns)
+    results = {workers: list(map_chunks(factor_chunk, read_chunks(lines[1:], 250, first_line=2),
+                                        options, workers))
+               for workers in (1, 2)}
+    assert results[1] == results[2]
+    assert sum(counts["factored"] + counts["prime"] for _, _, counts in results[1]) == 3000
@@ -0,0 +1,39 @@
+"""Tests for MATH2.find_factor_pair() against the original search."""
+
+import random
+
+import pytest
+
+from MATH2 import divisor_factor_pair, find_factor_pair, format_binomial, scan_factor_pair
+
+
+def test_matches_the_original_search():
+    # Same pair, signs and order as the original, including its misses
+    for middle_coef in range(-20, 21):
+        for constant in range(-40, 41):
+            assert find_factor_pair(middle_coef, constant) == scan_factor_pair(middle_coef, constant)
+
+
+def test_matches_the_divisor_search():
+    for middle_coef in range(-100, 101):
+        for constant in range(-200, 201):
+            assert find_factor_pair(middle_coef, constant) == divisor_factor_pair(middle_coef, constant)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_products_factor_back(seed):
+    rng = random.Random(seed)
+    for _ in range(2000):
+        first, second = (rng.choice((-1, 1)) * rng.randrange(1, 10 ** rng.randint(1, 300))
+                         for _ in range(2))
+        pair = find_factor_pair(first + second, first * second)
+        assert pair is not None and sorted(pair) == sorted((first, second))
+
+
+@pytest.mark.parametrize("middle_coef, constant", [(1, 1), (0, 2), (3, 1), (5, 0)])
+def test_unfactorable(middle_coef, constant):
+    assert find_factor_pair(middle_coef, constant) is None
+
+
+def test_format_binomial():
+    assert format_binomial("x", 3) + format_binomial("x", -2) == "(x + 3)(x - 2)"
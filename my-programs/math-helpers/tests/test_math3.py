@@ -0,0 +1,81 @@
+"""Tests for MATH3.find_factorization() and its formatting."""
+
+import random
+from math import gcd
+
+import pytest
+
+from MATH3 import (brute_force_factorable, expands_to, find_factorization,
+                   format_binomial_with_coefficient, format_quadratic, scan_factorization)
+
+
+def random_factors(rng: random.Random, digits: int) -> tuple[int, int, int, int]:
+    """(p, m, q, n) for (px + m)(qx + n), each nonzero with up to digits digits."""
+    return tuple(rng.choice((-1, 1)) * rng.randrange(1, 10 ** rng.randint(1, digits))
+                 for _ in range(4))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_products_factor_back(seed):
+    rng = random.Random(seed)
+    for _ in range(2000):
+        first_var_coef, first_const, second_var_coef, second_const = random_factors(rng, 40)
+        leading_coef = first_var_coef * second_var_coef
+        middle_coef = first_var_coef * second_const + second_var_coef * first_const
+        constant = first_const * second_const
+        result = find_factorization(leading_coef, middle_coef, constant)
+        assert result is not None
+        assert expands_to(result, leading_coef, middle_coef, constant)
+        # The documented form: p > 0, p <= |q| and (px + m) in lowest terms
+        assert 0 < result[0] <= abs(result[2])
+        assert gcd(result[0], result[1]) == 1
+
+
+def test_agrees_with_brute_force():
+    for leading_coef in range(-8, 9):
+        for middle_coef in range(-20, 21):
+            for constant in range(-20, 21):
+                if leading_coef == 0 or constant == 0:
+                    continue
+                result = find_factorization(leading_coef, middle_coef, constant)
+                assert (result is not None) == brute_force_factorable(leading_coef, middle_coef, constant)
+                if result is not None:
+                    assert expands_to(result, leading_coef, middle_coef, constant)
+
+
+def test_factors_whatever_the_original_factored():
+    # The original search only handled a > 0, and some of its answers are
+    # wrong; every right one must still be found
+    for leading_coef in range(1, 7):
+        for middle_coef in range(-12, 13):
+            for constant in range(-12, 13):
+                if constant == 0:
+                    continue
+                original = scan_factorization(leading_coef, middle_coef, constant)
+                if original is not None and expands_to(original, leading_coef, middle_coef, constant):
+                    assert find_factorization(leading_coef, middle_coef, constant) is not None
+
+
+def test_six_x_squared_minus_five_x_plus_one():
+    # The original's sign-case bug called this one prime
+    assert find_factorization(6, -5, 1) is not None
+
+
+@pytest.mark.parametrize("leading_coef, middle_coef, constant", [(1, 1, 1), (2, 3, 5), (1, 0, 2)])
+def test_primes_stay_prime(leading_coef, middle_coef, constant):
+    assert find_factorization(leading_coef, middle_coef, constant) is None
+
+
+@pytest.mark.parametrize("var_coef, constant, expected", [
+    (1, 3, "(x + 3)"),
+    (2, -3, "(2x - 3)"),
+    (-1, -2, "(-x - 2)"),
+    (-3, 0, "(-3x + 0)"),
+])
+def test_format_binomial_with_coefficient(var_coef, constant, expected):
+    assert format_binomial_with_coefficient(var_coef, "x", constant) == expected
+
+
+def test_format_quadratic_negative_leading():
+    assert format_quadratic("x", -1, -3, 2) == "-x² - 3x + 2"
+    assert format_quadratic("y", 2, 1, -5) == "2y² + 1y - 5"
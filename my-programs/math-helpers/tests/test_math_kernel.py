@@ -0,0 +1,78 @@
+"""Tests for math_kernel's factorizations, divisors and caches."""
+
+import random
+
+import pytest
+
+import math_kernel
+from math_kernel import LRUCache, divisors, is_prime, prime_factors
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    math_kernel.clear_caches()
+    yield
+    math_kernel.clear_caches()
+
+
+def multiply_out(factors: tuple) -> int:
+    product = 1
+    for prime, exponent in factors:
+        product *= prime ** exponent
+    return product
+
+
+def test_divisors_match_trial_division():
+    for number in range(-300, 301):
+        expected = tuple(divisor for divisor in range(1, abs(number) + 1) if number % divisor == 0)
+        assert divisors(number) == expected
+
+
+def test_is_prime_matches_trial_division():
+    for number in range(2000):
+        expected = number > 1 and all(number % divisor for divisor in range(2, int(number ** 0.5) + 1))
+        assert is_prime(number) == expected
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_prime_factors_multiply_back(seed):
+    rng = random.Random(seed)
+    for _ in range(300):
+        number = rng.randrange(2, 2 ** 64)
+        factors = prime_factors(number)
+        assert multiply_out(factors) == number
+        assert all(is_prime(prime) for prime, _ in factors)
+        assert [prime for prime, _ in factors] == sorted({prime for prime, _ in factors})
+
+
+def test_big_semiprime():
+    first, second = 1_000_000_007, 998_244_353
+    assert prime_factors(first * second) == ((second, 1), (first, 1))
+
+
+def test_cache_counts_hits():
+    divisors(360)
+    divisors(360)
+    hits, misses, entries = math_kernel.cache_stats()["divisors"]
+    assert (hits, misses, entries) == (1, 1, 1)
+
+
+def test_save_and_load(tmp_path):
+    numbers = [360, 2 ** 61 - 1, 10 ** 12 + 39]
+    expected = [prime_factors(number) for number in numbers]
+    path = str(tmp_path / "factors.json")
+    assert math_kernel.save_cache(path) == len(numbers)
+    math_kernel.clear_caches()
+    assert math_kernel.load_cache(path) == len(numbers)
+    assert [math_kernel.FACTOR_CACHE.get(number) for number in numbers] == expected
+    assert math_kernel.load_cache(str(tmp_path / "missing.json")) == 0
+
+
+def test_lru_cache_evicts_the_oldest():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
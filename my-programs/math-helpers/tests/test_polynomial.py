@@ -0,0 +1,77 @@
+"""Tests for polynomial.py's multiplication methods and long division."""
+
+import random
+from fractions import Fraction
+
+import pytest
+
+from polynomial import (divide, divide_naive, long_division, multiply, multiply_karatsuba,
+                        multiply_kronecker, multiply_naive, trim)
+
+
+def random_polynomial(rng: random.Random, degree: int, size: int) -> list[int]:
+    """Whole coefficients up to size, with a nonzero leading one."""
+    return [rng.choice((-1, 1)) * rng.randint(1, size)] + [rng.randint(-size, size) for _ in range(degree)]
+
+
+@pytest.mark.parametrize("size", [1, 10 ** 6, 10 ** 40])
+def test_every_method_matches_schoolbook(size):
+    rng = random.Random(size)
+    for degrees in [(0, 0), (1, 5), (40, 40), (100, 300)]:
+        first, second = (random_polynomial(rng, degree, size) for degree in degrees)
+        expected = multiply_naive(first, second)
+        assert multiply(first, second) == expected
+        assert multiply_kronecker(first, second) == expected
+        assert multiply_karatsuba(first, second) == expected
+
+
+def test_fractions_multiply_exactly():
+    rng = random.Random(0)
+    first = [Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(80)]
+    second = [Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(70)]
+    assert multiply(first, second) == multiply_naive(first, second)
+
+
+def test_floats_multiply_closely():
+    pytest.importorskip("numpy")
+    rng = random.Random(1)
+    first = [rng.uniform(-1, 1) for _ in range(200)]
+    second = [rng.uniform(-1, 1) for _ in range(150)]
+    assert multiply(first, second) == pytest.approx(multiply_naive(first, second), abs=1e-9)
+
+
+def add(first: list, second: list) -> list:
+    """first + second, lined up at the constant term."""
+    length = max(len(first), len(second))
+    first = [0] * (length - len(first)) + list(first)
+    second = [0] * (length - len(second)) + list(second)
+    return trim([a + b for a, b in zip(first, second)])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_division_round_trip(seed):
+    rng = random.Random(seed)
+    for _ in range(50):
+        divisor = random_polynomial(rng, rng.randint(0, 8), 50)
+        dividend = random_polynomial(rng, rng.randint(0, 30), 50)
+        quotient, remainder = divide(dividend, divisor)
+        assert (quotient, remainder) == divide_naive(dividend, divisor)
+        assert add(multiply(quotient, divisor), remainder) == trim(dividend)
+        assert remainder == [0] or len(remainder) < len(divisor)
+
+
+def test_monic_division_stays_whole():
+    quotient, remainder = divide([1, 0, 0, -1], [1, -1])
+    assert (quotient, remainder) == ([1, 1, 1], [0])
+    assert all(type(coef) is int for coef in quotient)
+
+
+def test_long_division_steps():
+    division = long_division([2, 3, 0, 0, 5], [1, 0, -1])
+    assert (division.quotient, division.remainder) == ([2, 3, 2], [3, 7])
+    assert [coef for coef, _ in division.steps] == division.quotient
+
+
+def test_division_by_zero_polynomial():
+    with pytest.raises(ZeroDivisionError):
+        divide([1, 2], [0, 0])
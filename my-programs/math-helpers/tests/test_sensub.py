@@ -0,0 +1,76 @@
+"""Tests for SENSUB's root search, evaluation and exact display."""
+
+import random
+from fractions import Fraction
+
+import pytest
+
+import polynomial
+from SENSUB import (display_synthetic_division_table, evaluate_many, find_rational_roots,
+                    find_rational_roots_by_hand, format_number, format_polynomial,
+                    perform_synthetic_division)
+
+
+def planted_polynomial(rng: random.Random) -> tuple[list[int], list[Fraction]]:
+    """A polynomial with a few rational roots, some repeated, times a random rest."""
+    roots = []
+    for _ in range(rng.randint(1, 3)):
+        root = Fraction(rng.randint(-9, 9), rng.randint(1, 5))
+        roots += [root] * rng.randint(1, 4)
+    product = [1]
+    for _ in range(rng.randint(0, 4)):
+        product = polynomial.multiply(product, [rng.randint(1, 5), rng.randint(-20, 20),
+                                                rng.randint(-20, 20)])
+    for root in roots:
+        product = polynomial.multiply(product, [root.denominator, -root.numerator])
+    return product, sorted(roots)
+
+
+@pytest.mark.parametrize("numeric", [True, False])
+def test_matches_synthetic_division_by_hand(numeric):
+    if numeric:
+        pytest.importorskip("numpy")
+    rng = random.Random(int(numeric))
+    for _ in range(100):
+        coefficients, planted = planted_polynomial(rng)
+        roots = find_rational_roots(coefficients, numeric).roots
+        assert roots == find_rational_roots_by_hand(coefficients)
+        assert all(root in roots for root in planted)
+
+
+def test_huge_prime_roots():
+    pytest.importorskip("numpy")
+    first, second = 12345678901234567891, 98765432109876543211
+    search = find_rational_roots(polynomial.multiply([1, -first], [3, -second]))
+    assert search.roots == sorted([Fraction(first), Fraction(second, 3)])
+
+
+def test_evaluate_many_matches_synthetic_division():
+    rng = random.Random(0)
+    coefficients = [rng.randint(-50, 50) for _ in range(12)]
+    points = [Fraction(rng.randint(-20, 20), rng.randint(1, 9)) for _ in range(50)]
+    expected = [perform_synthetic_division([Fraction(coef) for coef in coefficients], point)[-1]
+                for point in points]
+    assert evaluate_many(coefficients, points) == expected
+    floats = evaluate_many([float(coef) for coef in coefficients], [float(point) for point in points])
+    assert floats == pytest.approx([float(value) for value in expected])
+
+
+def test_format_number():
+    assert format_number(2.5) == "2.5"
+    assert format_number(Fraction(1, 3)) == "1/3"
+    assert format_number(10 ** 400) == "1" + "0" * 400
+
+
+def test_format_polynomial_with_fractions():
+    assert format_polynomial([Fraction(1, 2), Fraction(-1, 3), 1, Fraction(-2, 5)]) == \
+        "(1/2)x^3 - (1/3)x^2 + x - 2/5"
+
+
+def test_table_shows_exact_remainder(capsys):
+    root = 12345678901234567891
+    result = display_synthetic_division_table([3, -3 * root - 1, root], root)
+    assert result[-1] == 0
+    output = capsys.readouterr().out
+    assert "Remainder: 0" in output
+    assert f"(x - {root}) is a factor!" in output
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+timing.py - Shared timing helpers for the math helpers' benchmarks
+
+Not a conversion of any single .BAS file. Every --benchmark in this
+folder times a call and prints how long it took; these are the two
+helpers they all use:
+
+- timed(function, *args) calls function once and returns its result and
+  the seconds it took.
+- format_seconds(seconds) prints a duration in µs, ms or s.
+
+There is no command line; run a helper's --benchmark instead.
+"""
+
+import time
+
+
+def format_seconds(seconds: float) -> str:
+    """A duration like 3.2 µs, 15.0 ms or 2.41 s."""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def timed(function, *args) -> tuple:
+    """function(*args) and the seconds it took."""
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
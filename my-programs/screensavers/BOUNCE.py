@@ -9,21 +9,25 @@ Animated bouncing circle with a line connecting to screen center.
 Circle bounces off edges and changes color randomly. Radius grows
 and shrinks, controllable with spacebar.
 
+Like the original, each frame erases the previous circle and line by
+drawing them in black, and only the rectangles that changed are sent to
+the display. Use --full-flip for the old clear-and-flip behavior and
+--benchmark to compare the two. --seed, --record and --replay make a
+run reproducible (see saver_engine.py).
+
 Controls:
   SPACE - Toggle radius growth on/off
+  F3 - Frame-time HUD
   ESC or close window to quit
 """
 
-import pygame
-import random
-import sys
+import argparse
+
+from saver_engine import Scene, add_display_arguments, add_replay_arguments, draw_line, saver_main
+from saver_startup import lazy_import
 
+pygame = lazy_import("pygame")
 
-# VGA Screen 12 dimensions
-SCREEN_WIDTH = 640
-SCREEN_HEIGHT = 480
-CENTER_X = SCREEN_WIDTH // 2
-CENTER_Y = SCREEN_HEIGHT // 2
 
 # VGA 16-color palette (colors 1-14 for variety)
 VGA_PALETTE = [
@@ -46,73 +50,108 @@ VGA_PALETTE = [
 ]
 
 
-def main():
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("BOUNCE.py - Bouncing Circle (SPACE=toggle size, ESC=quit)")
-    clock = pygame.time.Clock()
-
-    # Circle state
-    x = CENTER_X
-    y = CENTER_Y
-    radius = 20
-    dir_x = 2
-    dir_y = 2
-    radius_change = 1
-    radius_active = True  # radon = -1 in original means active
-
-    running = True
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-                elif event.key == pygame.K_SPACE:
-                    radius_active = not radius_active
+class BounceScene(Scene):
+    """Bouncing circle with a line to the screen center (BOUNCE.BAS)."""
+
+    name = "BOUNCE"
+    caption = "BOUNCE.py - Bouncing Circle (SPACE=toggle size, ESC=quit)"
+    input_keys = ("space",)
+
+    def __init__(self, size, rng):
+        super().__init__(size, rng)
+        self.center_x = self.width // 2
+        self.center_y = self.height // 2
+
+        # Circle state (speeds and sizes grow with the window in --native)
+        self.x = self.center_x
+        self.y = self.center_y
+        self.radius = 20 * self.scale
+        self.dir_x = 2 * self.scale
+        self.dir_y = 2 * self.scale
+        self.radius_change = self.scale
+        self.radius_active = True  # radon = -1 in original means active
+
+        # (x, y, radius, color) to draw this frame, and the one drawn last
+        # frame (oldx, oldy, oldrad in original)
+        self.shape = None
+        self.old_shape = None
+
+    def handle_key(self, key):
+        if key == pygame.K_SPACE:
+            self.radius_active = not self.radius_active
+
+    def update(self):
+        scale = self.scale
 
         # Bounce off edges (check with radius)
-        if x - radius <= 0:
-            dir_x = random.randint(1, 3)
-        if x + radius >= SCREEN_WIDTH:
-            dir_x = -random.randint(1, 3)
-        if y - radius <= 0:
-            dir_y = random.randint(1, 3)
-        if y + radius >= SCREEN_HEIGHT:
-            dir_y = -random.randint(1, 3)
+        if self.x - self.radius <= 0:
+            self.dir_x = self.rng.randint(1, 3) * scale
+        if self.x + self.radius >= self.width:
+            self.dir_x = -self.rng.randint(1, 3) * scale
+        if self.y - self.radius <= 0:
+            self.dir_y = self.rng.randint(1, 3) * scale
+        if self.y + self.radius >= self.height:
+            self.dir_y = -self.rng.randint(1, 3) * scale
 
         # Radius bounds
-        if radius >= 100:
-            radius_change = -1
-        if radius <= 5:
-            radius_change = 1
-
-        # Clear screen (original erased old shapes individually, we just clear)
-        screen.fill((0, 0, 0))
+        if self.radius >= 100 * scale:
+            self.radius_change = -scale
+        if self.radius <= 5 * scale:
+            self.radius_change = scale
 
         # Pick random color for circle
-        color = VGA_PALETTE[random.randint(1, 14)]
+        color = VGA_PALETTE[self.rng.randint(1, 14)]
+        self.shape = (round(self.x), round(self.y), round(self.radius), color)
+
+        # Update position
+        self.x += self.dir_x
+        self.y += self.dir_y
+
+        # Update radius if active
+        if self.radius_active:
+            self.radius += self.radius_change
+
+    def draw(self, surface):
+        center = (self.center_x, self.center_y)
+        dirty_rects = []
+
+        # Erase old shapes individually, like the original
+        if self.old_shape is not None:
+            old_x, old_y, old_radius, _ = self.old_shape
+            dirty_rects.extend(draw_line(surface, (0, 0, 0), center, (old_x, old_y),
+                                         self.line_width))
+            dirty_rects.append(pygame.draw.circle(surface, (0, 0, 0), (old_x, old_y),
+                                                  old_radius, self.line_width))
+
+        x, y, radius, color = self.shape
 
         # Draw line from center to circle position
-        pygame.draw.line(screen, (255, 255, 255), (CENTER_X, CENTER_Y), (x, y))
+        dirty_rects.extend(draw_line(surface, (255, 255, 255), center, (x, y),
+                                     self.line_width))
 
         # Draw circle
-        pygame.draw.circle(screen, color, (x, y), radius, 1)
+        dirty_rects.append(pygame.draw.circle(surface, color, (x, y), radius,
+                                              self.line_width))
 
-        # Update position
-        x += dir_x
-        y += dir_y
+        self.old_shape = self.shape
+        return dirty_rects
+
+    def object_counts(self):
+        return {"radius": round(self.radius)}
 
-        # Update radius if active
-        if radius_active:
-            radius += radius_change
 
-        pygame.display.flip()
-        clock.tick(60)
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="BOUNCE.py - Bouncing Circle (Python port of BOUNCE.BAS)",
+    )
+    add_display_arguments(parser)
+    add_replay_arguments(parser)
+    return parser.parse_args()
 
-    pygame.quit()
-    sys.exit()
+
+def main():
+    saver_main(BounceScene, parse_args())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+BOUNCE3.py - Colliding Circles Screensaver
+
+Original: BOUNCE3.BAS (~1995)
+Converted to modern Python with pygame and NumPy
+
+BOUNCE3.BAS bounced two circles, each flashing the color of whichever
+wall it hit for ten frames, and turned them around when they met (more or
+less: see collide()). This version bounces any number of
+circles, thousands of them, off the walls and off each other, with
+elastic collisions weighted by area.
+
+Checking every circle against every other is n * (n - 1) / 2 distance
+tests a frame: 50 million at 10,000 circles. Instead the circles are
+hashed into a uniform grid of cells at least one diameter wide, rebuilt
+from the position arrays every frame with one sort, so a circle can only
+touch circles in its own cell or the 8 around it. Candidate pairs from
+each cell and 4 of its neighbors (the other 4 are covered from the other
+side) are generated with array arithmetic, then tested and resolved in
+one vectorized narrow phase.
+
+Usage:
+  python BOUNCE3.py                      # 200 circles
+  python BOUNCE3.py --balls 5000
+  python BOUNCE3.py --broad-phase naive  # all pairs, for comparison
+  python BOUNCE3.py --collision-scaling  # grid vs all pairs, 100 to 10k
+
+The display, benchmark and replay options shared by all savers are
+described in saver_engine.py.
+
+Controls:
+  F3 - Frame-time HUD
+  ESC or close window to quit
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from saver_engine import Scene, add_display_arguments, add_replay_arguments, saver_main
+from saver_raster import grid_pairs
+from saver_startup import lazy_import
+
+np = lazy_import("numpy")
+pygame = lazy_import("pygame")
+
+
+NUM_BALLS = 200
+
+# EGA/VGA 16-color palette
+VGA_PALETTE = [
+    (0, 0, 0),        # 0: Black (background)
+    (0, 0, 170),      # 1: Blue
+    (0, 170, 0),      # 2: Green
+    (0, 170, 170),    # 3: Cyan
+    (170, 0, 0),      # 4: Red
+    (170, 0, 170),    # 5: Magenta
+    (170, 85, 0),     # 6: Brown
+    (170, 170, 170),  # 7: Light Gray
+    (85, 85, 85),     # 8: Dark Gray
+    (85, 85, 255),    # 9: Light Blue
+    (85, 255, 85),    # 10: Light Green
+    (85, 255, 255),   # 11: Light Cyan
+    (255, 85, 85),    # 12: Light Red
+    (255, 85, 255),   # 13: Light Magenta
+    (255, 255, 85),   # 14: Yellow
+    (255, 255, 255),  # 15: White
+]
+
+# Original: each wall lights up in its own color when hit
+LEFT_WALL_COLOR = 11
+RIGHT_WALL_COLOR = 15
+TOP_WALL_COLOR = 13
+BOTTOM_WALL_COLOR = 14
+
+# Original: IF count > 10 THEN hit = 0
+HIT_FRAMES = 10
+
+# Original: rad = (RND * 149) + 1. With many circles the radius shrinks so
+# they cover about this share of the screen.
+MAX_RADIUS = 150
+SCREEN_COVERAGE = 0.3
+
+# Original: dirx = INT(RND * 3), either sign
+MAX_SPEED = 2.0
+SPEED_LIMIT = 2 * MAX_SPEED
+MINIMUM_SPEED = 0.5
+
+# Grid vs naive table sizes for --collision-scaling
+SCALING_SIZES = (100, 500, 1000, 2000, 5000, 10000)
+
+# Rows of the naive all-pairs check handled per block, to bound memory
+NAIVE_BLOCK_ELEMENTS = 4_000_000
+
+def naive_pairs(x: np.ndarray, y: np.ndarray, radius: np.ndarray
+                ) -> tuple[np.ndarray, np.ndarray]:
+    """Every overlapping pair found by testing all n * (n - 1) / 2 pairs."""
+    count = len(x)
+    block = max(1, NAIVE_BLOCK_ELEMENTS // max(count, 1))
+    firsts, seconds = [], []
+    for start in range(0, count, block):
+        rows = np.arange(start, min(count, start + block))
+        delta_x = x[None, :] - x[rows, None]
+        delta_y = y[None, :] - y[rows, None]
+        reach = radius[None, :] + radius[rows, None]
+        touching = delta_x * delta_x + delta_y * delta_y < reach * reach
+        touching &= np.arange(count)[None, :] > rows[:, None]
+        row_index, column = np.nonzero(touching)
+        firsts.append(rows[row_index])
+        seconds.append(column)
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+def overlapping(x: np.ndarray, y: np.ndarray, radius: np.ndarray,
+                first: np.ndarray, second: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Narrow phase: keep the candidate pairs whose circles actually overlap."""
+    delta_x = x[second] - x[first]
+    delta_y = y[second] - y[first]
+    reach = radius[first] + radius[second]
+    touching = delta_x * delta_x + delta_y * delta_y < reach * reach
+    return first[touching], second[touching]
+
+
+class ManyBounceScene(Scene):
+    """Thousands of circles bouncing off the walls and each other (BOUNCE3.BAS)."""
+
+    name = "BOUNCE3"
+    caption = "BOUNCE3.py - Colliding Circles (ESC to quit)"
+    per_frame_counts = ("circles",)
+
+    def __init__(self, size, rng, balls=NUM_BALLS, broad_phase="grid"):
+        super().__init__(size, rng, balls=balls, broad_phase=broad_phase)
+        self.num_balls = balls
+        self.broad_phase = broad_phase
+        self.ball_rng = ball_rng = np.random.default_rng(rng.getrandbits(64))
+
+        largest = min(MAX_RADIUS * self.scale,
+                      np.sqrt(SCREEN_COVERAGE * self.width * self.height / (np.pi * balls)))
+        self.radius = ball_rng.uniform(0.5, 1.0, balls) * max(largest, 1.0)
+        self.mass = self.radius * self.radius
+        self.x = ball_rng.uniform(self.radius, self.width - self.radius)
+        self.y = ball_rng.uniform(self.radius, self.height - self.radius)
+        speed = MAX_SPEED * self.scale
+        self.speed_limit = SPEED_LIMIT * self.scale
+        self.minimum_speed = MINIMUM_SPEED * self.scale
+        self.velocity_x = ball_rng.uniform(-speed, speed, balls)
+        self.velocity_y = ball_rng.uniform(-speed, speed, balls)
+
+        # Original: derek = (RND * 15) + 1, and a wall color for 10 frames after a hit
+        self.color = ball_rng.integers(1, 16, balls)
+        self.hit_color = np.zeros(balls, dtype=np.intp)
+        self.hit_frames = np.zeros(balls, dtype=np.intp)
+        self.walls_hit = []
+        self.collisions = 0
+
+    def bounce_off_walls(self):
+        """Reflect circles that reached a wall and flash them in its color."""
+        x, y, radius = self.x, self.y, self.radius
+        self.walls_hit = []
+        for hit, velocity, sign, color in (
+                (x - radius <= 0, self.velocity_x, 1, LEFT_WALL_COLOR),
+                (x + radius >= self.width, self.velocity_x, -1, RIGHT_WALL_COLOR),
+                (y - radius <= 0, self.velocity_y, 1, TOP_WALL_COLOR),
+                (y + radius >= self.height, self.velocity_y, -1, BOTTOM_WALL_COLOR)):
+            if hit.any():
+                velocity[hit] = sign * np.abs(velocity[hit])
+                self.hit_color[hit] = color
+                self.hit_frames[hit] = HIT_FRAMES
+                self.walls_hit.append(color)
+        # Collisions may have pushed circles past a wall; put them back
+        np.clip(x, radius, self.width - radius, out=x)
+        np.clip(y, radius, self.height - radius, out=y)
+
+    def candidate_pairs(self) -> tuple[np.ndarray, np.ndarray]:
+        if self.broad_phase == "naive":
+            return naive_pairs(self.x, self.y, self.radius)
+        return grid_pairs(self.x, self.y, 2 * float(self.radius.max()),
+                          self.width, self.height)
+
+    def collide(self):
+        """
+        Elastic collisions between overlapping circles, all pairs at once.
+
+        The original only flipped the direction signs when one circle's
+        edge had passed the other's (and its last check sets diry from
+        -NT(RND * 3), a typo QBasic happily reads as an undefined array).
+        """
+        first, second = overlapping(self.x, self.y, self.radius, *self.candidate_pairs())
+        self.collisions = len(first)
+        if not self.collisions:
+            return
+
+        delta_x = self.x[second] - self.x[first]
+        delta_y = self.y[second] - self.y[first]
+        distance = np.maximum(np.hypot(delta_x, delta_y), 1e-9)
+        normal_x = delta_x / distance
+        normal_y = delta_y / distance
+        total_mass = self.mass[first] + self.mass[second]
+        share_first = self.mass[second] / total_mass
+        share_second = self.mass[first] / total_mass
+
+        # Push the circles apart along the line between their centers
+        overlap = self.radius[first] + self.radius[second] - distance
+        np.add.at(self.x, first, -normal_x * overlap * share_first)
+        np.add.at(self.y, first, -normal_y * overlap * share_first)
+        np.add.at(self.x, second, normal_x * overlap * share_second)
+        np.add.at(self.y, second, normal_y * overlap * share_second)
+
+        # Exchange momentum along the normal if they are moving together
+        closing = ((self.velocity_x[second] - self.velocity_x[first]) * normal_x
+                   + (self.velocity_y[second] - self.velocity_y[first]) * normal_y)
+        impulse = np.where(closing < 0, 2 * closing, 0.0)
+        np.add.at(self.velocity_x, first, impulse * share_first * normal_x)
+        np.add.at(self.velocity_y, first, impulse * share_first * normal_y)
+        np.add.at(self.velocity_x, second, -impulse * share_second * normal_x)
+        np.add.at(self.velocity_y, second, -impulse * share_second * normal_y)
+
+    def update(self):
+        self.x += self.velocity_x
+        self.y += self.velocity_y
+        self.collide()
+        self.bounce_off_walls()
+
+        # All contacts are resolved at once from the same velocities, so a
+        # circle caught between several others can get several full kicks;
+        # cap the speed so crowds never heat up
+        speed = np.hypot(self.velocity_x, self.velocity_y)
+        too_fast = speed > self.speed_limit
+        if too_fast.any():
+            slow_down = self.speed_limit / speed[too_fast]
+            self.velocity_x[too_fast] *= slow_down
+            self.velocity_y[too_fast] *= slow_down
+
+        # Original: IF x = oldx THEN pick a new direction. Circles that have
+        # all but stopped get a new random velocity, so crowds never settle.
+        stalled = speed < self.minimum_speed
+        count = int(np.count_nonzero(stalled))
+        if count:
+            top_speed = MAX_SPEED * self.scale
+            self.velocity_x[stalled] = self.ball_rng.uniform(-top_speed, top_speed, count)
+            self.velocity_y[stalled] = self.ball_rng.uniform(-top_speed, top_speed, count)
+        self.hit_frames[self.hit_frames > 0] -= 1
+
+    def draw(self, surface):
+        surface.fill((0, 0, 0))
+
+        # Original: LINE (1, 1)-(1, ymax), 11 and friends, drawn on a hit
+        right, bottom = self.width - 1, self.height - 1
+        wall_lines = {
+            LEFT_WALL_COLOR: ((0, 0), (0, bottom)),
+            RIGHT_WALL_COLOR: ((right, 0), (right, bottom)),
+            TOP_WALL_COLOR: ((0, 0), (right, 0)),
+            BOTTOM_WALL_COLOR: ((0, bottom), (right, bottom)),
+        }
+        for color in self.walls_hit:
+            pygame.draw.line(surface, VGA_PALETTE[color], *wall_lines[color], self.line_width)
+
+        colors = np.where(self.hit_frames > 0, self.hit_color, self.color)
+        palette = VGA_PALETTE
+        circle = pygame.draw.circle
+        width = self.line_width
+        for x, y, radius, color in zip(self.x.astype(int).tolist(), self.y.astype(int).tolist(),
+                                       np.maximum(self.radius, 1).astype(int).tolist(),
+                                       colors.tolist()):
+            circle(surface, palette[color], (x, y), radius, width)
+        return None  # everything moves
+
+    def object_counts(self):
+        return {"circles": self.num_balls, "collisions": self.collisions}
+
+
+def time_call(function, *args, min_seconds: float = 0.3) -> tuple[float, object]:
+    """Average seconds per call over at least min_seconds, and the last result."""
+    calls = 0
+    started = time.perf_counter()
+    while True:
+        result = function(*args)
+        calls += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            return elapsed / calls, result
+
+
+def measure_collision_scaling(size: tuple[int, int], seed: int, max_balls: int):
+    """Print grid vs all-pairs collision detection cost as the circle count grows."""
+    print(f"Collision detection, {size[0]}x{size[1]}, seed {seed} "
+          f"(broad + narrow phase, ms per frame)")
+    print(f"{'circles':>8} {'candidates':>11} {'overlaps':>9} "
+          f"{'grid':>9} {'all pairs':>10} {'speedup':>8}")
+
+    for count in (n for n in SCALING_SIZES if n <= max_balls):
+        scene = ManyBounceScene(size, random.Random(seed), balls=count)
+        for _ in range(30):  # let the starting positions mix a little
+            scene.update()
+        x, y, radius = scene.x, scene.y, scene.radius
+        cell_size = 2 * float(radius.max())
+
+        def grid_frame():
+            return overlapping(x, y, radius, *grid_pairs(x, y, cell_size, *size))
+
+        grid_seconds, grid_found = time_call(grid_frame)
+        naive_seconds, naive_found = time_call(naive_pairs, x, y, radius)
+        candidates = len(grid_pairs(x, y, cell_size, *size)[0])
+
+        # Both must find exactly the same overlapping pairs
+        grid_set = set(zip(*(np.sort(np.stack(grid_found), axis=0).tolist())))
+        naive_set = set(zip(*(np.sort(np.stack(naive_found), axis=0).tolist())))
+        if grid_set != naive_set:
+            raise AssertionError(f"grid and all-pairs disagree at {count} circles")
+
+        print(f"{count:>8,} {candidates:>11,} {len(grid_set):>9,} "
+              f"{grid_seconds * 1000:>9.3f} {naive_seconds * 1000:>10.3f} "
+              f"{naive_seconds / grid_seconds:>7.1f}x")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="BOUNCE3.py - Colliding Circles (Python port of BOUNCE3.BAS)",
+    )
+    parser.add_argument(
+        "--balls", type=int, default=None,
+        help=f"Number of circles (default: {NUM_BALLS}; with --collision-scaling, "
+             f"the largest size tried, default {SCALING_SIZES[-1]:,})",
+    )
+    parser.add_argument(
+        "--broad-phase", choices=("grid", "naive"), default="grid",
+        help="Find colliding pairs with the spatial hash grid or by testing all pairs",
+    )
+    parser.add_argument(
+        "--collision-scaling", action="store_true",
+        help="Compare grid and all-pairs collision cost from 100 up to --balls circles, then exit",
+    )
+    add_display_arguments(parser)
+    add_replay_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.collision_scaling:
+        measure_collision_scaling(args.size, args.seed or 0, args.balls or SCALING_SIZES[-1])
+        return
+    saver_main(ManyBounceScene, args,
+               {"balls": args.balls or NUM_BALLS, "broad_phase": args.broad_phase})
+
+
+if __name__ == "__main__":
+    main()
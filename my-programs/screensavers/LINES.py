@@ -8,23 +8,65 @@ Converted to modern Python with pygame
 Draws random colored lines radiating from screen center with an
 oscillating Y coordinate that creates a wave pattern.
 
+The screen is never cleared, so each frame only uploads the bounding
+boxes of the ten new lines. Use --full-flip for the old whole-window
+flip and --benchmark to compare the two. --seed, --record and --replay
+make a run reproducible (see saver_engine.py).
+
+Left alone for a few minutes the never-cleared screen is solid color and
+every further line is wasted work. --accumulate instead draws into a
+float32 intensity buffer held in NumPy: each frame's lines are rasterized
+together (every pixel of every line is one array element, summed into the
+buffer with np.bincount), the whole buffer fades with one multiply, and a
+log tone map turns it into palette indexes for an 8-bit surface whose
+palette ramps through the VGA blues to white, blitted in one go. The
+original's random colors become brightness: the busier a pixel, the
+whiter it glows, and old lines fade out instead of piling up.
+
+--lines sets the lines per frame, from the original's 10 up to 100,000;
+--benchmark reports lines per second for either mode.
+
+Usage:
+  python LINES.py
+  python LINES.py --accumulate --lines 2000
+  python LINES.py --accumulate --lines 100000 --benchmark 100
+
 Controls:
+  F3 - Frame-time HUD
   ESC or close window to quit
 """
 
-import pygame
-import random
-import sys
-import os
+import argparse
+
+from saver_engine import Scene, add_display_arguments, add_replay_arguments, draw_line, saver_main
+from saver_startup import lazy_import
+
+pygame = lazy_import("pygame")
+try:
+    np = lazy_import("numpy")
+    from saver_raster import rasterize_segments
+except ImportError:  # only --accumulate needs NumPy
+    np = None
+
+# Fix for macOS window not appearing in front (applied by saver_main when
+# the window opens, not on import)
+WINDOW_POSITION = (100, 100)
+
+# Line endpoint ranges on the original 640x480 screen (B and D)
+ENDPOINT_X_RANGE = 1000
+ENDPOINT_Y_RANGE = 500
 
-# Fix for macOS window not appearing in front
-os.environ['SDL_VIDEO_WINDOW_POS'] = '100,100'
+# Lines drawn per frame
+LINES_PER_FRAME = 10
+MAX_LINES_PER_FRAME = 100_000
 
-# VGA Screen 12 dimensions
-SCREEN_WIDTH = 640
-SCREEN_HEIGHT = 480
-CENTER_X = 320
-CENTER_Y = 240
+# Accumulation mode: share of intensity kept each frame
+FADE = 0.97
+# Intensity shown as white, as a multiple of the screen's average
+WHITE_POINT = 4.0
+
+# Accumulation colormap stops: black, then VGA blue, light blue, light cyan, white
+COLORMAP_STOPS = [0, 1, 9, 11, 15]
 
 # VGA 16-color palette (colors 1-15, skipping 0/black)
 VGA_PALETTE = [
@@ -47,57 +89,157 @@ VGA_PALETTE = [
 ]
 
 
-def main():
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("LINES.py - Radial Lines (ESC to quit)")
-    clock = pygame.time.Clock()
-
-    # macOS: Bring window to front
-    if sys.platform == 'darwin':
-        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.event.pump()
-
-    # Fill with black initially
-    screen.fill((0, 0, 0))
-    pygame.display.flip()
-
-    # D oscillates between 0 and 500, creating wave pattern
-    d = 0
-    direction = 1  # 1 = increasing, -1 = decreasing
-
-    running = True
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
+def build_colormap() -> list:
+    """256-entry palette ramping through COLORMAP_STOPS of the VGA palette."""
+    palette = []
+    segments = len(COLORMAP_STOPS) - 1
+    for index in range(256):
+        position = index / 255 * segments
+        stop = min(int(position), segments - 1)
+        blend = position - stop
+        low = VGA_PALETTE[COLORMAP_STOPS[stop]]
+        high = VGA_PALETTE[COLORMAP_STOPS[stop + 1]]
+        palette.append(tuple(round(a + (b - a) * blend) for a, b in zip(low, high)))
+    return palette
+
+
+class LinesScene(Scene):
+    """Random colored lines from the screen center (LINES.BAS)."""
+
+    name = "LINES"
+    caption = "LINES.py - Radial Lines (ESC to quit)"
+    per_frame_counts = ("lines",)
+    window_position = WINDOW_POSITION
+
+    def __init__(self, size, rng, lines_per_frame=LINES_PER_FRAME, accumulate=False):
+        super().__init__(size, rng, lines_per_frame=lines_per_frame, accumulate=accumulate)
+        self.lines_per_frame = lines_per_frame
+        self.accumulate = accumulate
+        self.center_x = self.width // 2
+        self.center_y = self.height // 2
+
+        # Scale the original endpoint ranges to the scene size
+        self.endpoint_x_max = ENDPOINT_X_RANGE * self.width // 640
+        self.endpoint_y_max = ENDPOINT_Y_RANGE * self.height // 480
+        self.d_step = self.scale
+
+        # D oscillates between 0 and 500, creating wave pattern
+        self.d = 0
+        self.direction = 1  # 1 = increasing, -1 = decreasing
+
+        # (color, endpoint) of the lines to draw this frame
+        self.new_lines = []
+        self.lines_drawn = 0
+
+        if accumulate:
+            # Endpoint arrays for this frame, from a generator seeded by rng
+            self.line_rng = np.random.default_rng(rng.getrandbits(64))
+            self.end_x = self.end_y = np.empty(0)
+            self.intensity = np.zeros((self.height, self.width), dtype=np.float32)
+            self.canvas = None
+
+    def update(self):
+        if self.accumulate:
+            self.update_arrays()
+            return
 
         # Draw multiple lines per frame for faster visual effect
-        for _ in range(10):
+        self.new_lines = []
+        for _ in range(self.lines_per_frame):
             # Pick random color (1-15, avoiding black)
-            color = VGA_PALETTE[random.randint(1, 15)]
+            color = VGA_PALETTE[self.rng.randint(1, 15)]
 
             # Random X endpoint (0-1000 in original)
-            b = random.randint(0, 1000)
-
-            # Draw line from center to (b, d)
-            pygame.draw.line(screen, color, (CENTER_X, CENTER_Y), (b, d))
+            b = self.rng.randint(0, self.endpoint_x_max)
+            self.new_lines.append((color, (b, round(self.d))))
 
             # Update D with oscillation
-            d += direction
-            if d > 500:
-                direction = -1
-            elif d < 0:
-                direction = 1
+            self.d += self.direction * self.d_step
+            if self.d > self.endpoint_y_max:
+                self.direction = -1
+            elif self.d < 0:
+                self.direction = 1
+
+    def update_arrays(self):
+        """The same endpoints as update(), a whole frame's worth at once."""
+        count = self.lines_per_frame
+        self.end_x = self.line_rng.integers(0, self.endpoint_x_max + 1, count).astype(np.float64)
+
+        # D bounces between 0 and the bottom of the range: a triangle wave
+        period = 2 * self.endpoint_y_max
+        travel = self.d + self.d_step * np.arange(count)
+        wrapped = np.mod(travel, period)
+        self.end_y = np.rint(np.where(wrapped <= self.endpoint_y_max, wrapped, period - wrapped))
+        self.d = float((self.d + self.d_step * count) % period)
+
+    def start(self, surface):
+        super().start(surface)
+        if self.accumulate:
+            if self.canvas is None:
+                self.canvas = pygame.Surface((self.width, self.height), depth=8)
+                self.canvas.set_palette(build_colormap())
+            self.intensity.fill(0)
+
+    def draw(self, surface):
+        if self.accumulate:
+            return self.draw_accumulated(surface)
+
+        # The screen is never cleared, so only the new lines are dirty
+        center = (self.center_x, self.center_y)
+        dirty_rects = []
+        for color, endpoint in self.new_lines:
+            dirty_rects.extend(draw_line(surface, color, center, endpoint, self.line_width))
+        self.lines_drawn += len(self.new_lines)
+        return dirty_rects
+
+    def draw_accumulated(self, surface):
+        intensity = self.intensity
+        intensity *= FADE
+        rasterize_segments(intensity, self.center_x, self.center_y, self.end_x, self.end_y)
+        self.lines_drawn += len(self.end_x)
+
+        # Log tone map with white at a multiple of the average: every line
+        # crosses the center, so scaling to the maximum would leave the
+        # rest of the screen dark
+        white = WHITE_POINT * float(intensity.mean())
+        if white > 0:
+            levels = np.log1p(intensity)
+            levels *= 255 / np.log1p(white)
+            np.minimum(levels, 255, out=levels)
+            pygame.surfarray.blit_array(self.canvas, levels.astype(np.uint8).T)
+        surface.blit(self.canvas, (0, 0))
+        return None  # the whole screen fades
+
+    def object_counts(self):
+        return {"lines drawn": self.lines_drawn, "lines": self.lines_per_frame}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="LINES.py - Radial Lines (Python port of LINES.BAS)",
+    )
+    parser.add_argument(
+        "--lines", type=int, default=LINES_PER_FRAME, metavar="N",
+        help=f"Lines per frame, 1-{MAX_LINES_PER_FRAME:,} (default: {LINES_PER_FRAME})",
+    )
+    parser.add_argument(
+        "--accumulate", action="store_true",
+        help="Draw into a fading NumPy intensity buffer instead of the never-cleared screen",
+    )
+    add_display_arguments(parser)
+    add_replay_arguments(parser)
+    args = parser.parse_args()
+    if args.accumulate and np is None:
+        parser.error("--accumulate needs NumPy (pip install numpy)")
+    if not 1 <= args.lines <= MAX_LINES_PER_FRAME:
+        parser.error(f"--lines must be between 1 and {MAX_LINES_PER_FRAME:,}")
+    return args
 
-        pygame.display.flip()
-        clock.tick(60)  # 60 FPS, drawing 10 lines per frame
 
-    pygame.quit()
-    sys.exit()
+def main():
+    args = parse_args()
+    saver_main(LinesScene, args, {"lines_per_frame": args.lines, "accumulate": args.accumulate})
 
 
 if __name__ == "__main__":
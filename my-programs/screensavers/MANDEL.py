@@ -0,0 +1,647 @@
+#!/usr/bin/env python3
+"""
+MANDEL.py - Mandelbrot / Julia Set Screensaver
+
+Original: samples/microsoft/MANDEL.BAS (QuickBASIC 4.5 sample, 180 lines)
+Converted to modern Python with pygame and NumPy
+
+The original walked the viewport pixel by pixel, mapped each one back to
+the complex plane with PMAP, ran the escape-time loop MAXLOOP = 30 times
+and drew runs of equal color with LINE. Then it rotated the EGA palette
+forever with ShiftPalette.
+
+This version splits the view into 64x64 tiles on a fixed grid in the
+complex plane. Each tile is computed with NumPy, all of its pixels at
+once, on a pool of worker processes that write straight into a block of
+shared memory, so no pixel data is pickled. Every tile is computed twice:
+first every 4th pixel for a quick coarse picture, then in full. Finished
+tiles are kept in a cache keyed by zoom level and grid position, so
+zooming back out or panning over ground already covered is instant, and
+zooming in starts from the parent level's tiles blown up 2x.
+
+Once a view is complete it palette-cycles like the original, then flies
+on to a random spot on the set's edge. Finished tiles land a fixed number
+per frame in the order they were asked for, so a --seed, --replay or
+benchmark digest comes out the same with any number of workers, or none.
+
+Usage:
+  python MANDEL.py                 # autopilot zoom
+  python MANDEL.py --workers 0     # compute in the main process, no pool
+  python MANDEL.py --scaling       # megapixels/sec from 1 to N cores
+
+Controls:
+  + / -       Zoom in / out at the center
+  Arrow keys  Pan
+  J           Switch between the Mandelbrot set and the Julia set for the
+              point at the center of the view
+  A           Back to autopilot (any zoom or pan key turns it off)
+  F3          Frame-time HUD
+  ESC or close window to quit
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from collections import OrderedDict, deque
+
+from saver_engine import Scene, add_display_arguments, add_replay_arguments, saver_main
+from saver_startup import lazy_import
+
+np = lazy_import("numpy")
+pygame = lazy_import("pygame")
+
+
+# Original: CONST MAXLOOP = 30; deeper zoom levels get more iterations
+MAX_LOOP = 30
+ITERATIONS_PER_LEVEL = 30
+
+# Tiles are TILE_SIZE pixels square; the coarse pass computes every
+# COARSE_STEP-th pixel in each direction
+TILE_SIZE = 64
+COARSE_STEP = 4
+
+# Finished tiles kept for reuse (about 8 KB each)
+TILE_CACHE_SIZE = 4096
+
+# Tiles landed per frame, in the order they were submitted; a fixed number
+# keeps every frame the same whether the pool is fast, slow or absent
+TILES_PER_FRAME = 8
+
+# Original default window: (-1000, 625)-(250, -625) in units of 1/500
+VIEW_CENTER_X = -0.75
+VIEW_SPAN = 2.5
+
+# Autopilot: how long to admire a finished view, and how deep to go
+HOLD_FRAMES = 180
+MAX_LEVEL = 30
+
+# Original: ColorWidth = MAXLOOP \\ ColorRange with ColorRange = 15
+COLOR_WIDTH = 2
+COLOR_RANGE = 15
+
+# EGA SCREEN 8 default palette
+EGA_PALETTE = [
+    (0, 0, 0),        # 0: Black
+    (0, 0, 170),      # 1: Blue
+    (0, 170, 0),      # 2: Green
+    (0, 170, 170),    # 3: Cyan
+    (170, 0, 0),      # 4: Red
+    (170, 0, 170),    # 5: Magenta
+    (170, 85, 0),     # 6: Brown
+    (170, 170, 170),  # 7: Light Gray
+    (85, 85, 85),     # 8: Dark Gray
+    (85, 85, 255),    # 9: Light Blue
+    (85, 255, 85),    # 10: Light Green
+    (85, 255, 255),   # 11: Light Cyan
+    (255, 85, 85),    # 12: Light Red
+    (255, 85, 255),   # 13: Light Magenta
+    (255, 255, 85),   # 14: Yellow
+    (255, 255, 255),  # 15: White
+]
+
+
+def escape_time(real: np.ndarray, imag: np.ndarray, max_iterations: int,
+                julia: complex | None = None) -> np.ndarray:
+    """
+    Escape-time iteration counts for a grid of points.
+
+    Like the original, a point that escapes (|z|² >= 4) on iteration I gets
+    I, and a point still bounded after max_iterations gets max_iterations + 1.
+    Points that have escaped are dropped from the working arrays, so later
+    iterations only touch the points still in play.
+    """
+    c = (real + 1j * imag).ravel()
+    z = c.copy()
+    if julia is not None:
+        c = np.full_like(z, julia)
+
+    counts = np.full(z.shape, max_iterations + 1, dtype=np.uint16)
+    remaining = np.arange(z.size)
+
+    for iteration in range(1, max_iterations + 1):
+        escaped = (z.real * z.real + z.imag * z.imag) >= 4.0
+        if escaped.any():
+            counts[remaining[escaped]] = iteration
+            still_in = ~escaped
+            remaining = remaining[still_in]
+            z = z[still_in]
+            if julia is None:
+                c = c[still_in]
+            else:
+                c = c[:z.size]
+            if not remaining.size:
+                break
+        z = z * z + c
+
+    return counts.reshape(real.shape)
+
+
+def fill_tile(output: np.ndarray, x0: float, y0: float, pixel_size: float, step: int,
+              max_iterations: int, julia: complex | None):
+    """Compute one tile (every step-th pixel) into the top-left of output."""
+    samples = TILE_SIZE // step
+    offsets = np.arange(samples) * (pixel_size * step)
+    real, imag = np.meshgrid(x0 + offsets, y0 + offsets)
+    # Screen y grows downward, the imaginary axis grows upward
+    output[:samples, :samples] = escape_time(real, -imag, max_iterations, julia)
+
+
+# Worker-process view of the shared tile slots, set up by _attach_slots
+_shared_slots = None
+_shared_memory_block = None
+
+
+def _attach_slots(memory_name: str, slot_count: int):
+    """Pool initializer: map the parent's shared memory into this worker."""
+    from multiprocessing import shared_memory
+
+    global _shared_slots, _shared_memory_block
+    _shared_memory_block = shared_memory.SharedMemory(name=memory_name)
+    _shared_slots = np.ndarray((slot_count, TILE_SIZE, TILE_SIZE), dtype=np.uint16,
+                               buffer=_shared_memory_block.buf)
+
+
+def _compute_into_slot(slot: int, x0: float, y0: float, pixel_size: float, step: int,
+                       max_iterations: int, julia: complex | None) -> int:
+    """Pool task: compute a tile straight into shared memory slot."""
+    fill_tile(_shared_slots[slot], x0, y0, pixel_size, step, max_iterations, julia)
+    return slot
+
+
+def _warm_up(_):
+    return os.getpid()
+
+
+class TileRenderer:
+    """
+    Computes tiles on a process pool into shared-memory output slots.
+
+    Each submitted job borrows a slot; the worker writes its counts there
+    and only the slot number travels back. With workers=0 the tiles are
+    computed in this process instead, when collect() asks for them.
+
+    Jobs come back from collect() strictly in submission order, waiting
+    for the pool if need be, so what lands on a given frame never depends
+    on how fast the workers happen to be.
+    """
+
+    def __init__(self, workers: int, slot_count: int = 256):
+        self.workers = workers
+        self.slot_count = slot_count
+        self.memory = None
+        self.executor = None
+        shape = (slot_count, TILE_SIZE, TILE_SIZE)
+
+        if workers > 0:
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import shared_memory
+
+            self.memory = shared_memory.SharedMemory(
+                create=True, size=int(np.prod(shape)) * np.dtype(np.uint16).itemsize)
+            self.slots = np.ndarray(shape, dtype=np.uint16, buffer=self.memory.buf)
+            self.executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=_attach_slots,
+                initargs=(self.memory.name, slot_count))
+        else:
+            self.slots = np.zeros(shape, dtype=np.uint16)
+
+        self.free_slots = list(range(slot_count - 1, -1, -1))
+        self.pending = OrderedDict()  # job -> (future or task args, slot, step)
+
+    def warm_up(self):
+        """Start every worker process now rather than on the first tile."""
+        if self.executor is not None:
+            list(self.executor.map(_warm_up, range(self.workers)))
+
+    @property
+    def has_free_slot(self) -> bool:
+        return bool(self.free_slots)
+
+    @property
+    def busy(self) -> bool:
+        return bool(self.pending)
+
+    def submit(self, job, x0: float, y0: float, pixel_size: float, step: int,
+               max_iterations: int, julia: complex | None):
+        slot = self.free_slots.pop()
+        task = (slot, x0, y0, pixel_size, step, max_iterations, julia)
+        if self.executor is not None:
+            self.pending[job] = (self.executor.submit(_compute_into_slot, *task), slot, step)
+        else:
+            self.pending[job] = (task, slot, step)
+
+    def cancel(self, job):
+        """Drop a job; one a worker has already started is waited out first."""
+        work, slot, _ = self.pending.pop(job)
+        if self.executor is not None and not work.cancel():
+            # Its slot is still being written; reuse it only once it is not
+            work.exception()
+        self.free_slots.append(slot)
+
+    def collect(self, limit: int = TILES_PER_FRAME) -> list:
+        """
+        Return (job, counts) for the oldest limit jobs, copying out of
+        their slots, and waiting for any the pool has not finished yet.
+        """
+        finished = []
+        for job, (work, slot, step) in list(self.pending.items())[:limit]:
+            if self.executor is None:
+                fill_tile(self.slots[slot], *work[1:])
+            else:
+                work.result()  # re-raise any worker error here
+
+            samples = TILE_SIZE // step
+            finished.append((job, self.slots[slot, :samples, :samples].copy()))
+            del self.pending[job]
+            self.free_slots.append(slot)
+        return finished
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        if self.memory is not None:
+            del self.slots
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
+
+
+def expand_tile(samples: np.ndarray, factor: int) -> np.ndarray:
+    """Blow a coarse tile up to TILE_SIZE by repeating each sample."""
+    if factor == 1:
+        return samples
+    return np.repeat(np.repeat(samples, factor, axis=0), factor, axis=1)[:TILE_SIZE, :TILE_SIZE]
+
+
+def color_lookup(max_iterations: int) -> np.ndarray:
+    """
+    Map iteration counts to EGA color indices.
+
+    Original: PColor = I \\ ColorWidth, drawn in color ColorRange - PColor.
+    Bands repeat past ColorRange so deep zooms with more iterations still
+    show detail; points inside the set are black.
+    """
+    counts = np.arange(max_iterations + 2)
+    colors = COLOR_RANGE - (counts // COLOR_WIDTH) % COLOR_RANGE
+    colors[max_iterations + 1] = 0
+    return colors.astype(np.uint8)
+
+
+class MandelScene(Scene):
+    """Tiled, cached, multi-process Mandelbrot/Julia explorer (MANDEL.BAS)."""
+
+    name = "MANDEL"
+    caption = "MANDEL.py - Mandelbrot Set (+/- zoom, arrows pan, J julia, A autopilot, ESC quit)"
+    input_keys = ("+", "=", "[+]", "-", "[-]", "left", "right", "up", "down", "j", "a")
+
+    def __init__(self, size, rng, workers=None):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        super().__init__(size, rng, workers=workers)
+        self.workers = workers
+        self.renderer = None
+
+        # Fit the original window into the scene at zoom level 0
+        self.base_pixel_size = max(VIEW_SPAN / self.width, VIEW_SPAN / self.height)
+        self.julia = None
+        self.autopilot = True
+        self.reset_view()
+
+        # (level, tile_x, tile_y, julia) -> [step, counts]; step 1 is final
+        self.tiles = OrderedDict()
+        self.fresh_tiles = set()   # cached tiles not yet painted
+        self.job_queue = deque()   # (tile_key, step) waiting for a slot
+        self.view_changed = True
+        self.view_complete = False
+        self.frames_on_view = 0
+        self.palette_shift = 0
+        self.canvas = None
+        self.drawn_view = None     # (level, origin) currently on the canvas
+
+    # -- view ------------------------------------------------------------
+
+    def reset_view(self):
+        self.level = 0
+        pixel_size = self.base_pixel_size
+        center_x = VIEW_CENTER_X if self.julia is None else 0.0
+        self.origin_x = round(center_x / pixel_size) - self.width // 2
+        self.origin_y = -self.height // 2
+
+    def pixel_size(self, level: int) -> float:
+        return self.base_pixel_size / 2 ** level
+
+    def max_iterations(self, level: int) -> int:
+        return MAX_LOOP + ITERATIONS_PER_LEVEL * level
+
+    def visible_tiles(self) -> list:
+        """Tile keys covering the view, in reading order."""
+        first_x = self.origin_x // TILE_SIZE
+        last_x = (self.origin_x + self.width - 1) // TILE_SIZE
+        first_y = self.origin_y // TILE_SIZE
+        last_y = (self.origin_y + self.height - 1) // TILE_SIZE
+        return [(self.level, tile_x, tile_y, self.julia)
+                for tile_y in range(first_y, last_y + 1)
+                for tile_x in range(first_x, last_x + 1)]
+
+    def zoom(self, center_x: int, center_y: int, zoom_in: bool):
+        """Zoom 2x in or out around a point given in view pixels."""
+        world_x = self.origin_x + center_x
+        world_y = self.origin_y + center_y
+        if zoom_in and self.level < MAX_LEVEL:
+            self.level += 1
+            self.origin_x = 2 * world_x - self.width // 2
+            self.origin_y = 2 * world_y - self.height // 2
+        elif not zoom_in and self.level > 0:
+            self.level -= 1
+            self.origin_x = world_x // 2 - self.width // 2
+            self.origin_y = world_y // 2 - self.height // 2
+        self.view_changed = True
+
+    def handle_key(self, key):
+        half_tile = TILE_SIZE // 2
+        if key == pygame.K_a:
+            self.autopilot = True
+            return
+
+        self.autopilot = False
+        if key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+            self.zoom(self.width // 2, self.height // 2, True)
+        elif key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.zoom(self.width // 2, self.height // 2, False)
+        elif key == pygame.K_LEFT:
+            self.origin_x -= half_tile
+        elif key == pygame.K_RIGHT:
+            self.origin_x += half_tile
+        elif key == pygame.K_UP:
+            self.origin_y -= half_tile
+        elif key == pygame.K_DOWN:
+            self.origin_y += half_tile
+        elif key == pygame.K_j:
+            if self.julia is None:
+                pixel_size = self.pixel_size(self.level)
+                real = (self.origin_x + self.width // 2) * pixel_size
+                imag = -(self.origin_y + self.height // 2) * pixel_size
+                self.julia = complex(real, imag)
+            else:
+                self.julia = None
+            self.reset_view()
+        self.view_changed = True
+
+    # -- tiles -----------------------------------------------------------
+
+    def tile_origin(self, key) -> tuple[float, float, float]:
+        level, tile_x, tile_y, _ = key
+        pixel_size = self.pixel_size(level)
+        return (tile_x * TILE_SIZE * pixel_size, tile_y * TILE_SIZE * pixel_size, pixel_size)
+
+    def store_tile(self, key, step: int, counts: np.ndarray):
+        """Keep the best version of a tile, evicting the least recently used."""
+        cached = self.tiles.get(key)
+        if cached is not None and cached[0] <= step:
+            return
+        self.tiles[key] = [step, counts]
+        self.tiles.move_to_end(key)
+        self.fresh_tiles.add(key)
+        while len(self.tiles) > TILE_CACHE_SIZE:
+            old_key, _ = self.tiles.popitem(last=False)
+            self.fresh_tiles.discard(old_key)
+
+    def preview_from_parent(self, key) -> bool:
+        """Seed a tile from the zoom level above, blown up 2x."""
+        level, tile_x, tile_y, julia = key
+        parent = self.tiles.get((level - 1, tile_x // 2, tile_y // 2, julia))
+        if level == 0 or parent is None:
+            return False
+        half = TILE_SIZE // 2
+        corner_x = (tile_x % 2) * half
+        corner_y = (tile_y % 2) * half
+        quarter = parent[1][corner_y:corner_y + half, corner_x:corner_x + half]
+        self.store_tile(key, parent[0] * 2, expand_tile(quarter, 2))
+        return True
+
+    def plan_view(self):
+        """Queue coarse then fine jobs for the visible tiles; drop stale work."""
+        visible = self.visible_tiles()
+        wanted = set(visible)
+
+        for job in list(self.renderer.pending):
+            if job[0] not in wanted:
+                self.renderer.cancel(job)
+        in_flight = set(self.renderer.pending)
+
+        coarse_jobs, fine_jobs = [], []
+        for key in visible:
+            cached = self.tiles.get(key)
+            if cached is None and self.preview_from_parent(key):
+                cached = self.tiles[key]
+            if cached is not None:
+                self.tiles.move_to_end(key)
+                self.fresh_tiles.add(key)
+            step = cached[0] if cached is not None else None
+            if (step is None or step > COARSE_STEP) and (key, COARSE_STEP) not in in_flight:
+                coarse_jobs.append((key, COARSE_STEP))
+            if step != 1 and (key, 1) not in in_flight:
+                fine_jobs.append((key, 1))
+
+        # Everything coarse goes ahead of everything fine
+        self.job_queue = deque(coarse_jobs + fine_jobs)
+        self.view_changed = False
+        self.view_complete = False
+        self.frames_on_view = 0
+
+    def submit_jobs(self):
+        while self.job_queue and self.renderer.has_free_slot:
+            key, step = self.job_queue.popleft()
+            cached = self.tiles.get(key)
+            if cached is not None and cached[0] <= step:
+                continue
+            x0, y0, pixel_size = self.tile_origin(key)
+            self.renderer.submit((key, step), x0, y0, pixel_size, step,
+                                 self.max_iterations(key[0]), key[3])
+
+    # -- autopilot -------------------------------------------------------
+
+    def pick_target(self):
+        """Choose a visible tile on the edge of the set to zoom into."""
+        inside = self.max_iterations(self.level) + 1
+        candidates = []
+        for key in self.visible_tiles():
+            counts = self.tiles[key][1]
+            has_inside = (counts == inside).any()
+            if has_inside and not (counts == inside).all():
+                candidates.append(key)
+        if not candidates or self.level >= MAX_LEVEL:
+            return None
+        _, tile_x, tile_y, _ = self.rng.choice(candidates)
+        return (tile_x * TILE_SIZE + TILE_SIZE // 2 - self.origin_x,
+                tile_y * TILE_SIZE + TILE_SIZE // 2 - self.origin_y)
+
+    def update(self):
+        if self.renderer is None:
+            self.renderer = TileRenderer(self.workers)
+            self.renderer.warm_up()
+
+        if self.view_changed:
+            self.plan_view()
+
+        for (key, step), samples in self.renderer.collect():
+            self.store_tile(key, step, expand_tile(samples, step))
+
+        self.submit_jobs()
+
+        if not self.view_complete and not self.job_queue and not self.renderer.busy:
+            self.view_complete = True
+        self.frames_on_view += 1
+
+        if self.view_complete:
+            self.palette_shift = (self.palette_shift + 1) % COLOR_RANGE
+            if self.autopilot and self.frames_on_view >= HOLD_FRAMES:
+                target = self.pick_target()
+                if target is None:
+                    self.reset_view()
+                    self.view_changed = True
+                else:
+                    self.zoom(target[0], target[1], True)
+
+    # -- drawing ---------------------------------------------------------
+
+    def start(self, surface):
+        super().start(surface)
+        if self.canvas is None:
+            self.canvas = pygame.Surface((self.width, self.height), depth=8)
+        self.canvas.set_palette(EGA_PALETTE)
+        self.canvas.fill(0)
+        self.drawn_view = None
+
+    def shifted_palette(self) -> list:
+        """Original ShiftPalette: rotate colors 1-15, leave black alone."""
+        palette = list(EGA_PALETTE)
+        for index in range(1, COLOR_RANGE + 1):
+            palette[index] = EGA_PALETTE[(index - 1 + self.palette_shift) % COLOR_RANGE + 1]
+        return palette
+
+    def draw(self, surface):
+        visible = self.visible_tiles()
+        view = (self.level, self.origin_x, self.origin_y, self.julia)
+        full_redraw = view != self.drawn_view
+        if full_redraw:
+            self.canvas.fill(0)
+            to_paint = [key for key in visible if key in self.tiles]
+        else:
+            to_paint = [key for key in visible if key in self.fresh_tiles]
+        self.drawn_view = view
+
+        lookup = color_lookup(self.max_iterations(self.level))
+        dirty_rects = []
+        pixels = pygame.surfarray.pixels2d(self.canvas)
+        for key in to_paint:
+            _, tile_x, tile_y, _ = key
+            left = tile_x * TILE_SIZE - self.origin_x
+            top = tile_y * TILE_SIZE - self.origin_y
+            rect = pygame.Rect(left, top, TILE_SIZE, TILE_SIZE).clip(self.canvas.get_rect())
+            if not rect.width or not rect.height:
+                continue
+            colors = lookup[self.tiles[key][1]].T  # surfarray is indexed [x][y]
+            pixels[rect.left:rect.right, rect.top:rect.bottom] = colors[
+                rect.left - left:rect.right - left, rect.top - top:rect.bottom - top]
+            dirty_rects.append(rect)
+        del pixels  # unlock the canvas before blitting
+        self.fresh_tiles.clear()
+
+        if self.view_complete and self.palette_shift:
+            self.canvas.set_palette(self.shifted_palette())
+            surface.blit(self.canvas, (0, 0))
+            return None
+
+        self.canvas.set_palette(EGA_PALETTE)
+        if full_redraw:
+            surface.blit(self.canvas, (0, 0))
+            return None
+        for rect in dirty_rects:
+            surface.blit(self.canvas, rect, rect)
+        return dirty_rects
+
+    def stop(self):
+        if self.renderer is not None:
+            self.renderer.close()
+            self.renderer = None
+
+    def object_counts(self):
+        return {
+            "level": self.level,
+            "tiles cached": len(self.tiles),
+            "jobs queued": len(self.job_queue),
+            "computing": len(self.renderer.pending) if self.renderer else 0,
+        }
+
+
+def measure_scaling(max_workers: int, size: tuple[int, int], max_iterations: int):
+    """Print megapixels/sec for the full default view from 1 to max_workers processes."""
+    width, height = size
+    pixel_size = max(VIEW_SPAN / width, VIEW_SPAN / height)
+    origin_x = round(VIEW_CENTER_X / pixel_size) - width // 2
+    origin_y = -height // 2
+    tiles = [(tile_x, tile_y)
+             for tile_y in range(origin_y // TILE_SIZE, (origin_y + height - 1) // TILE_SIZE + 1)
+             for tile_x in range(origin_x // TILE_SIZE, (origin_x + width - 1) // TILE_SIZE + 1)]
+    megapixels = len(tiles) * TILE_SIZE * TILE_SIZE / 1e6
+
+    counts = sorted({1, max_workers} | {2 ** n for n in range(1, 8) if 2 ** n < max_workers})
+    print(f"Escape-time scaling: {len(tiles)} tiles, {megapixels:.2f} megapixels, "
+          f"{max_iterations} iterations max")
+    print(f"{'workers':>8} {'seconds':>9} {'MP/s':>9} {'speedup':>8}")
+
+    baseline = None
+    for workers in counts:
+        renderer = TileRenderer(workers, slot_count=len(tiles))
+        renderer.warm_up()
+        started = time.perf_counter()
+        for tile_x, tile_y in tiles:
+            renderer.submit((tile_x, tile_y), tile_x * TILE_SIZE * pixel_size,
+                            tile_y * TILE_SIZE * pixel_size, pixel_size, 1,
+                            max_iterations, None)
+        renderer.collect(len(tiles))
+        elapsed = time.perf_counter() - started
+        renderer.close()
+
+        rate = megapixels / elapsed
+        baseline = baseline or rate
+        print(f"{workers:>8} {elapsed:>9.3f} {rate:>9.2f} {rate / baseline:>7.2f}x")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="MANDEL.py - Mandelbrot Set (Python port of MANDEL.BAS)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Worker processes for tile computation (default: CPU count, 0 = main process)",
+    )
+    parser.add_argument(
+        "--scaling", action="store_true",
+        help="Measure megapixels/sec from 1 to --workers processes and exit",
+    )
+    parser.add_argument(
+        "--scaling-iterations", type=int, default=256, metavar="N",
+        help="Iteration limit used by --scaling (default: 256)",
+    )
+    add_display_arguments(parser)
+    add_replay_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.scaling:
+        measure_scaling(max(1, args.workers or os.cpu_count() or 1), args.size,
+                        args.scaling_iterations)
+        return
+    saver_main(MandelScene, args, {"workers": args.workers})
+
+
+if __name__ == "__main__":
+    main()
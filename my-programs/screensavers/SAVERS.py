@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+SAVERS.py - Resident Screensaver Host
+
+Not a conversion of a single .BAS file; on DOS each saver was its own
+program. Running them that way here means every switch pays for a new
+interpreter, the pygame import, pygame.init() and a new window, only to
+throw it all away with pygame.quit().
+
+This host starts once, preloads every saver as a scene and rotates
+between them on a timer or keypress, reusing the same window and
+surfaces (savers with the same logical resolution share one upscaling
+framebuffer). Switching only clears the screen, so it fits inside a single
+frame. On exit it reports how long switches took and how much startup
+time separate processes would have spent.
+
+With --idle the host waits in the background and only starts the savers
+after that many seconds without keyboard or mouse input in its window;
+any input then returns it to waiting.
+
+Usage:
+  python SAVERS.py                       # rotate every 30 seconds
+  python SAVERS.py --rotate 10 --scenes BOUNCE,SCREEN
+  python SAVERS.py --idle 60             # activate after a minute idle
+  python SAVERS.py --cold-start          # also time a real separate start
+  python SAVERS.py --music BASMUSIC      # with the shareware tunes behind
+
+Controls:
+  N or TAB - Next saver
+  F3       - Frame-time HUD
+  SPACE    - Passed to the saver (toggles BOUNCE's radius)
+  ESC or close window to quit
+"""
+
+import argparse
+import importlib
+import random
+import subprocess
+import sys
+import time
+
+from saver_engine import DEFAULT_HEIGHT, DEFAULT_WIDTH, parse_size
+from saver_music import play_background, tune_argument
+
+
+# (name, module, scene class, options) for each saver the host can run
+SAVERS = [
+    ("BOUNCE", "BOUNCE", "BounceScene", {}),
+    ("LINES", "LINES", "LinesScene", {}),
+    ("SCREEN", "SCREEN", "ScreenScene", {"indexed": True}),
+    ("SQUBONC3", "SQUBONC3", "SquareBounceScene", {"figures": 5, "points": 5}),
+    ("MANDEL", "MANDEL", "MandelScene", {}),
+    ("STARFIEL", "STARFIEL", "StarfieldScene", {"stars": 20000}),
+    ("BOUNCE3", "BOUNCE3", "ManyBounceScene", {"balls": 1000}),
+    ("SHBONCE2", "SHBONCE2", "MeshScene", {"points": 2000}),
+    ("TORUS", "TORUS", "TorusScene", {"panels": 20, "sections": 40}),
+]
+
+# What a separate saver process does before its first frame
+COLD_START_SNIPPET = (
+    "import pygame; pygame.display.init(); "
+    "pygame.display.set_mode(({width}, {height})); pygame.quit()"
+)
+
+
+class StartupReport:
+    """Times the host's one-off startup and every scene switch."""
+
+    def __init__(self):
+        self.phases = {}
+        self.switch_times = []
+
+    def time_phase(self, name: str, started: float):
+        self.phases[name] = time.perf_counter() - started
+
+    @property
+    def startup_seconds(self) -> float:
+        return sum(self.phases.values())
+
+    def print_report(self, frame_rate: int, cold_start_seconds: float | None):
+        frame_budget = 1000.0 / frame_rate
+        print()
+        print("Startup paid once:")
+        for name, seconds in self.phases.items():
+            print(f"  {name:<16} {seconds * 1000:8.1f} ms")
+
+        if not self.switch_times:
+            print("No scene switches.")
+            return
+
+        average = 1000.0 * sum(self.switch_times) / len(self.switch_times)
+        worst = 1000.0 * max(self.switch_times)
+        print(f"Scene switches: {len(self.switch_times)}, "
+              f"average {average:.2f} ms, worst {worst:.2f} ms "
+              f"(frame budget {frame_budget:.1f} ms)")
+
+        per_start = self.startup_seconds
+        label = "in-process import/init/window"
+        if cold_start_seconds is not None:
+            per_start = cold_start_seconds
+            label = "measured separate process start"
+        saved = len(self.switch_times) * per_start - sum(self.switch_times)
+        print(f"Separate processes would pay {per_start * 1000:.0f} ms per switch "
+              f"({label}); saved {saved:.2f} s")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="SAVERS.py - Resident host that rotates the pygame screensavers",
+    )
+    parser.add_argument(
+        "--scenes", default=",".join(name for name, *_ in SAVERS),
+        help="Comma-separated savers to rotate (default: all)",
+    )
+    parser.add_argument(
+        "--rotate", type=float, default=30.0, metavar="SECONDS",
+        help="Switch to the next saver after this many seconds (0 = only on keypress)",
+    )
+    parser.add_argument(
+        "--idle", type=float, default=0.0, metavar="SECONDS",
+        help="Wait for this many seconds without input before starting (0 = start now)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="Seed for the scenes' random numbers (default: random)",
+    )
+    parser.add_argument(
+        "--size", type=parse_size, default=(DEFAULT_WIDTH, DEFAULT_HEIGHT),
+        help=f"Window size as WIDTHxHEIGHT (default: {DEFAULT_WIDTH}x{DEFAULT_HEIGHT})",
+    )
+    parser.add_argument(
+        "--native", action="store_true",
+        help="Render at the window resolution and scale the physics, instead of upscaling",
+    )
+    parser.add_argument(
+        "--cold-start", action="store_true",
+        help="On exit, time a separate Python process doing the same startup",
+    )
+    parser.add_argument(
+        "--music", type=tune_argument, metavar="TUNE",
+        help="Loop the PLAY strings of a .BAS file, e.g. BASMUSIC:StarWars",
+    )
+    args = parser.parse_args()
+
+    known = {name for name, *_ in SAVERS}
+    args.scenes = [name.strip().upper() for name in args.scenes.split(",") if name.strip()]
+    unknown = [name for name in args.scenes if name not in known]
+    if unknown or not args.scenes:
+        parser.error(f"unknown saver(s): {', '.join(unknown) or '(none)'}; "
+                     f"choose from {', '.join(sorted(known))}")
+    return args
+
+
+def load_scenes(names: list, window, seed: int, native: bool) -> list:
+    """
+    Import each saver module once and build its scene.
+
+    Returns (scene, framebuffer) pairs; scenes with the same logical size
+    share a framebuffer.
+    """
+    from saver_engine import make_framebuffer
+
+    framebuffers = {}
+    scenes = []
+    for name, module_name, class_name, options in SAVERS:
+        if name not in names:
+            continue
+        scene_class = getattr(importlib.import_module(module_name), class_name)
+        key = None if native else scene_class.logical_size
+        if key not in framebuffers:
+            framebuffers[key] = make_framebuffer(window, scene_class, native)
+        framebuffer = framebuffers[key]
+        scenes.append((scene_class(framebuffer.size, random.Random(seed), **options),
+                       framebuffer))
+    # Keep the order the user asked for
+    scenes.sort(key=lambda pair: names.index(pair[0].name))
+    return scenes
+
+
+def measure_cold_start(size: tuple[int, int]) -> float:
+    """Time a fresh interpreter importing pygame and opening a window."""
+    snippet = COLD_START_SNIPPET.format(width=size[0], height=size[1])
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", snippet], check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - started
+
+
+def main():
+    args = parse_args()
+    seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+    report = StartupReport()
+    frame_rate = 60
+
+    started = time.perf_counter()
+    import pygame
+    from saver_engine import key_codes
+    from saver_hud import Hud
+    report.time_phase("import pygame", started)
+    size = args.size
+
+    started = time.perf_counter()
+    pygame.display.init()
+    report.time_phase("display.init()", started)
+
+    started = time.perf_counter()
+    screen = pygame.display.set_mode(size)
+    report.time_phase("window", started)
+
+    started = time.perf_counter()
+    scenes = load_scenes(args.scenes, screen, seed, args.native)
+    report.time_phase("load savers", started)
+    scene_keys = [key_codes(scene.input_keys) for scene, _ in scenes]
+    # Kept until exit: the tune stops when its Sound is collected
+    music = play_background(args.music) if args.music else None
+
+    clock = pygame.time.Clock()
+    hud = Hud()
+    current = 0
+    active = args.idle <= 0
+    last_input = time.perf_counter()
+    scene_started = None
+
+    def activate(index: int):
+        """Switch the shared window to scenes[index] and time it."""
+        nonlocal current, scene_started
+        switch_began = time.perf_counter()
+        current = index
+        scene, framebuffer = scenes[current]
+        pygame.display.set_caption(f"SAVERS.py - {scene.name} (N=next, ESC=quit)")
+        framebuffer.clear()
+        scene.start(framebuffer.surface)
+        framebuffer.present(None)
+        # The very first activation is part of startup, not a switch
+        if scene_started is not None:
+            report.switch_times.append(time.perf_counter() - switch_began)
+        scene_started = time.perf_counter()
+
+    if active:
+        activate(0)
+    else:
+        pygame.display.set_caption("SAVERS.py - waiting for idle (ESC to quit)")
+        screen.fill((0, 0, 0))
+        pygame.display.flip()
+
+    running = True
+    while running:
+        now = time.perf_counter()
+        timing = hud.visible and active
+        if timing:
+            hud.begin_frame()
+
+        for event in pygame.event.get():
+            if event.type in (pygame.KEYDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
+                last_input = now
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                hud.toggle()
+            elif event.type == pygame.KEYDOWN and event.key in (pygame.K_n, pygame.K_TAB):
+                if active:
+                    activate((current + 1) % len(scenes))
+            elif (event.type == pygame.KEYDOWN and active
+                  and event.key in scene_keys[current]):
+                scenes[current][0].handle_key(event.key)
+            elif event.type in (pygame.KEYDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
+                if active and args.idle > 0:
+                    # Like a real screensaver, input sends it back to waiting
+                    active = False
+                    pygame.display.set_caption("SAVERS.py - waiting for idle (ESC to quit)")
+                    screen.fill((0, 0, 0))
+                    pygame.display.flip()
+
+        if not running:
+            break
+
+        if not active:
+            if now - last_input >= args.idle:
+                active = True
+                activate(current)
+            clock.tick(10)  # no need to spin while waiting
+            continue
+
+        if args.rotate > 0 and now - scene_started >= args.rotate:
+            activate((current + 1) % len(scenes))
+
+        if timing:
+            hud.lap("events")
+        scene, framebuffer = scenes[current]
+        scene.update()
+        if timing:
+            hud.lap("sim")
+        dirty_rects = scene.draw(framebuffer.surface)
+        if timing:
+            hud.lap("draw")
+            hud.observe(scene)
+        framebuffer.present(dirty_rects, None, hud if hud.active else None)
+        if timing:
+            hud.lap("flip")
+        clock.tick(frame_rate)
+
+    for scene, _ in scenes:
+        scene.stop()
+    pygame.quit()
+
+    cold_start = measure_cold_start(size) if args.cold_start else None
+    report.print_report(frame_rate, cold_start)
+    sys.exit()
+
+
+if __name__ == "__main__":
+    main()
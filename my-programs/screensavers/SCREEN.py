@@ -10,130 +10,269 @@ Uses VGA PALETTE command technique for smooth color transitions,
 with RGB values derived from vertex positions creating a flowing
 color effect.
 
+By default the polygon is redrawn every frame in 24-bit color. The
+--indexed mode works the way the original did on real VGA hardware:
+geometry is drawn once into an 8-bit surface using palette indices,
+and all color animation happens through set_palette: recoloring the
+polygon touches one palette entry instead of its pixels, and only the
+polygon's own lines are uploaded. Adding --trails keeps the last 255
+polygons on screen, each in its own palette index, and fades them by
+rotating the palette. Nothing is redrawn for the fade, but every trail
+pixel changes color, so each frame still converts and uploads the
+bounding box of all the live trails: O(trail pixels), not O(palette).
+
+Usage:
+  python SCREEN.py              # 24-bit redraw (default)
+  python SCREEN.py --indexed    # PALETTE 1 trick on an 8-bit surface
+  python SCREEN.py --trails     # persistent trails, palette rotation
+
+The display, benchmark and replay options shared by all savers are
+described in saver_engine.py.
+
 Controls:
+  F3 - Frame-time HUD
   ESC or close window to quit
 """
 
-import pygame
-import sys
-import random
+import argparse
 
+from saver_engine import Scene, add_display_arguments, add_replay_arguments, draw_line, saver_main
+from saver_startup import lazy_import
 
-# VGA Screen 12 dimensions
-SCREEN_WIDTH = 640
-SCREEN_HEIGHT = 480
+pygame = lazy_import("pygame")
 
 # Number of vertices in the polygon
 NUM_POINTS = 20
 
+# Palette index 0 is the background, 1-255 hold polygon colors
+BACKGROUND_INDEX = 0
+POLYGON_INDEX = 1  # PALETTE 1 in the original
+TRAIL_INDEXES = 255
 
-def main():
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("SCREEN.py - Color-Cycling Polygon (ESC to quit)")
-    clock = pygame.time.Clock()
-
-    # Initialize vertex positions (using xy/yy arrays like original)
-    # Original had xx, yy, yx, xy but only used xy/yy for drawing
-    xy = [random.randint(1, SCREEN_WIDTH) for _ in range(NUM_POINTS)]
-    yy = [random.randint(1, SCREEN_HEIGHT) for _ in range(NUM_POINTS)]
-
-    # Also track xx/yx even though original only drew xy/yy connections
-    xx = [random.randint(1, SCREEN_WIDTH) for _ in range(NUM_POINTS)]
-    yx = [random.randint(1, SCREEN_HEIGHT) for _ in range(NUM_POINTS)]
-
-    # Direction arrays
-    dir_xx = [1 for _ in range(NUM_POINTS)]
-    dir_xy = [1 for _ in range(NUM_POINTS)]
-    dir_yx = [1 for _ in range(NUM_POINTS)]
-    dir_yy = [1 for _ in range(NUM_POINTS)]
-
-    # Blue color oscillation (original: blue cycles 1-63, bld toggles direction)
-    blue = 0
-    blue_direction = 1
-
-    running = True
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
+
+def vga_to_rgb(red: int, green: int, blue: int) -> tuple[int, int, int]:
+    """Scale VGA DAC values (0-63) to modern 0-255 RGB."""
+    return (min(255, red * 4), min(255, green * 4), min(255, blue * 4))
+
+
+def build_trail_palette(base_colors: list, head_index: int) -> list:
+    """
+    Build a full 256-entry palette that fades trails by age.
+
+    Every index in 1-255 keeps the color it was drawn with; its brightness
+    is scaled by how many frames ago that index was the newest one. Because
+    only the palette changes, the trails themselves are never redrawn.
+    """
+    palette = [(0, 0, 0)] * 256
+    for index in range(1, TRAIL_INDEXES + 1):
+        age = (head_index - index) % TRAIL_INDEXES
+        brightness = 1.0 - age / TRAIL_INDEXES
+        red, green, blue = base_colors[index]
+        palette[index] = (int(red * brightness), int(green * brightness),
+                          int(blue * brightness))
+    return palette
+
+
+def draw_polygon(surface, color, points: list, width: int = 1) -> list:
+    """Draw the closed polygon through points; return the dirty rectangles."""
+    dirty_rects = []
+    for i in range(NUM_POINTS - 1):
+        dirty_rects.extend(draw_line(surface, color, points[i], points[i + 1], width))
+
+    # Close the polygon (connect last to first)
+    dirty_rects.extend(draw_line(surface, color, points[0], points[NUM_POINTS - 1], width))
+    return dirty_rects
+
+
+class ScreenScene(Scene):
+    """20-point bouncing polygon with PALETTE color cycling (SCREEN.BAS)."""
+
+    name = "SCREEN"
+    caption = "SCREEN.py - Color-Cycling Polygon (ESC to quit)"
+
+    def __init__(self, size, rng, indexed=False, trails=False):
+        super().__init__(size, rng, indexed=indexed, trails=trails)
+        self.indexed = indexed or trails
+        self.trails = trails
+
+        # Initialize vertex positions (using xy/yy arrays like original)
+        # Original had xx, yy, yx, xy but only used xy/yy for drawing
+        self.xy = [rng.randint(1, self.width) for _ in range(NUM_POINTS)]
+        self.yy = [rng.randint(1, self.height) for _ in range(NUM_POINTS)]
+
+        # Also track xx/yx even though original only drew xy/yy connections
+        self.xx = [rng.randint(1, self.width) for _ in range(NUM_POINTS)]
+        self.yx = [rng.randint(1, self.height) for _ in range(NUM_POINTS)]
+
+        # Direction arrays
+        self.dir_xx = [self.scale for _ in range(NUM_POINTS)]
+        self.dir_xy = [self.scale for _ in range(NUM_POINTS)]
+        self.dir_yx = [self.scale for _ in range(NUM_POINTS)]
+        self.dir_yy = [self.scale for _ in range(NUM_POINTS)]
+
+        # Blue color oscillation (original: blue cycles 1-63, bld toggles direction)
+        self.blue = 0
+        self.blue_direction = 1
+
+        # Polygon and color for this frame; the previous frame's polygon is
+        # kept for erasing like the original's oldxy/oldyy
+        self.points = None
+        self.color = (0, 0, 0)
+        self.old_points = None
+
+        # 8-bit canvas standing in for VGA video memory, created in start()
+        self.canvas = None
+
+        # Trail mode: the color each palette index was last drawn with, and
+        # the rectangles and bounding box of the polygon drawn with it
+        self.trail_colors = [(0, 0, 0)] * 256
+        self.trail_lines = [None] * 256
+        self.trail_rects = [None] * 256
+        self.trail_head = 0
+
+    def start(self, surface):
+        super().start(surface)
+        if self.indexed:
+            # Pixels hold palette indices; the blit to the screen is the DAC
+            # lookup. The canvas is kept if the scene is started again.
+            if self.canvas is None:
+                self.canvas = pygame.Surface((self.width, self.height), depth=8)
+                self.canvas.set_palette([(0, 0, 0)] * 256)
+            self.canvas.fill(BACKGROUND_INDEX)
+            self.trail_lines = [None] * 256
+            self.trail_rects = [None] * 256
+
+    def update(self):
+        xx, xy, yx, yy = self.xx, self.xy, self.yx, self.yy
+        scale = self.scale
 
         # Update directions when hitting edges
         for i in range(NUM_POINTS):
-            if xx[i] >= SCREEN_WIDTH:
-                dir_xx[i] = -random.randint(1, 3)
+            if xx[i] >= self.width:
+                self.dir_xx[i] = -self.rng.randint(1, 3) * scale
             if xx[i] <= 0:
-                dir_xx[i] = random.randint(1, 3)
-            if xy[i] >= SCREEN_WIDTH:
-                dir_xy[i] = -random.randint(1, 3)
+                self.dir_xx[i] = self.rng.randint(1, 3) * scale
+            if xy[i] >= self.width:
+                self.dir_xy[i] = -self.rng.randint(1, 3) * scale
             if xy[i] <= 0:
-                dir_xy[i] = random.randint(1, 3)
-            if yx[i] >= SCREEN_HEIGHT:
-                dir_yx[i] = -random.randint(1, 3)
+                self.dir_xy[i] = self.rng.randint(1, 3) * scale
+            if yx[i] >= self.height:
+                self.dir_yx[i] = -self.rng.randint(1, 3) * scale
             if yx[i] <= 0:
-                dir_yx[i] = random.randint(1, 3)
-            if yy[i] >= SCREEN_HEIGHT:
-                dir_yy[i] = -random.randint(1, 3)
+                self.dir_yx[i] = self.rng.randint(1, 3) * scale
+            if yy[i] >= self.height:
+                self.dir_yy[i] = -self.rng.randint(1, 3) * scale
             if yy[i] <= 0:
-                dir_yy[i] = random.randint(1, 3)
-
-        # Clear screen
-        screen.fill((0, 0, 0))
+                self.dir_yy[i] = self.rng.randint(1, 3) * scale
 
         # Calculate color using original's palette math
         # Original: PALETTE 1, 65536 * blue + 256 * green + red
         # VGA palette values were 0-63, we scale to 0-255
-        blue += blue_direction
-        if blue >= 63:
-            blue_direction = -1
-        if blue <= 1:
-            blue_direction = 1
+        self.blue += self.blue_direction
+        if self.blue >= 63:
+            self.blue_direction = -1
+        if self.blue <= 1:
+            self.blue_direction = 1
 
         # Original derived green/red from vertex positions
         # green = ABS(INT(xx(1) * .098))
         # red = ABS(INT(yy(1) * .13))
-        green = abs(int(xx[0] * 0.098))
-        red = abs(int(yy[0] * 0.13))
+        # (positions are measured in logical pixels so --native keeps the colors)
+        green = abs(int(xx[0] / scale * 0.098))
+        red = abs(int(yy[0] / scale * 0.13))
 
         # Scale from VGA (0-63) to modern (0-255)
-        scaled_blue = min(255, blue * 4)
-        scaled_green = min(255, green * 4)
-        scaled_red = min(255, red * 4)
-
-        color = (scaled_red, scaled_green, scaled_blue)
-
-        # Draw polygon connecting adjacent xy/yy points
-        for i in range(NUM_POINTS - 1):
-            pygame.draw.line(
-                screen,
-                color,
-                (xy[i], yy[i]),
-                (xy[i + 1], yy[i + 1])
-            )
-
-        # Close the polygon (connect last to first)
-        pygame.draw.line(
-            screen,
-            color,
-            (xy[0], yy[0]),
-            (xy[NUM_POINTS - 1], yy[NUM_POINTS - 1])
-        )
+        self.color = vga_to_rgb(red, green, self.blue)
+        self.points = [(round(x), round(y)) for x, y in zip(xy, yy)]
 
         # Update all positions
         for i in range(NUM_POINTS):
-            xx[i] += dir_xx[i]
-            yy[i] += dir_yy[i]
-            xy[i] += dir_xy[i]
-            yx[i] += dir_yx[i]
+            xx[i] += self.dir_xx[i]
+            yy[i] += self.dir_yy[i]
+            xy[i] += self.dir_xy[i]
+            yx[i] += self.dir_yx[i]
+
+    def draw(self, surface):
+        if self.trails:
+            # Draw with the next index in the ring. The oldest trail still
+            # holds that index: clear the pixels it has left (not the ones
+            # newer trails drew over) so it does not flash back at full
+            # brightness.
+            head = self.trail_head = self.trail_head % TRAIL_INDEXES + 1
+            oldest = self.trail_rects[head]
+            if oldest is not None:
+                with pygame.PixelArray(self.canvas) as pixels:
+                    for rect in self.trail_lines[head]:
+                        pixels[rect.left:rect.right, rect.top:rect.bottom].replace(
+                            head, BACKGROUND_INDEX)
+            self.trail_colors[head] = self.color
+            bounds = self.canvas.get_rect()
+            drawn = [rect.clip(bounds) for rect in
+                     draw_polygon(self.canvas, head, self.points, self.line_width)]
+            # Pieces wholly off the canvas clip to nothing; a PixelArray
+            # slice of no pixels is None
+            drawn = [rect for rect in drawn if rect]
+            self.trail_lines[head] = drawn
+            self.trail_rects[head] = drawn[0].unionall(drawn[1:]) if drawn else None
+            self.canvas.set_palette(build_trail_palette(self.trail_colors, head))
+
+            # Every live trail changed color; upload their bounding box
+            # (and the cleared one)
+            live = [rect for rect in self.trail_rects if rect is not None]
+            if oldest is not None:
+                live.append(oldest)
+            dirty_rects = [live[0].unionall(live[1:])] if live else []
+            for rect in dirty_rects:
+                surface.blit(self.canvas, rect, rect)
+        elif self.indexed:
+            # Original: LINE ..., 0 to erase, PALETTE 1, LINE ..., 1 to draw.
+            # Index 1 only appears on the polygon, so only its area is dirty.
+            dirty_rects = []
+            if self.old_points is not None:
+                dirty_rects.extend(draw_polygon(self.canvas, BACKGROUND_INDEX,
+                                                self.old_points, self.line_width))
+            self.canvas.set_palette_at(POLYGON_INDEX, self.color)
+            dirty_rects.extend(draw_polygon(self.canvas, POLYGON_INDEX, self.points, self.line_width))
+            for rect in dirty_rects:
+                surface.blit(self.canvas, rect, rect)
+        else:
+            dirty_rects = []
+            if self.old_points is not None:
+                dirty_rects.extend(draw_polygon(surface, (0, 0, 0),
+                                                self.old_points, self.line_width))
+            dirty_rects.extend(draw_polygon(surface, self.color, self.points, self.line_width))
+
+        self.old_points = self.points
+        return dirty_rects
 
-        pygame.display.flip()
-        clock.tick(60)
+    def object_counts(self):
+        counts = {"points": NUM_POINTS}
+        if self.trails:
+            counts["trails"] = TRAIL_INDEXES
+        return counts
 
-    pygame.quit()
-    sys.exit()
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="SCREEN.py - Color-Cycling Polygon (Python port of SCREEN.BAS)",
+    )
+    parser.add_argument(
+        "--indexed", action="store_true",
+        help="Draw with palette indices on an 8-bit surface and animate color with set_palette",
+    )
+    parser.add_argument(
+        "--trails", action="store_true",
+        help="Keep every polygon on screen and fade them by palette rotation (implies --indexed)",
+    )
+    add_display_arguments(parser)
+    add_replay_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    saver_main(ScreenScene, args, {"indexed": args.indexed, "trails": args.trails})
 
 
 if __name__ == "__main__":
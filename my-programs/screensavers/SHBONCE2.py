@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+SHBONCE2.py - Bouncing Mesh Screensaver
+
+Original: SHBONCE2.BAS (~1995)
+Converted to modern Python with pygame and NumPy
+
+SHBONCE2.BAS bounced ten points (five "lins", each with two ends) and
+joined every point to every other with a line in color 1, whose PALETTE
+entry cycled through blues tinted by where the first point was. Each
+frame it erased the old mesh by drawing all of it again in black: three
+LINEs for each of 5 x 5 pairs, 150 line draws to show 45 edges.
+
+Joining n points to each other is n * (n - 1) / 2 edges, 12.5 million at
+5,000 points. This version only joins points closer than --distance,
+found through the uniform grid shared with BOUNCE3.py (cells one distance wide,
+so a point's neighbors are in its own cell or the 8 around it), and
+fades each edge with its length. The edges are not drawn one
+pygame.draw.line at a time either: all of them are rasterized together
+with array arithmetic, their alphas summed per pixel with np.add.at,
+and the sums written as palette indexes into an 8-bit surface whose
+palette ramps from black to the original's cycling color.
+
+With the original 10 points the distance covers the whole screen, so the
+mesh is complete like SHBONCE2.BAS; with more points it defaults to the
+distance that gives each point about MESH_NEIGHBORS neighbors.
+
+Usage:
+  python SHBONCE2.py                   # 10 points, every pair joined
+  python SHBONCE2.py --points 5000
+  python SHBONCE2.py --points 5000 --distance 20 --benchmark 600
+
+The display, benchmark and replay options shared by all savers are
+described in saver_engine.py.
+
+Controls:
+  F3 - Frame-time HUD
+  ESC or close window to quit
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+
+from saver_engine import Scene, add_display_arguments, add_replay_arguments, saver_main
+from saver_raster import grid_pairs, rasterize_segments
+from saver_startup import lazy_import
+
+np = lazy_import("numpy")
+pygame = lazy_import("pygame")
+
+
+# Original: CONST lins = 5, two points per line
+NUM_POINTS = 10
+
+# Points per neighborhood when --distance is not given and there are more
+# points than the original's
+MESH_NEIGHBORS = 8
+
+# Original: dir = INT(RND * 3) + 1 after a wall hit
+MAX_STEP = 3
+
+# Original: blue = blue + bld, bouncing between 1 and 63 (VGA DAC levels)
+BLUE_MIN = 1
+BLUE_MAX = 63
+
+class MeshScene(Scene):
+    """Bouncing points joined to their near neighbors (SHBONCE2.BAS)."""
+
+    name = "SHBONCE2"
+    caption = "SHBONCE2.py - Bouncing Mesh (ESC to quit)"
+    per_frame_counts = ("edges",)
+
+    def __init__(self, size, rng, points=NUM_POINTS, distance=None):
+        super().__init__(size, rng, points=points, distance=distance)
+        self.num_points = points
+        if distance is not None:
+            distance *= self.scale
+        elif points <= NUM_POINTS:
+            distance = math.hypot(self.width, self.height)
+        else:
+            distance = math.sqrt(MESH_NEIGHBORS * self.width * self.height / (math.pi * points))
+        self.distance = max(1.0, distance)
+
+        # Original: xx(a) = INT(RND * maxx) + 1 and so on, all moving 1 to start
+        self.point_rng = point_rng = np.random.default_rng(rng.getrandbits(64))
+        self.x = point_rng.integers(0, self.width, points).astype(np.float64)
+        self.y = point_rng.integers(0, self.height, points).astype(np.float64)
+        self.step_x = np.full(points, self.scale)
+        self.step_y = np.full(points, self.scale)
+        if points > NUM_POINTS:
+            # A big cloud all moving down-right would drift as one block
+            # until the walls broke it up
+            for step in (self.step_x, self.step_y):
+                step *= point_rng.choice((-1, 1), points) * point_rng.integers(1, MAX_STEP + 1, points)
+
+        # Original: PALETTE 1, 65536 * blue + 256 * green + red
+        self.blue = 0
+        self.blue_step = 1
+
+        # Edges found this frame, as point index pairs and alphas
+        self.first = self.second = np.empty(0, dtype=np.intp)
+        self.alpha = np.empty(0)
+
+        self.intensity = np.zeros((self.height, self.width), dtype=np.float32)
+        self.canvas = None
+
+    def bounce(self):
+        """Original: on reaching a wall each coordinate gets a new speed of 1 to 3."""
+        for position, step, limit in ((self.x, self.step_x, self.width - 1),
+                                      (self.y, self.step_y, self.height - 1)):
+            for hit, sign in ((position >= limit, -1), (position <= 0, 1)):
+                count = int(np.count_nonzero(hit))
+                if count:
+                    step[hit] = sign * self.point_rng.integers(1, MAX_STEP + 1, count) * self.scale
+
+    def find_edges(self):
+        """Pairs of points closer than the distance, and their alphas."""
+        first, second = grid_pairs(self.x, self.y, self.distance, self.width, self.height)
+        delta_x = self.x[second] - self.x[first]
+        delta_y = self.y[second] - self.y[first]
+        length = np.hypot(delta_x, delta_y)
+        near = length < self.distance
+        self.first, self.second = first[near], second[near]
+        # Short edges are solid, edges about to break are nearly invisible
+        self.alpha = 1.0 - length[near] / self.distance
+
+    def update(self):
+        self.bounce()
+        self.x += self.step_x
+        self.y += self.step_y
+        np.clip(self.x, 0, self.width - 1, out=self.x)
+        np.clip(self.y, 0, self.height - 1, out=self.y)
+        self.find_edges()
+
+        self.blue += self.blue_step
+        if self.blue >= BLUE_MAX:
+            self.blue_step = -1
+        if self.blue <= BLUE_MIN:
+            self.blue_step = 1
+
+    def mesh_color(self) -> tuple[int, int, int]:
+        """Original: green = ABS(INT(xx(1) * .098)), red = ABS(INT(yy(1) * .13))."""
+        green = abs(int(self.x[0] * 640 / self.width * 0.098))
+        red = abs(int(self.y[0] * 480 / self.height * 0.13))
+        # VGA DAC levels are 0-63
+        return (min(255, red * 4), min(255, green * 4), min(255, self.blue * 4))
+
+    def start(self, surface):
+        super().start(surface)
+        if self.canvas is None:
+            self.canvas = pygame.Surface((self.width, self.height), depth=8)
+
+    def draw(self, surface):
+        red, green, blue = self.mesh_color()
+        self.canvas.set_palette([(red * level // 255, green * level // 255, blue * level // 255)
+                                 for level in range(256)])
+
+        intensity = self.intensity
+        intensity.fill(0)
+        rasterize_segments(intensity, self.x[self.first], self.y[self.first],
+                           self.x[self.second], self.y[self.second], self.alpha)
+        levels = intensity * 255
+        np.minimum(levels, 255, out=levels)
+        pygame.surfarray.blit_array(self.canvas, levels.astype(np.uint8).T)
+        surface.blit(self.canvas, (0, 0))
+        return None  # the mesh is everywhere
+
+    def object_counts(self):
+        return {"points": self.num_points, "edges": len(self.first)}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="SHBONCE2.py - Bouncing Mesh (Python port of SHBONCE2.BAS)",
+    )
+    parser.add_argument(
+        "--points", type=int, default=NUM_POINTS,
+        help=f"Number of points (default: {NUM_POINTS}, like the original)",
+    )
+    parser.add_argument(
+        "--distance", type=float, default=None,
+        help="Longest edge in 640x480 pixels (default: the whole screen for up to "
+             f"{NUM_POINTS} points, otherwise about {MESH_NEIGHBORS} neighbors per point)",
+    )
+    add_display_arguments(parser)
+    add_replay_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    saver_main(MeshScene, args, {"points": args.points, "distance": args.distance})
+
+
+if __name__ == "__main__":
+    main()
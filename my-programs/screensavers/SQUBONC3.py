@@ -12,18 +12,21 @@ Easter eggs preserved from original:
   - "figers" (figures) typo in prompt
   - "pionts" (points) typo in prompt
 
+Pass --figures and --points to skip the prompts. The display, benchmark
+and replay options shared by all savers are described in saver_engine.py.
+
 Controls:
+  F3 - Frame-time HUD
   ESC or close window to quit
 """
 
-import pygame
-import random
-import sys
+import argparse
+
+from saver_engine import Scene, add_display_arguments, add_replay_arguments, draw_line, saver_main
+from saver_startup import lazy_import
 
+pygame = lazy_import("pygame")
 
-# VGA Screen 12 dimensions
-SCREEN_WIDTH = 640
-SCREEN_HEIGHT = 480
 
 # VGA 16-color palette
 VGA_PALETTE = [
@@ -81,93 +84,131 @@ def get_config():
     return figures, points
 
 
-def main():
-    # Get configuration before starting pygame
-    num_figures, num_points = get_config()
-
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("SQUBONC3.py - Bouncing Polygons (ESC to quit)")
-    clock = pygame.time.Clock()
-
-    # Initialize vertex positions and directions for each figure
-    # xx[figure][point] = x position, yx[figure][point] = y position
-    positions_x = []
-    positions_y = []
-    directions_x = []
-    directions_y = []
-
-    for _ in range(num_figures):
-        fig_x = [random.randint(1, SCREEN_WIDTH) for _ in range(num_points)]
-        fig_y = [random.randint(1, SCREEN_HEIGHT) for _ in range(num_points)]
-        fig_dx = [1 for _ in range(num_points)]
-        fig_dy = [1 for _ in range(num_points)]
-        positions_x.append(fig_x)
-        positions_y.append(fig_y)
-        directions_x.append(fig_dx)
-        directions_y.append(fig_dy)
-
-    # Color cycles slowly
-    color_value = 1.0
-
-    running = True
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-
-        # Clear screen
-        screen.fill((0, 0, 0))
+class SquareBounceScene(Scene):
+    """Several bouncing polygons with color cycling (SQUBONC3.BAS)."""
+
+    name = "SQUBONC3"
+    caption = "SQUBONC3.py - Bouncing Polygons (ESC to quit)"
+
+    def __init__(self, size, rng, figures=3, points=4):
+        super().__init__(size, rng, figures=figures, points=points)
+        self.num_figures = figures
+        self.num_points = points
+
+        # Initialize vertex positions and directions for each figure
+        # xx[figure][point] = x position, yx[figure][point] = y position
+        self.positions_x = []
+        self.positions_y = []
+        self.directions_x = []
+        self.directions_y = []
+
+        for _ in range(figures):
+            fig_x = [rng.randint(1, self.width) for _ in range(points)]
+            fig_y = [rng.randint(1, self.height) for _ in range(points)]
+            fig_dx = [self.scale for _ in range(points)]
+            fig_dy = [self.scale for _ in range(points)]
+            self.positions_x.append(fig_x)
+            self.positions_y.append(fig_y)
+            self.directions_x.append(fig_dx)
+            self.directions_y.append(fig_dy)
+
+        # Color cycles slowly
+        self.color_value = 1.0
+        self.current_color = VGA_PALETTE[1]
+
+        # Vertex lists to draw this frame, and the ones drawn last frame
+        self.polygons = []
+        self.old_polygons = []
+
+    def update(self):
+        scale = self.scale
 
         # Update color (cycles through palette)
-        color_value += 0.1
-        if color_value > 15:
-            color_value = 1
-        current_color = VGA_PALETTE[int(color_value)]
+        self.color_value += 0.1
+        if self.color_value > 15:
+            self.color_value = 1
+        self.current_color = VGA_PALETTE[int(self.color_value)]
+
+        self.polygons = []
+        for fig in range(self.num_figures):
+            positions_x = self.positions_x[fig]
+            positions_y = self.positions_y[fig]
+            directions_x = self.directions_x[fig]
+            directions_y = self.directions_y[fig]
 
-        # Update and draw each figure
-        for fig in range(num_figures):
             # Update directions when hitting edges
-            for pt in range(num_points):
-                if positions_x[fig][pt] >= SCREEN_WIDTH:
-                    directions_x[fig][pt] = -random.randint(1, 3)
-                if positions_x[fig][pt] <= 0:
-                    directions_x[fig][pt] = random.randint(1, 3)
-                if positions_y[fig][pt] >= SCREEN_HEIGHT:
-                    directions_y[fig][pt] = -random.randint(1, 3)
-                if positions_y[fig][pt] <= 0:
-                    directions_y[fig][pt] = random.randint(1, 3)
-
-            # Draw polygon by connecting adjacent points
-            for pt in range(num_points - 1):
-                pygame.draw.line(
-                    screen,
-                    current_color,
-                    (positions_x[fig][pt], positions_y[fig][pt]),
-                    (positions_x[fig][pt + 1], positions_y[fig][pt + 1])
-                )
-
-            # Connect last point back to first (close the polygon)
-            pygame.draw.line(
-                screen,
-                current_color,
-                (positions_x[fig][0], positions_y[fig][0]),
-                (positions_x[fig][num_points - 1], positions_y[fig][num_points - 1])
-            )
+            for pt in range(self.num_points):
+                if positions_x[pt] >= self.width:
+                    directions_x[pt] = -self.rng.randint(1, 3) * scale
+                if positions_x[pt] <= 0:
+                    directions_x[pt] = self.rng.randint(1, 3) * scale
+                if positions_y[pt] >= self.height:
+                    directions_y[pt] = -self.rng.randint(1, 3) * scale
+                if positions_y[pt] <= 0:
+                    directions_y[pt] = self.rng.randint(1, 3) * scale
+
+            self.polygons.append([(round(x), round(y))
+                                  for x, y in zip(positions_x, positions_y)])
 
             # Update positions
-            for pt in range(num_points):
-                positions_x[fig][pt] += directions_x[fig][pt]
-                positions_y[fig][pt] += directions_y[fig][pt]
+            for pt in range(self.num_points):
+                positions_x[pt] += directions_x[pt]
+                positions_y[pt] += directions_y[pt]
+
+    def draw(self, surface):
+        dirty_rects = []
+
+        # Erase last frame's polygons, then draw this frame's
+        for polygon in self.old_polygons:
+            dirty_rects.extend(self.draw_polygon(surface, (0, 0, 0), polygon))
+        for polygon in self.polygons:
+            dirty_rects.extend(self.draw_polygon(surface, self.current_color, polygon))
+
+        self.old_polygons = self.polygons
+        return dirty_rects
+
+    def object_counts(self):
+        return {"figures": self.num_figures, "lines": self.num_figures * self.num_points}
+
+    def draw_polygon(self, surface, color, points: list) -> list:
+        """Connect adjacent points and close the polygon."""
+        dirty_rects = []
+        for pt in range(self.num_points - 1):
+            dirty_rects.extend(draw_line(surface, color, points[pt], points[pt + 1],
+                                         self.line_width))
+
+        # Connect last point back to first (close the polygon)
+        dirty_rects.extend(draw_line(surface, color, points[0], points[self.num_points - 1],
+                                     self.line_width))
+        return dirty_rects
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="SQUBONC3.py - Bouncing Polygons (Python port of SQUBONC3.BAS)",
+    )
+    parser.add_argument("--figures", type=int, choices=range(1, 21), metavar="1-20",
+                        help="Number of figures (skips the prompt)")
+    parser.add_argument("--points", type=int, choices=range(1, 21), metavar="1-20",
+                        help="Number of points per figure (skips the prompt)")
+    add_display_arguments(parser)
+    add_replay_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
 
-        pygame.display.flip()
-        clock.tick(60)
+    # Get configuration before starting pygame (a replay brings its own)
+    if args.replay or args.benchmark:
+        num_figures, num_points = args.figures or 3, args.points or 4
+    elif args.figures and args.points:
+        num_figures, num_points = args.figures, args.points
+    else:
+        num_figures, num_points = get_config()
 
-    pygame.quit()
-    sys.exit()
+    saver_main(SquareBounceScene, args, {"figures": num_figures, "points": num_points})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+STARFIEL.py - 3D Starfield Screensaver
+
+Original: 90s-shareware/STARFIEL.BAS (by Andrew Jones, 1/25/96) and
+          90s-shareware/STARFILD.BAS (the "Standard" starfield)
+Converted to modern Python with pygame and NumPy
+
+STARFIEL.BAS admitted it was "only an illusion of 3D stars, the stars
+have no "Z" direction": each star slid outward from the center by a
+fixed step. Here every star has a real depth and is projected with
+x / z, so stars start as dim specks near the middle and streak out,
+brightening, as they come closer. The shading uses STARFILD.BAS's
+20-step gray ramp loaded at palette index 200.
+
+The original looped over NumStars (1000, "Modify this to your CPU
+speed!") with two PSETs per star. This version keeps position and depth
+in NumPy arrays, moves and projects every star in one vectorized pass,
+and plots them by writing palette indexes straight into the 8-bit
+surface's pixel array: last frame's pixels are set to 0, then the new
+ones are set, which is the original's PSET erase done for all stars at
+once. A hundred thousand stars still fit in a frame.
+
+Usage:
+  python STARFIEL.py                   # 1000 stars, like the original
+  python STARFIEL.py --stars 100000
+  python STARFIEL.py --stars 200000 --benchmark 600   # stars/second
+
+The display, benchmark and replay options shared by all savers are
+described in saver_engine.py.
+
+Controls:
+  + / - - Faster / slower
+  F3 - Frame-time HUD
+  ESC or close window to quit
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from saver_engine import (SCREEN_13_SIZE, Scene, add_display_arguments, add_replay_arguments,
+                          saver_main)
+from saver_startup import lazy_import
+
+np = lazy_import("numpy")
+pygame = lazy_import("pygame")
+
+
+# Original: CONST NumStars = 1000 'Modify this to your CPU speed!  150 is real nice.
+NUM_STARS = 1000
+
+# STARFILD.BAS: OUT &H3C8, 200 then 20 grays of t * 3 + 3 (VGA DAC 0-63)
+GRAY_FIRST_INDEX = 200
+GRAY_LEVELS = 20
+
+# Depth runs from FAR (where stars are born) to NEAR (where they pass the
+# viewer); x and y are spread over [-SPREAD, SPREAD] at the far plane
+FAR = 1.0
+NEAR = 0.01
+SPREAD = 1.0
+
+# Depth travelled per frame at 1x speed, and the speed steps for + / -
+DEPTH_STEP = 0.004
+SPEED_FACTOR = 1.25
+MAX_SPEED = 20.0
+
+
+def gray_palette() -> list:
+    """Black everywhere except STARFILD.BAS's gray ramp at index 200."""
+    palette = [(0, 0, 0)] * 256
+    for level in range(GRAY_LEVELS):
+        value = min(255, ((level + 1) * 3 + 3) * 4)
+        palette[GRAY_FIRST_INDEX + level] = (value, value, value)
+    return palette
+
+
+class StarfieldScene(Scene):
+    """First-person 3D starfield over NumPy arrays (STARFIEL.BAS)."""
+
+    name = "STARFIEL"
+    caption = "STARFIEL.py - 3D Starfield (+/- speed, ESC to quit)"
+    logical_size = SCREEN_13_SIZE
+    input_keys = ("+", "=", "[+]", "-", "[-]")
+    per_frame_counts = ("stars",)
+
+    def __init__(self, size, rng, stars=NUM_STARS):
+        super().__init__(size, rng, stars=stars)
+        self.num_stars = stars
+        self.speed = 1.0
+
+        # NumPy generator seeded from the scene's rng, so runs stay reproducible
+        self.star_rng = np.random.default_rng(rng.getrandbits(64))
+        self.star_x = self.star_rng.uniform(-SPREAD, SPREAD, stars)
+        self.star_y = self.star_rng.uniform(-SPREAD, SPREAD, stars)
+        self.star_z = self.star_rng.uniform(NEAR, FAR, stars)
+
+        # Projection: a star at the far plane and the edge of the spread
+        # lands on the edge of the screen
+        self.center_x = self.width / 2
+        self.center_y = self.height / 2
+        self.focal = max(self.center_x, self.center_y)
+
+        # Pixel positions and colors plotted this frame and last frame
+        self.plot_x = np.empty(0, dtype=np.intp)
+        self.plot_y = np.empty(0, dtype=np.intp)
+        self.plot_color = np.empty(0, dtype=np.uint8)
+        self.old_x = self.plot_x
+        self.old_y = self.plot_y
+
+        # 8-bit canvas standing in for SCREEN 13 video memory, made in start()
+        self.canvas = None
+
+    def handle_key(self, key):
+        if key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+            self.speed = min(MAX_SPEED, self.speed * SPEED_FACTOR)
+        else:
+            self.speed = max(1 / MAX_SPEED, self.speed / SPEED_FACTOR)
+
+    def respawn(self, passed: np.ndarray):
+        """Send stars that passed the viewer or left the screen back to the far plane."""
+        count = int(np.count_nonzero(passed))
+        if count:
+            self.star_x[passed] = self.star_rng.uniform(-SPREAD, SPREAD, count)
+            self.star_y[passed] = self.star_rng.uniform(-SPREAD, SPREAD, count)
+            self.star_z[passed] = FAR
+
+    def update(self):
+        self.star_z -= DEPTH_STEP * self.speed
+        self.respawn(self.star_z <= NEAR)
+
+        # Perspective projection for every star at once
+        inverse_z = self.focal / self.star_z
+        screen_x = (self.center_x + self.star_x * inverse_z).astype(np.intp)
+        screen_y = (self.center_y + self.star_y * inverse_z).astype(np.intp)
+
+        on_screen = ((screen_x >= 0) & (screen_x < self.width)
+                     & (screen_y >= 0) & (screen_y < self.height))
+        self.respawn(~on_screen)
+
+        # Nearer stars are brighter: far plane = first gray, near = last
+        shade = ((FAR - self.star_z[on_screen]) * (GRAY_LEVELS / (FAR - NEAR))).astype(np.intp)
+        np.clip(shade, 0, GRAY_LEVELS - 1, out=shade)
+
+        self.plot_x = screen_x[on_screen]
+        self.plot_y = screen_y[on_screen]
+        self.plot_color = (GRAY_FIRST_INDEX + shade).astype(np.uint8)
+
+    def start(self, surface):
+        super().start(surface)
+        if self.canvas is None:
+            self.canvas = pygame.Surface((self.width, self.height), depth=8)
+            self.canvas.set_palette(gray_palette())
+        self.canvas.fill(0)
+        self.old_x = self.old_y = np.empty(0, dtype=np.intp)
+
+    def draw(self, surface):
+        pixels = pygame.surfarray.pixels2d(self.canvas)
+        # Original: PSET (sx(t), sy(t)), 0 then PSET at the new position
+        pixels[self.old_x, self.old_y] = 0
+        pixels[self.plot_x, self.plot_y] = self.plot_color
+        del pixels  # unlock the canvas before blitting
+
+        self.old_x, self.old_y = self.plot_x, self.plot_y
+        surface.blit(self.canvas, (0, 0))
+        return None  # stars are everywhere
+
+    def object_counts(self):
+        return {"stars": self.num_stars, "plotted": len(self.plot_x),
+                "speed x100": round(self.speed * 100)}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="STARFIEL.py - 3D Starfield (Python port of STARFIEL.BAS)",
+    )
+    parser.add_argument(
+        "--stars", type=int, default=NUM_STARS,
+        help=f"Number of stars (default: {NUM_STARS}, like the original)",
+    )
+    add_display_arguments(parser)
+    add_replay_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    saver_main(StarfieldScene, args, {"stars": args.stars})
+
+
+if __name__ == "__main__":
+    main()
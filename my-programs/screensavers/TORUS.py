@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+TORUS.py - Spinning Torus Screensaver
+
+Original: samples/microsoft/TORUS.BAS (QuickBASIC 4.5 sample, 1091 lines)
+Converted to modern Python with pygame and NumPy
+
+The original asked for thickness, panels, sections and two tilt angles,
+then worked out the four corners of every tile one SIN and COS at a
+time (counting "Calculating" tiles on screen as it went), quicksorted a
+parallel array of tile indexes by depth, and painted the tiles farthest
+first with LINE and PAINT. The torus never moved again: "rotation" was
+the PALETTE entries of the 14 tile attributes being cycled.
+
+Here the torus really turns. The vertex grid, the four vertex indexes of
+every face and the per-face normals are built once with NumPy. Each frame
+rotates all vertices and all normals with one matrix product, drops the
+faces turned away from the viewer, shades the rest by their normal
+against a fixed light, and orders them farthest first with one argsort.
+The original's palette cycling still runs on top: each face is drawn in
+one of 16 shades of its attribute's palette entry, on an 8-bit surface.
+
+The motion repeats every ANGLE_STEPS steps, so the projected polygons and
+shades for each angle step are kept in a cache, as int16 and uint8 arrays
+(17 bytes a face); once the torus has gone round once, a frame only
+draws. A mesh too big for all the steps to fit in CACHE_BYTES keeps the
+steps it cached first and recomputes the rest: the steps come round in
+a cycle, so dropping the oldest to make room would miss every time.
+--no-cache recomputes every frame, for comparison with --benchmark.
+
+Usage:
+  python TORUS.py                       # the original's 8 x 14 tiles
+  python TORUS.py --panels 40 --sections 80 --thickness 2
+  python TORUS.py --panels 60 --sections 120 --benchmark 600 --no-cache
+  python TORUS.py --terminal
+
+The display, benchmark and replay options shared by all savers are
+described in saver_engine.py.
+
+Controls:
+  + / - - Spin faster / slower
+  B     - Tile borders on / off
+  F3    - Frame-time HUD
+  ESC or close window to quit
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from saver_engine import Scene, add_display_arguments, add_replay_arguments, saver_main
+from saver_startup import lazy_import
+
+np = lazy_import("numpy")
+pygame = lazy_import("pygame")
+
+
+# Original: TOR.Thick = 3: TOR.Panel = 8: TOR.Sect = 14
+THICKNESS = 3
+PANELS = 8
+SECTIONS = 14
+# Original: TOR.XDegree = 60: TOR.YDegree = 165
+X_DEGREE = 60
+Y_DEGREE = 165
+
+# One turn is ANGLE_STEPS steps; + / - choose how many steps a frame moves
+ANGLE_STEPS = 720
+SPEED = 2
+MAX_SPEED = 12
+
+# Angle steps stop being cached once the cache holds this many bytes
+CACHE_BYTES = 64 * 1024 * 1024
+
+# Original: VC.Atribs = 16 in SCREEN 12, first and last attributes skipped
+ATTRIBUTES = 14
+SHADES = 16
+BORDER = 0
+
+# Light from the upper left, in front of the screen; faces turned away
+# from it still get AMBIENT
+LIGHT = (-0.4, 0.5, 0.77)
+AMBIENT = 0.25
+
+# Original: TOR.Delay = .05 between palette rotations in SCREEN 12
+PALETTE_FRAMES = 3
+
+
+def torus_mesh(thickness: float, panels: int, sections: int
+               ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vertices, faces, face normals and face centers of a torus.
+
+    The ring has radius thickness and the tube radius 1, as in TorusCalc.
+    Vertex (panel, section) is at tube angle panel * 2pi / panels and ring
+    angle section * 2pi / sections; face k = panel * sections + section
+    joins the four vertices from there to the next panel and section,
+    which is the original's tile numbering.
+    """
+    tube = np.arange(panels) * (2 * np.pi / panels)
+    ring = np.arange(sections) * (2 * np.pi / sections)
+    tube_angle, ring_angle = np.meshgrid(tube, ring, indexing="ij")
+    reach = thickness + np.cos(tube_angle)
+    vertices = np.stack([reach * np.cos(ring_angle), reach * np.sin(ring_angle),
+                         np.sin(tube_angle)], axis=-1).reshape(-1, 3)
+
+    panel, section = np.meshgrid(np.arange(panels), np.arange(sections), indexing="ij")
+    next_panel = (panel + 1) % panels
+    next_section = (section + 1) % sections
+    faces = np.stack([panel * sections + section, panel * sections + next_section,
+                      next_panel * sections + next_section, next_panel * sections + section],
+                     axis=-1).reshape(-1, 4)
+
+    # The normal at the middle of a face points away from the tube's center
+    middle_tube = (tube_angle + np.pi / panels).reshape(-1)
+    middle_ring = (ring_angle + np.pi / sections).reshape(-1)
+    normals = np.stack([np.cos(middle_tube) * np.cos(middle_ring),
+                        np.cos(middle_tube) * np.sin(middle_ring),
+                        np.sin(middle_tube)], axis=-1)
+    centers = vertices[faces].mean(axis=1)
+    return vertices, faces, normals, centers
+
+
+def rotation(x_degrees: float, y_degrees: float) -> np.ndarray:
+    """Tilt around the horizontal axis, then turn around the vertical one."""
+    x_radians = np.radians(x_degrees)
+    y_radians = np.radians(y_degrees)
+    cos_x, sin_x = np.cos(x_radians), np.sin(x_radians)
+    cos_y, sin_y = np.cos(y_radians), np.sin(y_radians)
+    around_x = np.array([[1, 0, 0], [0, cos_x, -sin_x], [0, sin_x, cos_x]])
+    around_y = np.array([[cos_y, 0, sin_y], [0, 1, 0], [-sin_y, 0, cos_y]])
+    return around_y @ around_x
+
+
+def mixed_palette() -> list:
+    """Original SetPalette: 6 x 6 x 6 VGA colors, FOR Rs, then Bs, then Gs, STEP 11."""
+    levels = range(0, 64, 11)
+    return [(red * 4, green * 4, blue * 4)
+            for red in levels for blue in levels for green in levels]
+
+
+class TorusScene(Scene):
+    """A shaded, spinning torus drawn farthest face first (TORUS.BAS)."""
+
+    name = "TORUS"
+    caption = "TORUS.py - Spinning Torus (+/- speed, B borders, ESC to quit)"
+    input_keys = ("+", "=", "[+]", "-", "[-]", "b")
+    per_frame_counts = ("faces drawn",)
+
+    def __init__(self, size, rng, thickness=THICKNESS, panels=PANELS, sections=SECTIONS,
+                 cache=True):
+        super().__init__(size, rng, thickness=thickness, panels=panels, sections=sections,
+                         cache=cache)
+        self.vertices, self.faces, self.normals, self.centers = torus_mesh(
+            thickness, panels, sections)
+        self.face_count = len(self.faces)
+        self.light = np.array(LIGHT) / np.linalg.norm(LIGHT)
+
+        # Original: TorusColor hands out attributes 2, 3, ... 14, 1, 2, ...
+        self.attribute = (np.arange(self.face_count) + 1) % ATTRIBUTES + 1
+
+        # Original: WINDOW (-(TOR.Thick + 1), -(TOR.Thick + 1))-(TOR.Thick + 1, TOR.Thick + 1)
+        self.pixels_per_unit = min(self.width, self.height) / 2 / (thickness + 1)
+        radius = int(np.ceil((thickness + 1) * self.pixels_per_unit)) + 1
+        self.torus_rect = pygame.Rect(0, 0, 2 * radius, 2 * radius)
+        self.torus_rect.center = (self.width // 2, self.height // 2)
+        self.torus_rect = self.torus_rect.clip(pygame.Rect(0, 0, self.width, self.height))
+
+        self.angle_step = 0
+        self.speed = SPEED
+        self.borders = True
+
+        # Original: TorusRotate RNDM, then FirstClr = FirstClr - 1 each time
+        self.colors = mixed_palette()
+        self.last_color = min(len(self.colors), self.face_count) - 1
+        self.first_color = rng.randrange(self.last_color + 1)
+        self.palette_frames = 0
+        self.drawn_first_color = None
+
+        # angle step -> (polygons, palette indexes) of the visible faces,
+        # farthest first
+        self.use_cache = cache
+        self.cache = {}
+        self.cache_bytes = 0
+        self.cache_hits = 0
+        self.faces_drawn = 0
+        self.canvas = None
+
+    def handle_key(self, key):
+        if key == pygame.K_b:
+            self.borders = not self.borders
+        elif key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+            self.speed = min(MAX_SPEED, self.speed + 1)
+        else:
+            self.speed = max(1, self.speed - 1)
+
+    def update(self):
+        self.angle_step = (self.angle_step + self.speed) % ANGLE_STEPS
+
+        self.palette_frames += 1
+        if self.palette_frames >= PALETTE_FRAMES:
+            self.palette_frames = 0
+            # Original: IF FirstClr < 0 OR FirstClr >= LastClr THEN FirstClr = LastClr
+            self.first_color -= 1
+            if self.first_color < 0 or self.first_color >= self.last_color:
+                self.first_color = self.last_color
+
+    def project(self, angle_step: int) -> tuple[np.ndarray, np.ndarray]:
+        """Screen polygons and palette indexes of the faces seen at one angle step."""
+        turn = 360.0 * angle_step / ANGLE_STEPS
+        matrix = rotation(X_DEGREE + turn, Y_DEGREE + turn)
+
+        # All vertices and normals in one product each
+        vertices = self.vertices @ matrix.T
+        normals = self.normals @ matrix.T
+
+        # The viewer looks down -z: faces whose normal points away are hidden
+        facing = normals[:, 2] > 0
+        depth = self.centers[facing] @ matrix[2]
+        order = np.flatnonzero(facing)[np.argsort(depth, kind="stable")]
+
+        screen_x = self.width / 2 + vertices[:, 0] * self.pixels_per_unit
+        screen_y = self.height / 2 - vertices[:, 1] * self.pixels_per_unit
+        corners = self.faces[order]
+        polygons = np.stack([screen_x[corners], screen_y[corners]], axis=-1).round().astype(np.int16)
+
+        light = np.clip(normals[order] @ self.light, 0.0, 1.0)
+        shade = ((AMBIENT + (1 - AMBIENT) * light) * (SHADES - 1)).round().astype(int)
+        indexes = (self.attribute[order] * SHADES + shade).astype(np.uint8)
+        return polygons, indexes
+
+    def frame_geometry(self) -> tuple[np.ndarray, np.ndarray]:
+        if not self.use_cache:
+            return self.project(self.angle_step)
+        geometry = self.cache.get(self.angle_step)
+        if geometry is not None:
+            self.cache_hits += 1
+            return geometry
+
+        polygons, indexes = geometry = self.project(self.angle_step)
+        size = polygons.nbytes + indexes.nbytes
+        if self.cache_bytes + size <= CACHE_BYTES:
+            self.cache[self.angle_step] = geometry
+            self.cache_bytes += size
+        return geometry
+
+    def tile_palette(self) -> list:
+        """Original TorusRotate: PALETTE Atr, Pal(Work) for Atr = 14 TO 1, shaded."""
+        palette = [(0, 0, 0)] * 256
+        work = self.first_color
+        for attribute in range(ATTRIBUTES, 0, -1):
+            red, green, blue = self.colors[work]
+            for shade in range(SHADES):
+                level = shade / (SHADES - 1)
+                palette[attribute * SHADES + shade] = (round(red * level), round(green * level),
+                                                       round(blue * level))
+            work -= 1
+            if work < 0:
+                work = self.last_color
+        return palette
+
+    def start(self, surface):
+        super().start(surface)
+        if self.canvas is None:
+            self.canvas = pygame.Surface((self.width, self.height), depth=8)
+        self.canvas.fill(0)
+        self.drawn_first_color = None
+
+    def draw(self, surface):
+        if self.first_color != self.drawn_first_color:
+            self.canvas.set_palette(self.tile_palette())
+            self.drawn_first_color = self.first_color
+
+        polygons, indexes = self.frame_geometry()
+        # Back to plain ints: pygame.draw reads lists far faster than arrays
+        polygons = polygons.tolist()
+        indexes = indexes.tolist()
+        canvas = self.canvas
+        canvas.fill(0, self.torus_rect)
+        polygon = pygame.draw.polygon
+        if self.borders:
+            # Original: TOR.Bord = "YES" redraws each tile's edges in BACK
+            for points, index in zip(polygons, indexes):
+                polygon(canvas, index, points)
+                polygon(canvas, BORDER, points, 1)
+        else:
+            for points, index in zip(polygons, indexes):
+                polygon(canvas, index, points)
+        self.faces_drawn = len(indexes)
+
+        surface.blit(canvas, self.torus_rect, self.torus_rect)
+        return [self.torus_rect]
+
+    def object_counts(self):
+        return {"faces": self.face_count, "faces drawn": self.faces_drawn,
+                "cached steps": len(self.cache), "cache MB": round(self.cache_bytes / 2 ** 20, 1),
+                "cache hits": self.cache_hits}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="TORUS.py - Spinning Torus (Python port of TORUS.BAS)",
+    )
+    parser.add_argument(
+        "--thickness", type=float, default=THICKNESS,
+        help=f"Ring radius in tube radii (default: {THICKNESS}; the original allowed 1-9)",
+    )
+    parser.add_argument(
+        "--panels", type=int, default=PANELS,
+        help=f"Panels around the tube (default: {PANELS}; the original allowed 6-20)",
+    )
+    parser.add_argument(
+        "--sections", type=int, default=SECTIONS,
+        help=f"Sections around the ring (default: {SECTIONS}; the original allowed 6-20)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Recompute the rotated mesh every frame instead of caching each angle step",
+    )
+    add_display_arguments(parser)
+    add_replay_arguments(parser)
+    args = parser.parse_args()
+    if args.panels < 3 or args.sections < 3:
+        parser.error("--panels and --sections must be at least 3")
+    if args.thickness < 1:
+        parser.error("--thickness must be at least 1 (the tube radius)")
+    return args
+
+
+def main():
+    args = parse_args()
+    saver_main(TorusScene, args, {"thickness": args.thickness, "panels": args.panels,
+                                  "sections": args.sections, "cache": not args.no_cache})
+
+
+if __name__ == "__main__":
+    main()
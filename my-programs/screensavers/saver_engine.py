@@ -0,0 +1,706 @@
+#!/usr/bin/env python3
+"""
+saver_engine.py - Shared engine for the pygame screensavers
+
+Not a conversion of any single .BAS file. Each saver defines a Scene: a
+simulation that advances one frame in update() and renders in draw().
+All randomness goes through the scene's own seeded random.Random, so a
+run is fully determined by its seed, its options and the keys pressed.
+That makes runs reproducible:
+
+  python BOUNCE.py --seed 42 --record run.json   # save seed + keypresses
+  python BOUNCE.py --replay run.json              # play it back exactly
+  python BOUNCE.py --seed 42 --fast-forward 5000  # skip ahead, no drawing
+
+The originals never cleared the screen: they erased the previous shape
+by redrawing it in color 0 and only touched the pixels that changed. This
+module gives the Python savers the same habit on a modern display by
+uploading only the dirty rectangles of each frame instead of flipping the
+whole window. Rectangles that cover FLIP_COVERAGE of the screen are sent
+as one full frame instead, and a few overlapping ones as their bounding
+box (see coalesce_rects()).
+
+Scenes simulate and draw at a fixed logical resolution (640x480, or
+320x200 for mode 13 content) whatever the window size, so a bigger window
+never changes their speed or feel. The logical framebuffer is scaled up
+by the largest whole-number factor that fits, nearest-neighbor, into a
+preallocated area in the middle of the window; on dirty frames only the
+dirty rectangles are scaled. --native instead renders at the window's own
+resolution and scales the scene's speeds, sizes and line widths to match.
+
+Measured cost per frame (--benchmark, SDL dummy driver, so the upload to
+the display itself is not included; dirty rectangles / full flip):
+
+  window     scene     integer upscale           --native
+  1920x1080  BOUNCE    x2: 0.11 / 0.51 ms        0.08 / 0.06 ms
+  1920x1080  LINES     x2: 0.65 / 0.71 ms        0.53 / 0.30 ms
+  3840x2160  BOUNCE    x4: 0.94 / 4.7 ms         0.25 / 0.23 ms
+  3840x2160  LINES     x4: 1.0 / 4.2 ms          0.78 / 0.69 ms
+
+Integer upscaling adds one nearest-neighbor copy of the scaled area
+(2560x1920 at 4K) on full frames, but only the dirty strips otherwise,
+and keeps chunky VGA pixels with black borders. --native adds nothing to
+present, but every primitive is drawn at full resolution and in wider
+lines, so drawing-heavy scenes cost more as the window grows, and each
+uploaded dirty strip covers window pixels either way.
+
+It also holds the benchmark bookkeeping shared by the savers:
+
+  python BOUNCE.py --benchmark 600 --size 3840x2160
+
+runs the saver uncapped with dirty rectangles and again with full flips,
+then prints frames per second and pixels uploaded per frame for each.
+Benchmarks use seed 0 unless --seed is given, so every run and every code
+version draws exactly the same frames; the final frame digest printed with
+the results confirms it.
+
+Press F3 in any saver for a frame-time HUD, or pass --profile to write
+cProfile and tracemalloc results on exit; both live in saver_hud.py.
+--music TUNE loops a tune from the shareware music files in the
+background; saver_music.py renders it.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+
+from saver_hud import Hud, Profiler
+from saver_music import play_background, tune_argument
+from saver_startup import lazy_import
+
+# Imported on first use, after the arguments are parsed (see saver_startup.py)
+pygame = lazy_import("pygame")
+
+
+# VGA Screen 12 dimensions
+DEFAULT_WIDTH = 640
+DEFAULT_HEIGHT = 480
+
+# Logical resolutions scenes can be written for
+SCREEN_12_SIZE = (640, 480)
+SCREEN_13_SIZE = (320, 200)
+
+# Dirty rectangles covering this share of the screen are sent as one full
+# frame instead, and merged into their bounding box when it is at most
+# MERGE_SLACK times their area
+FLIP_COVERAGE = 0.5
+MERGE_SLACK = 1.5
+
+
+def parse_size(text: str) -> tuple[int, int]:
+    """Parse a window size like '1920x1080' into (width, height)."""
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"size must look like 640x480, got {text!r}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError("size must be positive")
+    return (width, height)
+
+
+def add_display_arguments(parser: argparse.ArgumentParser):
+    """Add the window size, dirty-rect and benchmark options to a saver's parser."""
+    parser.add_argument(
+        "--size", type=parse_size, default=(DEFAULT_WIDTH, DEFAULT_HEIGHT),
+        help=f"Window size as WIDTHxHEIGHT (default: {DEFAULT_WIDTH}x{DEFAULT_HEIGHT})",
+    )
+    parser.add_argument(
+        "--native", action="store_true",
+        help="Render at the window resolution and scale the physics, instead of upscaling",
+    )
+    parser.add_argument(
+        "--full-flip", action="store_true",
+        help="Upload the whole frame every tick instead of only dirty rectangles",
+    )
+    parser.add_argument(
+        "--benchmark", type=int, metavar="FRAMES", default=0,
+        help="Run FRAMES uncapped frames with dirty rectangles and with full flips, then report",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Run under cProfile and tracemalloc; write NAME.prof and NAME-memory.txt on exit",
+    )
+    parser.add_argument(
+        "--terminal", nargs="?", const="braille", choices=("braille", "halfblock"),
+        help="Draw in this terminal with ANSI escapes instead of a window (default: braille)",
+    )
+    parser.add_argument(
+        "--bandwidth", type=int, metavar="BYTES", default=0,
+        help="With --terminal, send at most BYTES per second (default: unlimited)",
+    )
+    parser.add_argument(
+        "--music", type=tune_argument, metavar="TUNE",
+        help="Loop the PLAY strings of a .BAS file, e.g. BASMUSIC:StarWars (see saver_music.py)",
+    )
+
+
+def add_replay_arguments(parser: argparse.ArgumentParser):
+    """Add the seed, record/replay and fast-forward options to a saver's parser."""
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="Seed for the scene's random numbers (default: random, 0 when benchmarking)",
+    )
+    parser.add_argument(
+        "--record", metavar="FILE",
+        help="Write the seed, options and keypresses of this run to FILE",
+    )
+    parser.add_argument(
+        "--replay", metavar="FILE",
+        help="Replay a run recorded with --record, frame for frame",
+    )
+    parser.add_argument(
+        "--fast-forward", type=int, metavar="FRAMES", default=0,
+        help="Simulate FRAMES frames without drawing before the window starts updating",
+    )
+
+
+def line_dirty_rects(start: tuple[int, int], end: tuple[int, int],
+                     segment_length: int = 32, width: int = 1) -> list:
+    """
+    Cover a line with small rectangles instead of one bounding box.
+
+    A diagonal line's bounding box is mostly empty, so for long lines the
+    span is cut into pieces of about segment_length pixels and each piece
+    gets its own box, padded to cover the rasterized line and its width.
+    """
+    start_x, start_y = start
+    end_x, end_y = end
+    span = max(abs(end_x - start_x), abs(end_y - start_y))
+    pieces = max(1, -(-span // segment_length))
+
+    pad = width // 2 + 1
+    rects = []
+    previous_x, previous_y = start_x, start_y
+    for piece in range(1, pieces + 1):
+        next_x = start_x + (end_x - start_x) * piece // pieces
+        next_y = start_y + (end_y - start_y) * piece // pieces
+        left = min(previous_x, next_x) - pad
+        top = min(previous_y, next_y) - pad
+        rects.append(pygame.Rect(left, top,
+                                 abs(next_x - previous_x) + 2 * pad + 1,
+                                 abs(next_y - previous_y) + 2 * pad + 1))
+        previous_x, previous_y = next_x, next_y
+    return rects
+
+
+def draw_line(surface, color, start: tuple[int, int], end: tuple[int, int],
+              width: int = 1) -> list:
+    """Draw a line and return the small rectangles that cover it."""
+    pygame.draw.line(surface, color, start, end, width)
+    return line_dirty_rects(start, end, width=width)
+
+
+def coalesce_rects(rects: list, bounds) -> tuple[list | None, int]:
+    """
+    The rectangles to upload for rects, or None for a full frame, and their pixels.
+
+    Rectangles are clipped to bounds. Once they cover FLIP_COVERAGE of it,
+    one full upload costs about the same and skips the per-rectangle work,
+    so the answer is None. Otherwise they become their one bounding box
+    when that is at most MERGE_SLACK times their area and still under
+    FLIP_COVERAGE (a moving shape's erase and redraw boxes, say), or stay
+    as they are.
+    """
+    clipped = [bounds.clip(rect) for rect in rects if bounds.colliderect(rect)]
+    pixels = sum(rect.width * rect.height for rect in clipped)
+    full = bounds.width * bounds.height
+    if pixels >= FLIP_COVERAGE * full:
+        return None, full
+    if len(clipped) > 1:
+        box = clipped[0].unionall(clipped[1:])
+        box_pixels = box.width * box.height
+        if box_pixels <= MERGE_SLACK * pixels and box_pixels < FLIP_COVERAGE * full:
+            return [box], box_pixels
+    return clipped, pixels
+
+
+class Scene:
+    """
+    One screensaver animation, split into simulation and drawing.
+
+    update() advances the simulation by one frame and is the only place a
+    scene may use self.rng. draw() renders the current state without
+    touching the simulation, and returns the rectangles it changed (or None
+    if the whole surface changed). Keeping the two apart is what allows a
+    run to be replayed exactly or fast-forwarded without rendering.
+
+    Keyword options passed to the constructor are kept in self.options so
+    a recorded run can rebuild the same scene.
+
+    A scene is written for logical_size. When it is built at another size
+    (--native), self.scale says how much bigger that is, and the scene
+    multiplies its speeds and sizes by it; line_width follows along.
+    """
+
+    name = "SCENE"
+    caption = "Screensaver (ESC to quit)"
+    logical_size = SCREEN_12_SIZE
+
+    # Names of the keys handled by handle_key(), as pygame.key.name() gives
+    # them ("+", "[+]", "space"); only these are recorded
+    input_keys: tuple = ()
+
+    # Where the window opens, if the saver cares
+    window_position: tuple[int, int] | None = None
+
+    # object_counts() entries that are work done every frame; benchmarks
+    # report them per second
+    per_frame_counts: tuple = ()
+
+    def __init__(self, size: tuple[int, int], rng: random.Random, **options):
+        self.width, self.height = size
+        self.rng = rng
+        self.options = options
+        self.scale = min(self.width / self.logical_size[0],
+                         self.height / self.logical_size[1])
+        self.line_width = max(1, round(self.scale))
+
+    def start(self, surface):
+        """Prepare the surface before the first frame is drawn."""
+        surface.fill((0, 0, 0))
+
+    def handle_key(self, key: int):
+        """React to the pygame key code of one of input_keys."""
+
+    def update(self):
+        """Advance the simulation by one frame."""
+        raise NotImplementedError
+
+    def draw(self, surface) -> list | None:
+        """Render the current state; return the dirty rectangles or None."""
+        raise NotImplementedError
+
+    def stop(self):
+        """Release anything the scene holds on to, such as worker processes."""
+
+    def object_counts(self) -> dict:
+        """Named counts of what the scene is juggling, for the F3 HUD."""
+        return {}
+
+
+def key_codes(names) -> frozenset:
+    """pygame key codes for key names such as "+", "[+]" or "space"."""
+    return frozenset(pygame.key.key_code(name) for name in names)
+
+
+@dataclass
+class EventLog:
+    """
+    Everything needed to replay a run: seed, size, options and keypresses.
+
+    Keys are stored by pygame name against the frame they arrived on, so a
+    log is a few hundred bytes of JSON no matter how long the run was.
+    """
+
+    saver: str
+    seed: int
+    size: tuple[int, int]
+    options: dict = field(default_factory=dict)
+    frames: int = 0
+    events: list = field(default_factory=list)
+    native: bool = False
+
+    def record(self, frame: int, key: int):
+        self.events.append([frame, pygame.key.name(key)])
+
+    def keys_by_frame(self) -> dict:
+        """Map each frame number to the pygame key codes pressed on it."""
+        keys = {}
+        for frame, key_name in self.events:
+            keys.setdefault(frame, []).append(pygame.key.key_code(key_name))
+        return keys
+
+    def save(self, path: str):
+        with open(path, "w") as log_file:
+            json.dump({
+                "saver": self.saver,
+                "seed": self.seed,
+                "size": list(self.size),
+                "options": self.options,
+                "native": self.native,
+                "frames": self.frames,
+                "events": self.events,
+            }, log_file)
+
+    @classmethod
+    def load(cls, path: str) -> "EventLog":
+        with open(path) as log_file:
+            data = json.load(log_file)
+        return cls(data["saver"], data["seed"], tuple(data["size"]),
+                   data.get("options", {}), data.get("frames", 0),
+                   data.get("events", []), data.get("native", False))
+
+
+class Framebuffer:
+    """
+    The surface a scene draws on, and how it gets to the window.
+
+    At logical resolution the scene draws into an offscreen surface that is
+    scaled by a whole-number factor, nearest-neighbor, straight into a
+    subsurface of the window allocated once up front. In native mode, or
+    when the factor is 1 and the sizes match, the scene draws on the window
+    itself and nothing is scaled.
+    """
+
+    def __init__(self, window, logical_size: tuple[int, int] | None):
+        self.window = window
+        window_width, window_height = window.get_size()
+        self.target = None
+        self.factor = 1
+        self.offset = (0, 0)
+
+        if logical_size is None or logical_size == (window_width, window_height):
+            self.surface = window
+            return
+
+        logical_width, logical_height = logical_size
+        self.factor = max(1, min(window_width // logical_width,
+                                 window_height // logical_height))
+        scaled_width = min(window_width, logical_width * self.factor)
+        scaled_height = min(window_height, logical_height * self.factor)
+        self.offset = ((window_width - scaled_width) // 2,
+                       (window_height - scaled_height) // 2)
+        self.surface = pygame.Surface(logical_size, 0, window)
+        self.target = window.subsurface(pygame.Rect(self.offset, (scaled_width, scaled_height)))
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.surface.get_size()
+
+    def clear(self):
+        """Black out the window, including any border around the scaled area."""
+        self.window.fill((0, 0, 0))
+        self.surface.fill((0, 0, 0))
+
+    def present(self, dirty_rects: list | None, stats: "FrameStats | None" = None,
+                hud: Hud | None = None):
+        """Scale what changed onto the window and show it."""
+        if self.target is None:
+            present(dirty_rects, stats, hud)
+            return
+
+        if dirty_rects is not None:
+            dirty_rects, _ = coalesce_rects(dirty_rects, self.surface.get_rect())
+        if dirty_rects is None:
+            pygame.transform.scale(self.surface, self.target.get_size(), self.target)
+            present(None, stats, hud)
+            return
+
+        target_bounds = self.target.get_rect()
+        factor = self.factor
+        window_rects = []
+        for rect in dirty_rects:
+            scaled = target_bounds.clip(pygame.Rect(rect.x * factor, rect.y * factor,
+                                                    rect.width * factor, rect.height * factor))
+            if not scaled.width or not scaled.height:
+                continue
+            pygame.transform.scale(self.surface.subsurface(rect), scaled.size,
+                                   self.target.subsurface(scaled))
+            window_rects.append(scaled.move(self.offset))
+        present(window_rects, stats, hud)
+
+
+class FrameStats:
+    """Counts frames, elapsed time and pixels sent to the display."""
+
+    def __init__(self, label: str, screen_size: tuple[int, int]):
+        self.label = label
+        self.frame_pixels = screen_size[0] * screen_size[1]
+        self.frames = 0
+        self.pixels_uploaded = 0
+        self.start_time = time.perf_counter()
+        self.end_time = self.start_time
+
+    def record_frame(self, pixels: int):
+        self.frames += 1
+        self.pixels_uploaded += pixels
+        self.end_time = time.perf_counter()
+
+    @property
+    def fps(self) -> float:
+        elapsed = self.end_time - self.start_time
+        return self.frames / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def pixels_per_frame(self) -> float:
+        return self.pixels_uploaded / self.frames if self.frames else 0.0
+
+    def summary(self) -> str:
+        share = 100.0 * self.pixels_per_frame / self.frame_pixels
+        return (f"{self.label:>12}: {self.fps:8.1f} FPS, "
+                f"{self.pixels_per_frame:12,.0f} pixels/frame ({share:5.1f}% of screen)")
+
+
+def present(dirty_rects: list | None, stats: FrameStats | None = None, hud: Hud | None = None):
+    """
+    Show the frame on screen.
+
+    With a list of rectangles only those areas are uploaded (merged or
+    turned into a full frame by coalesce_rects); with None the whole
+    window is flipped. Pass a FrameStats to count the pixels sent, and the
+    Hud to draw its panel over this frame.
+    """
+    screen = pygame.display.get_surface()
+    if hud is not None:
+        hud_rects = hud.draw(screen)
+        if dirty_rects is not None:
+            dirty_rects = dirty_rects + hud_rects
+    if dirty_rects is not None:
+        dirty_rects, pixels = coalesce_rects(dirty_rects, screen.get_rect())
+    if dirty_rects is None:
+        pygame.display.flip()
+        pixels = screen.get_width() * screen.get_height()
+    else:
+        pygame.display.update(dirty_rects)
+
+    if hud is not None:
+        hud.restore(screen)
+    if stats is not None:
+        stats.record_frame(pixels)
+
+
+def fast_forward(scene: Scene, frames: int, scripted_keys: dict | None = None,
+                 event_log: EventLog | None = None) -> int:
+    """Run the simulation for frames frames without drawing anything."""
+    scripted_keys = scripted_keys or {}
+    for frame in range(frames):
+        for key in scripted_keys.get(frame, ()):
+            scene.handle_key(key)
+            if event_log is not None:
+                event_log.record(frame, key)
+        scene.update()
+    return frames
+
+
+def make_framebuffer(window, scene_class: type, native: bool = False) -> Framebuffer:
+    """Framebuffer for scene_class: its logical size, or the window's own size."""
+    return Framebuffer(window, None if native else scene_class.logical_size)
+
+
+def run_scene(scene: Scene, framebuffer: Framebuffer, use_dirty_rects: bool = True,
+              max_frames: int = 0, frame_rate: int = 60, stats: FrameStats | None = None,
+              replay: EventLog | None = None, event_log: EventLog | None = None,
+              start_frame: int = 0, hud: Hud | None = None) -> int:
+    """
+    Run a scene on a framebuffer until quit, or for max_frames frames if given.
+
+    Keys listed in scene.input_keys are passed to the scene and written to
+    event_log. When replaying, live keys are ignored (except ESC and F3)
+    and the logged keys are fed back on the frames they were recorded.
+    F3 toggles the HUD. Returns the number of frames simulated.
+    """
+    clock = pygame.time.Clock()
+    hud = hud or Hud()
+    scene_keys = key_codes(scene.input_keys)
+    scripted_keys = replay.keys_by_frame() if replay else {}
+
+    frame = fast_forward(scene, start_frame, scripted_keys, event_log)
+
+    framebuffer.clear()
+    scene.start(framebuffer.surface)
+    framebuffer.present(None)
+
+    running = True
+    while running:
+        timing = hud.visible
+        if timing:
+            hud.begin_frame()
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_F3:
+                    hud.toggle()
+                elif replay is None and event.key in scene_keys:
+                    scene.handle_key(event.key)
+                    if event_log is not None:
+                        event_log.record(frame, event.key)
+
+        for key in scripted_keys.get(frame, ()):
+            scene.handle_key(key)
+            if event_log is not None:
+                event_log.record(frame, key)
+
+        if timing:
+            hud.lap("events")
+
+        scene.update()
+        if timing:
+            hud.lap("sim")
+        dirty_rects = scene.draw(framebuffer.surface)
+        if not use_dirty_rects:
+            dirty_rects = None
+        if timing:
+            hud.lap("draw")
+            hud.observe(scene)
+        framebuffer.present(dirty_rects, stats, hud if hud.active else None)
+        if timing:
+            hud.lap("flip")
+        clock.tick(frame_rate)
+
+        frame += 1
+        if max_frames and frame >= max_frames:
+            running = False
+
+    scene.stop()
+    if event_log is not None:
+        event_log.frames = frame
+    return frame
+
+
+def frame_digest(surface) -> str:
+    """Short hash of the surface's pixels, for checking two runs drew the same."""
+    return hashlib.sha1(pygame.image.tobytes(surface, "RGB")).hexdigest()[:12]
+
+
+def report_benchmark(dirty: FrameStats, full: FrameStats):
+    """Print the dirty-rect and full-flip results side by side."""
+    print()
+    print(dirty.summary())
+    print(full.summary())
+    if full.fps > 0:
+        print(f"{'FPS gain':>12}: {dirty.fps / full.fps:8.2f}x with dirty rectangles")
+
+
+def run_benchmark(scene_class: type, framebuffer: Framebuffer, seed: int, frames: int,
+                  options: dict):
+    """
+    Run the same seeded workload with dirty rectangles and with full flips.
+
+    Both passes start from a fresh scene with the same seed, so they draw
+    identical frames and only the upload strategy differs.
+    """
+    window_size = framebuffer.window.get_size()
+    dirty_stats = FrameStats("dirty rects", window_size)
+    scene = scene_class(framebuffer.size, random.Random(seed), **options)
+    run_scene(scene, framebuffer, True, frames, 0, dirty_stats)
+    digest = frame_digest(framebuffer.surface)
+
+    full_stats = FrameStats("full flip", window_size)
+    run_scene(scene_class(framebuffer.size, random.Random(seed), **options), framebuffer,
+              False, frames, 0, full_stats)
+
+    width, height = framebuffer.size
+    print(f"\nWorkload: {scene_class.name} seed {seed}, {frames} frames, "
+          f"{width}x{height} scene x{framebuffer.factor} in "
+          f"{window_size[0]}x{window_size[1]} window, final frame {digest}")
+    report_benchmark(dirty_stats, full_stats)
+
+    counts = scene.object_counts()
+    for count_name in scene.per_frame_counts:
+        per_frame = counts[count_name]
+        print(f"{count_name:>12}: {per_frame:,} per frame, "
+              f"{per_frame * dirty_stats.fps / 1e6:,.2f} million per second")
+
+
+def run_saver(scene_class: type, framebuffer, args: argparse.Namespace, seed: int,
+              size: tuple[int, int], native: bool, options: dict, replay: EventLog | None):
+    """Benchmark, or run the scene with replay as asked; returns the recorded log."""
+    if args.benchmark:
+        run_benchmark(scene_class, framebuffer, seed, args.benchmark, options)
+        return None
+
+    event_log = (EventLog(scene_class.name, seed, size, options, native=native)
+                 if args.record else None)
+    scene = scene_class(framebuffer.size, random.Random(seed), **options)
+    run_scene(scene, framebuffer,
+              use_dirty_rects=not args.full_flip,
+              max_frames=replay.frames if replay else 0,
+              replay=replay,
+              event_log=event_log,
+              start_frame=args.fast_forward)
+    return event_log
+
+
+def saver_main(scene_class: type, args: argparse.Namespace, options: dict | None = None):
+    """
+    Open the window and run a scene with the parsed command line arguments.
+
+    Handles --seed, --record, --replay, --fast-forward, --benchmark and
+    --terminal the same way for every saver, then shuts pygame down and exits.
+    """
+    options = dict(options or {})
+    size = args.size
+    native = args.native
+
+    if args.replay:
+        replay = EventLog.load(args.replay)
+        seed, size, options, native = replay.seed, replay.size, replay.options, replay.native
+    else:
+        replay = None
+        if args.seed is not None:
+            seed = args.seed
+        elif args.benchmark:
+            seed = 0
+        else:
+            seed = random.randrange(2 ** 32)
+
+    if args.terminal:
+        # No window: the event queue still needs a video driver, so use
+        # SDL's headless one; keys typed in the terminal are posted to it
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        from saver_terminal import TerminalFramebuffer
+
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        framebuffer = TerminalFramebuffer(args.terminal, args.bandwidth)
+        framebuffer.open()
+        # The scene is built at the terminal's dot resolution
+        size, native = framebuffer.size, True
+    else:
+        if scene_class.window_position is not None:
+            x, y = scene_class.window_position
+            os.environ.setdefault("SDL_VIDEO_WINDOW_POS", f"{x},{y}")
+        # Video only: pygame.init() would also start audio, joysticks and more
+        pygame.display.init()
+        screen = pygame.display.set_mode(size)
+        pygame.display.set_caption(scene_class.caption)
+
+        # macOS: Bring window to front
+        if sys.platform == 'darwin':
+            pygame.display.set_mode(size)
+            pygame.event.pump()
+
+        framebuffer = make_framebuffer(screen, scene_class, native)
+
+    # Kept until exit: the tune stops when its Sound is collected
+    music = play_background(args.music) if args.music and not args.benchmark else None
+
+    # In the terminal, hold printed reports until the screen is restored
+    printed = io.StringIO()
+    profiler = Profiler(scene_class.name) if args.profile else None
+    event_log = None
+    try:
+        with contextlib.redirect_stdout(printed if args.terminal else sys.stdout):
+            if profiler is not None:
+                profiler.start()
+            try:
+                event_log = run_saver(scene_class, framebuffer, args, seed, size, native,
+                                      options, replay)
+            finally:
+                if profiler is not None:
+                    profiler.stop()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.terminal:
+            framebuffer.close()
+        print(printed.getvalue(), end="")
+
+    if event_log is not None:
+        event_log.save(args.record)
+        print(f"Recorded {event_log.frames} frames (seed {seed}) to {args.record}")
+
+    pygame.quit()
+    sys.exit()
+
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+saver_hud.py - Frame-time HUD and profiling for the pygame screensavers
+
+Not a conversion of any single .BAS file. Press F3 in any saver to show
+a panel with the frame rate, a graph of the last few seconds of frame
+times, how each frame's time splits between handling events, the
+simulation (update), drawing and presenting (scaling and upload), and the
+scene's own object counts.
+
+While the panel is hidden nothing is timed; run_scene only checks one
+flag per frame. While it is shown, the panel is drawn over the window
+just before the upload and the pixels under it are put back right after,
+so scenes that erase by redrawing in black never see it.
+
+  python LINES.py --profile
+
+runs the saver under cProfile and tracemalloc and on exit writes
+LINES.prof (load it with pstats or snakeviz) and LINES-memory.txt (the
+lines that allocated the most memory still held, and the peak), then
+prints the top functions by cumulative time.
+"""
+
+import time
+from collections import deque
+
+from saver_startup import lazy_import
+
+pygame = lazy_import("pygame")
+
+
+# Frames of history in the graph (about two seconds at 60 FPS)
+GRAPH_FRAMES = 120
+GRAPH_HEIGHT = 40
+# Frame time at the top of the graph, and the 60 FPS guide line
+GRAPH_MAX_MS = 50.0
+TARGET_MS = 1000.0 / 60
+
+# Text is re-rendered this often instead of every frame
+TEXT_REFRESH_FRAMES = 10
+
+PHASES = ("events", "sim", "draw", "flip")
+
+PANEL_COLOR = (0, 0, 0)
+TEXT_COLOR = (255, 255, 85)       # Yellow
+GRAPH_COLOR = (85, 255, 85)       # Light Green
+SLOW_COLOR = (255, 85, 85)        # Light Red
+GUIDE_COLOR = (85, 85, 85)        # Dark Gray
+
+PROFILE_TOP_FUNCTIONS = 15
+MEMORY_TOP_LINES = 25
+
+
+class Hud:
+    """
+    Frame timings and the F3 overlay panel.
+
+    run_scene calls begin_frame(), then lap(phase) after each phase while
+    the HUD is visible. The times of the last GRAPH_FRAMES frames are kept
+    for the graph and averages.
+    """
+
+    def __init__(self):
+        self.visible = False
+        self.frame_times = deque(maxlen=GRAPH_FRAMES)
+        self.phase_times = {phase: deque(maxlen=GRAPH_FRAMES) for phase in PHASES}
+        self.frame_started = None
+        self.lap_started = 0.0
+        self.counts = {}
+        self.font = None
+        self.text_lines = []
+        self.frames_since_text = TEXT_REFRESH_FRAMES
+        self.drawn_rect = None
+        self.saved_pixels = None
+        self.erase_pending = False
+
+    @property
+    def active(self) -> bool:
+        """True while the overlay needs drawing or erasing on the next present."""
+        return self.visible or self.erase_pending
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.frame_started = None
+        # Hidden: the panel is still on the display until the next present
+        self.erase_pending = not self.visible
+        if self.visible:
+            for times in (self.frame_times, *self.phase_times.values()):
+                times.clear()
+            self.frames_since_text = TEXT_REFRESH_FRAMES
+
+    # -- timing ----------------------------------------------------------
+
+    def begin_frame(self):
+        now = time.perf_counter()
+        if self.frame_started is not None:
+            self.frame_times.append(now - self.frame_started)
+        self.frame_started = now
+        self.lap_started = now
+
+    def lap(self, phase: str):
+        now = time.perf_counter()
+        self.phase_times[phase].append(now - self.lap_started)
+        self.lap_started = now
+
+    def observe(self, scene):
+        self.counts = scene.object_counts()
+
+    @property
+    def fps(self) -> float:
+        total = sum(self.frame_times)
+        return len(self.frame_times) / total if total > 0 else 0.0
+
+    def average_ms(self, phase: str) -> float:
+        times = self.phase_times[phase]
+        return 1000.0 * sum(times) / len(times) if times else 0.0
+
+    def text(self) -> list:
+        """The panel's lines of text."""
+        worst = 1000.0 * max(self.frame_times, default=0.0)
+        lines = [
+            f"{self.fps:5.1f} FPS  worst {worst:5.1f} ms",
+            "  ".join(f"{phase} {self.average_ms(phase):.2f}" for phase in PHASES) + " ms",
+        ]
+        if self.counts:
+            lines.append("  ".join(f"{name} {count:,}" for name, count in self.counts.items()))
+        return lines
+
+    # -- overlay ---------------------------------------------------------
+
+    def draw(self, screen) -> list:
+        """
+        Draw the panel on screen, keeping what was under it.
+
+        Returns the rectangles to upload: the panel, or after F3 turned it
+        off, the area it used to cover.
+        """
+        if not self.visible:
+            rects = [self.drawn_rect] if self.drawn_rect is not None else []
+            self.drawn_rect = None
+            self.erase_pending = False
+            return rects
+
+        if self.font is None:
+            pygame.font.init()
+            self.font = pygame.font.Font(None, 18)
+        if self.frames_since_text >= TEXT_REFRESH_FRAMES:
+            self.text_lines = [self.font.render(line, True, TEXT_COLOR) for line in self.text()]
+            self.frames_since_text = 0
+        self.frames_since_text += 1
+
+        line_height = self.font.get_linesize()
+        width = max([GRAPH_FRAMES * 2] + [line.get_width() for line in self.text_lines]) + 8
+        height = len(self.text_lines) * line_height + GRAPH_HEIGHT + 10
+        rect = pygame.Rect(4, 4, width, height).clip(screen.get_rect())
+        if not rect.width or not rect.height:
+            return []
+
+        self.saved_pixels = screen.subsurface(rect).copy()
+        self.drawn_rect = rect
+        screen.fill(PANEL_COLOR, rect)
+        for index, line in enumerate(self.text_lines):
+            screen.blit(line, (rect.x + 4, rect.y + 4 + index * line_height))
+
+        graph_bottom = rect.y + height - 4
+        guide_y = graph_bottom - round(GRAPH_HEIGHT * TARGET_MS / GRAPH_MAX_MS)
+        pygame.draw.line(screen, GUIDE_COLOR, (rect.x + 4, guide_y),
+                         (rect.x + 4 + GRAPH_FRAMES * 2, guide_y))
+        for index, frame_time in enumerate(self.frame_times):
+            milliseconds = 1000.0 * frame_time
+            bar = min(GRAPH_HEIGHT, max(1, round(GRAPH_HEIGHT * milliseconds / GRAPH_MAX_MS)))
+            color = SLOW_COLOR if milliseconds > TARGET_MS * 1.5 else GRAPH_COLOR
+            x = rect.x + 4 + index * 2
+            pygame.draw.line(screen, color, (x, graph_bottom), (x, graph_bottom - bar))
+        return [rect]
+
+    def restore(self, screen):
+        """Put back the pixels the panel covered, after the upload."""
+        if self.saved_pixels is not None:
+            screen.blit(self.saved_pixels, self.drawn_rect)
+            self.saved_pixels = None
+
+
+class Profiler:
+    """cProfile plus tracemalloc around a saver run, written out on stop()."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.profile = None
+
+    def start(self):
+        import cProfile
+        import tracemalloc
+
+        tracemalloc.start()
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def stop(self):
+        import tracemalloc
+
+        self.profile.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        import pstats
+
+        profile_path = f"{self.name}.prof"
+        memory_path = f"{self.name}-memory.txt"
+        self.profile.dump_stats(profile_path)
+        with open(memory_path, "w") as memory_file:
+            memory_file.write(f"Traced memory: {current / 1024:,.1f} KB held, "
+                              f"{peak / 1024:,.1f} KB peak\n\n")
+            for statistic in snapshot.statistics("lineno")[:MEMORY_TOP_LINES]:
+                memory_file.write(f"{statistic}\n")
+
+        print(f"\nProfile written to {profile_path}, memory to {memory_path} "
+              f"(peak {peak / 1024:,.1f} KB)")
+        pstats.Stats(self.profile).sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+saver_music.py - QBasic PLAY strings as square-wave music for the savers
+
+Not a conversion of any single .BAS file. BASMUSIC.BAS, MUSIC.BAS,
+COOLMUS.BAS and TESTMUS.BAS in 90s-shareware are mostly PLAY strings
+for the PC speaker ("Play up to 4 notes at a time!" meant switching
+between them every 64th note). This module reads those strings out of
+the .BAS files, parses the PLAY macro language and renders it as the
+square wave the speaker made.
+
+A tune is parsed once into notes. Each note's samples are made in one
+NumPy expression, not a loop per sample, and kept in an LRU cache keyed
+by pitch and length, so a tune that repeats the same few notes (they all
+do) builds each of them once. Tune.pcm joins them into one buffer, which
+is what a saver loops with --music; Tune.chunks() gives the same samples
+a block at a time, so a WAV file or pipe is written without ever holding
+the whole tune. The benchmark renders every tune from the four files and
+reports how many times faster than real time that was.
+
+Usage:
+  python saver_music.py BASMUSIC --list              # the tunes in a file
+  python saver_music.py BASMUSIC:StarWars            # play it
+  python saver_music.py MUSIC -o music.wav
+  python saver_music.py COOLMUS -o - | aplay          # WAV down a pipe
+  python saver_music.py --benchmark
+  python BOUNCE.py --music BASMUSIC:Entert            # background music
+
+A tune is FILE or FILE:LABEL. FILE is a .BAS path or a name in
+90s-shareware; LABEL is the GOSUB label in front of the PLAY statements
+(without it, every PLAY in the file in order).
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import re
+import sys
+import time
+import wave
+from pathlib import Path
+from typing import NamedTuple
+
+from saver_startup import lazy_import
+
+np = lazy_import("numpy")
+pygame = lazy_import("pygame")
+
+
+SHAREWARE_DIR = Path(__file__).resolve().parents[2] / "90s-shareware"
+BENCHMARK_FILES = ("BASMUSIC", "MUSIC", "COOLMUS", "TESTMUS")
+
+# 16-bit mono; square waves need nothing better
+SAMPLE_RATE = 22050
+AMPLITUDE = 6000
+CHUNK_FRAMES = 65536
+# Distinct (pitch, length) notes kept as samples
+NOTE_CACHE = 4096
+
+# PLAY defaults: T120 L4 O4 MN
+DEFAULT_TEMPO = 120
+DEFAULT_LENGTH = 4
+DEFAULT_OCTAVE = 4
+# Part of each note that sounds: MN normal, ML legato, MS staccato
+ARTICULATION = {"N": 7 / 8, "L": 1.0, "S": 3 / 4}
+
+# "Octave 3 starts with middle C", so A in octave 3 (N46) is 440 Hz
+CONCERT_A = 440.0
+CONCERT_A_NOTE = 46
+SEMITONES = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+ACCIDENTALS = {"": 0, "#": 1, "+": 1, "-": -1}
+
+PLAY_TOKEN = re.compile(r"""
+    (?P<note>[A-G])(?P<accidental>[#+-]?)(?P<length>\d*)(?P<dots>\.*)
+  | N(?P<number>\d+)(?P<number_dots>\.*)
+  | P(?P<pause>\d+)(?P<pause_dots>\.*)
+  | (?P<command>[OLT])(?P<value>\d+)
+  | M(?P<mode>[NLSFB])
+  | (?P<shift>[<>])
+""", re.VERBOSE)
+
+# Ranges QBasic accepts before "Illegal function call"
+LIMITS = {"O": (0, 6), "L": (1, 64), "T": (32, 255), "N": (0, 84), "P": (1, 64)}
+
+
+class Note(NamedTuple):
+    """One PLAY note: its number (1-84, 0 for a rest), length and sounding part."""
+
+    number: int
+    seconds: float
+    sounding: float
+
+
+def checked(letter: str, value: int) -> int:
+    """value, if QBasic would take it after letter."""
+    low, high = LIMITS[letter]
+    if not low <= value <= high:
+        raise ValueError(f"PLAY {letter}{value}: must be {low} to {high}")
+    return value
+
+
+def parse_play(text: str) -> list:
+    """The notes of a PLAY string, as a list of Note."""
+    # Spaces and semicolons only separate commands
+    text = re.sub(r"[\s;]", "", text).upper()
+    notes = []
+    tempo, length, octave = DEFAULT_TEMPO, DEFAULT_LENGTH, DEFAULT_OCTAVE
+    articulation = ARTICULATION["N"]
+
+    def seconds(of_length: int, dots: str) -> float:
+        # Tempo counts quarter notes per minute; each dot adds half again
+        return 240.0 / tempo / of_length * 1.5 ** len(dots)
+
+    position = 0
+    while position < len(text):
+        token = PLAY_TOKEN.match(text, position)
+        if token is None:
+            raise ValueError(f"PLAY: can't read {text[position:position + 8]!r} "
+                             f"(character {position + 1})")
+        position = token.end()
+        if token["note"]:
+            number = (octave * 12 + SEMITONES[token["note"]]
+                      + ACCIDENTALS[token["accidental"]] + 1)
+            note_length = checked("L", int(token["length"])) if token["length"] else length
+            # C- in octave 0 and B+ in octave 6 fall off the keyboard
+            notes.append(Note(min(max(number, 1), 84), seconds(note_length, token["dots"]),
+                              articulation))
+        elif token["number"]:
+            notes.append(Note(checked("N", int(token["number"])),
+                              seconds(length, token["number_dots"]), articulation))
+        elif token["pause"]:
+            notes.append(Note(0, seconds(checked("P", int(token["pause"])),
+                                         token["pause_dots"]), 0.0))
+        elif token["command"]:
+            value = checked(token["command"], int(token["value"]))
+            if token["command"] == "O":
+                octave = value
+            elif token["command"] == "L":
+                length = value
+            else:
+                tempo = value
+        elif token["mode"]:
+            # MF and MB (foreground / background) change nothing here
+            articulation = ARTICULATION.get(token["mode"], articulation)
+        else:
+            octave = min(6, octave + 1) if token["shift"] == ">" else max(0, octave - 1)
+    return notes
+
+
+def frequency(number: int) -> float:
+    """Hertz of PLAY note number (1-84), equal temperament."""
+    return CONCERT_A * 2.0 ** ((number - CONCERT_A_NOTE) / 12)
+
+
+@functools.lru_cache(maxsize=NOTE_CACHE)
+def note_pcm(number: int, frames: int, sound_frames: int, rate: int) -> np.ndarray:
+    """
+    Samples of one note: sound_frames of square wave, then silence.
+
+    Cached and read-only; the wave is made for the whole note at once
+    from the phase of every sample.
+    """
+    pcm = np.zeros(frames, dtype="<i2")
+    if number:
+        phase = np.arange(sound_frames) * (frequency(number) / rate)
+        pcm[:sound_frames] = np.where(phase % 1.0 < 0.5, AMPLITUDE, -AMPLITUDE)
+    pcm.flags.writeable = False
+    return pcm
+
+
+class Tune:
+    """A parsed PLAY string, rendered to 16-bit mono samples at rate."""
+
+    def __init__(self, play: str, name: str = "", rate: int = SAMPLE_RATE):
+        self.name = name
+        self.rate = rate
+        self.notes = parse_play(play)
+
+        # Note boundaries from the running total, so rounding never drifts
+        self.note_frames = []
+        elapsed = 0.0
+        start = 0
+        for note in self.notes:
+            elapsed += note.seconds
+            end = round(elapsed * rate)
+            self.note_frames.append((note.number, end - start, round((end - start) * note.sounding)))
+            start = end
+        self.frames = start
+        self._pcm = None
+
+    @property
+    def seconds(self) -> float:
+        return self.frames / self.rate
+
+    def note_buffers(self):
+        """Each note's cached samples, in order."""
+        for number, frames, sound_frames in self.note_frames:
+            yield note_pcm(number, frames, sound_frames, self.rate)
+
+    def chunks(self, chunk_frames: int = CHUNK_FRAMES):
+        """The tune as arrays of chunk_frames samples (the last may be shorter)."""
+        pending = []
+        count = 0
+        for pcm in self.note_buffers():
+            pending.append(pcm)
+            count += len(pcm)
+            while count >= chunk_frames:
+                block = np.concatenate(pending)
+                yield block[:chunk_frames]
+                pending = [block[chunk_frames:]]
+                count -= chunk_frames
+        if count:
+            yield np.concatenate(pending)
+
+    @property
+    def pcm(self) -> np.ndarray:
+        """The whole tune in one buffer, rendered on first use."""
+        if self._pcm is None:
+            self._pcm = np.concatenate(list(self.note_buffers()) or [np.zeros(0, dtype="<i2")])
+        return self._pcm
+
+
+def bas_tunes(path: Path) -> dict:
+    """
+    The PLAY strings of a .BAS file, joined per GOSUB label.
+
+    Follows PLAY "..." and string variables built with A$ = "..." + A$,
+    which is how MUSIC.BAS holds its tune. PLAY statements before the first
+    label are filed under the file's own name.
+    """
+    text = path.read_text(encoding="latin-1")
+    # A line ending in " _" continues on the next one
+    text = re.sub(r"\s_\s*\r?\n", " ", text)
+    section = path.stem.upper()
+    tunes = {}
+    variables = {}
+
+    def value(expression: str) -> str | None:
+        parts = []
+        for literal, variable in re.findall(r'"([^"]*)"?|(\w+\$)', expression):
+            if variable:
+                if variable.upper() not in variables:
+                    return None
+                parts.append(variables[variable.upper()])
+            else:
+                parts.append(literal)
+        return "".join(parts)
+
+    for line in text.splitlines():
+        line = line.strip()
+        label = re.fullmatch(r"([A-Za-z][\w.]*):", line)
+        play = re.match(r"PLAY\s+(.*)", line, re.IGNORECASE)
+        assignment = re.match(r"(\w+\$)\s*=\s*(.*)", line)
+        if label:
+            section = label.group(1)
+        elif play:
+            play = value(play.group(1))
+            if play:
+                tunes[section] = tunes.get(section, "") + play
+        elif assignment:
+            variables[assignment.group(1).upper()] = value(assignment.group(2)) or ""
+    return tunes
+
+
+def find_bas(name: str) -> Path:
+    """A .BAS path as given, or the file called name in 90s-shareware."""
+    path = Path(name)
+    if path.is_file():
+        return path
+    stem = path.stem if path.suffix.upper() == ".BAS" else path.name
+    for candidate in SHAREWARE_DIR.glob("*"):
+        if candidate.stem.upper() == stem.upper() and candidate.suffix.upper() == ".BAS":
+            return candidate
+    raise ValueError(f"no {name} here or in {SHAREWARE_DIR}")
+
+
+def load_tune(spec: str, rate: int = SAMPLE_RATE) -> Tune:
+    """The tune FILE or FILE:LABEL (see the module docstring)."""
+    name, _, label = spec.partition(":")
+    tunes = bas_tunes(find_bas(name))
+    if not tunes:
+        raise ValueError(f"no PLAY strings in {name}")
+    if not label:
+        return Tune("".join(tunes.values()), spec, rate)
+    for section, play in tunes.items():
+        if section.upper() == label.upper():
+            return Tune(play, spec, rate)
+    raise ValueError(f"no tune {label!r} in {name}; it has {', '.join(tunes)}")
+
+
+def tune_argument(spec: str) -> Tune:
+    """argparse type for --music: the loaded tune."""
+    try:
+        return load_tune(spec)
+    except (OSError, ValueError) as error:
+        raise argparse.ArgumentTypeError(str(error))
+
+
+def write_wav(tune: Tune, output, chunk_frames: int = CHUNK_FRAMES):
+    """Stream tune to output (a path or a binary file, such as a pipe) as WAV."""
+    with wave.open(output, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(tune.rate)
+        # Known up front, so the header never has to be patched (pipes can't seek)
+        wav.setnframes(tune.frames)
+        for chunk in tune.chunks(chunk_frames):
+            wav.writeframesraw(chunk.tobytes())
+
+
+def play_background(tune: Tune):
+    """
+    Start looping tune through pygame's mixer; returns the Sound, or None.
+
+    Only initializes the audio subsystem itself, so savers without --music
+    never open an audio device.
+    """
+    try:
+        # allowedchanges=0: SDL converts to the device's format, not us
+        pygame.mixer.init(frequency=tune.rate, size=-16, channels=1, allowedchanges=0)
+    except pygame.error as error:
+        print(f"No sound for --music: {error}")
+        return None
+    sound = pygame.mixer.Sound(buffer=tune.pcm.tobytes())
+    sound.play(loops=-1)
+    return sound
+
+
+def play_tune(tune: Tune):
+    """Play tune once and wait for it to finish (ESC or Ctrl+C stops it)."""
+    sound = play_background(tune)
+    if sound is None:
+        return
+    sound.stop()
+    sound.play()
+    print(f"Playing {tune.name} ({tune.seconds:.1f} s, Ctrl+C to stop)")
+    try:
+        while pygame.mixer.get_busy():
+            time.sleep(0.1)
+    except KeyboardInterrupt:
+        pass
+    pygame.mixer.quit()
+
+
+def run_benchmark():
+    """Render every tune in BENCHMARK_FILES and report against real time."""
+    # NumPy is imported lazily: finish the import, and the first calls of
+    # the functions a render uses, before the first tune is timed
+    Tune("L64 C D E F G A B P64").pcm
+    note_pcm.cache_clear()
+
+    print(f"{'tune':<20} {'notes':>6} {'audio s':>8} {'parse ms':>9} "
+          f"{'cold ms':>8} {'cached ms':>9} {'x real time':>12}")
+    count = 0
+    total_audio = total_render = 0.0
+    for name in BENCHMARK_FILES:
+        for label, play in bas_tunes(find_bas(name)).items():
+            started = time.perf_counter()
+            tune = Tune(play, f"{name}:{label}")
+            parsed = time.perf_counter()
+            note_pcm.cache_clear()
+            tune.pcm
+            cold = time.perf_counter()
+            # The same tune again, now built from cached notes
+            again = Tune(play)
+            warm_started = time.perf_counter()
+            again.pcm
+            warm = time.perf_counter()
+
+            render = cold - started
+            count += 1
+            total_audio += tune.seconds
+            total_render += render
+            print(f"{tune.name:<20} {len(tune.notes):>6} {tune.seconds:>8.1f} "
+                  f"{1000 * (parsed - started):>9.2f} {1000 * (cold - parsed):>8.2f} "
+                  f"{1000 * (warm - warm_started):>9.2f} {tune.seconds / render:>12,.0f}")
+
+    print(f"\nAll {count} tunes: {total_audio:.1f} s of audio parsed and rendered "
+          f"in {1000 * total_render:.1f} ms ({total_audio / total_render:,.0f}x real time)")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Render QBasic PLAY strings from a .BAS file as square-wave audio",
+    )
+    parser.add_argument(
+        "tune", nargs="?",
+        help="FILE or FILE:LABEL, FILE being a .BAS path or a name in 90s-shareware",
+    )
+    parser.add_argument(
+        "-o", "--output", metavar="WAV",
+        help="Write a WAV file instead of playing (- for standard output)",
+    )
+    parser.add_argument(
+        "--list", action="store_true",
+        help="List the labelled tunes in FILE",
+    )
+    parser.add_argument(
+        "--benchmark", action="store_true",
+        help=f"Time rendering every tune in {', '.join(BENCHMARK_FILES)}",
+    )
+    args = parser.parse_args()
+    if not args.tune and not args.benchmark:
+        parser.error("give a tune, or --benchmark")
+    return args
+
+
+def main():
+    args = parse_args()
+    if args.benchmark:
+        run_benchmark()
+        return
+
+    try:
+        if args.list:
+            path = find_bas(args.tune.partition(":")[0])
+            for label, play in bas_tunes(path).items():
+                tune = Tune(play, label)
+                print(f"{path.stem}:{label:<12} {len(tune.notes):>6} notes {tune.seconds:>7.1f} s")
+            return
+        tune = load_tune(args.tune)
+    except (OSError, ValueError) as error:
+        sys.exit(f"saver_music.py: error: {error}")
+
+    if args.output == "-":
+        write_wav(tune, sys.stdout.buffer)
+    elif args.output:
+        write_wav(tune, args.output)
+        print(f"Wrote {tune.seconds:.1f} s to {args.output}")
+    else:
+        play_tune(tune)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+saver_raster.py - Array helpers shared by the NumPy screensavers
+
+Not a conversion of any single .BAS file. Two savers need the same
+whole-array tricks as a third, so they live here instead of one saver
+importing another:
+
+- grid_pairs() hashes points into a uniform grid and returns the
+  candidate pairs from each cell and its neighbors (BOUNCE3.py's
+  collisions, SHBONCE2.py's mesh edges).
+- rasterize_segments() adds a value to every pixel of many line segments
+  at once (LINES.py --accumulate, SHBONCE2.py).
+
+There is no command line; run the savers instead.
+"""
+
+from __future__ import annotations
+
+from saver_startup import lazy_import
+
+np = lazy_import("numpy")
+
+
+# The cell itself and the 4 neighbors after it; the other 4 neighbors see
+# this cell as one of theirs
+FORWARD_NEIGHBORS = ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+# Most segment pixels rasterized in one batch (bounds the temporary arrays)
+RASTER_BATCH = 1_000_000
+
+
+def grid_pairs(x: np.ndarray, y: np.ndarray, cell_size: float,
+               width: int, height: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Candidate pairs (i, j) from a uniform-grid spatial hash.
+
+    Points are sorted by cell; for every point and every forward
+    neighbor cell, the pairs with the points stored in that cell are
+    produced with np.repeat instead of a Python loop. Within a point's
+    own cell only later points are paired, so each pair appears once.
+    """
+    columns = max(1, int(width // cell_size) + 1)
+    rows = max(1, int(height // cell_size) + 1)
+    cell_x = np.clip((x // cell_size).astype(np.intp), 0, columns - 1)
+    cell_y = np.clip((y // cell_size).astype(np.intp), 0, rows - 1)
+    keys = cell_y * columns + cell_x
+
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    cells = np.arange(columns * rows)
+    cell_start = np.searchsorted(sorted_keys, cells, side="left")
+    cell_end = np.searchsorted(sorted_keys, cells, side="right")
+
+    sorted_x = cell_x[order]
+    sorted_y = cell_y[order]
+    positions = np.arange(len(order))
+    firsts, seconds = [], []
+    for offset_x, offset_y in FORWARD_NEIGHBORS:
+        neighbor_x = sorted_x + offset_x
+        neighbor_y = sorted_y + offset_y
+        valid = (neighbor_x >= 0) & (neighbor_x < columns) & (neighbor_y < rows)
+        neighbor = (neighbor_y * columns + neighbor_x)[valid]
+        owners = positions[valid]
+
+        if offset_x == 0 and offset_y == 0:
+            low = owners + 1
+        else:
+            low = cell_start[neighbor]
+        high = cell_end[neighbor]
+        counts = np.maximum(high - low, 0)
+        total = int(counts.sum())
+        if not total:
+            continue
+
+        # For owner k with counts[k] partners starting at low[k], emit
+        # low[k], low[k] + 1, ... without looping
+        run_starts = np.cumsum(counts) - counts
+        partner = np.arange(total) - np.repeat(run_starts - low, counts)
+        firsts.append(order[np.repeat(owners, counts)])
+        seconds.append(order[partner])
+
+    if not firsts:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+def rasterize_segments(intensity, start_x, start_y, end_x, end_y, weight=None):
+    """
+    Add weight[k] (or one) to every pixel of segment k, for all at once.
+
+    intensity is a (height, width) float array; the starts may be arrays
+    or one shared point, and must be on it. Segments are clipped where
+    they leave the screen, then every segment is cut into one sample per
+    pixel step along its longer axis, and all samples of a batch are
+    turned into flat pixel indexes and summed: plain counts with
+    np.bincount, weights with np.add.at. On NumPy 2, np.add.at with an
+    array of values beats a weighted np.bincount, which builds a float64
+    array the size of the screen for every batch; with a scalar value it
+    loses its fast path and is some 40 times slower than np.bincount.
+    """
+    height, width = intensity.shape
+    delta_x = end_x - start_x
+    delta_y = end_y - start_y
+    steps = np.maximum(np.abs(delta_x), np.abs(delta_y)).astype(np.int64)
+
+    # Fraction of each segment that is on screen
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exit_x = np.where(delta_x > 0, (width - 1 - start_x) / delta_x,
+                          np.where(delta_x < 0, -start_x / delta_x, np.inf))
+        exit_y = np.where(delta_y > 0, (height - 1 - start_y) / delta_y,
+                          np.where(delta_y < 0, -start_y / delta_y, np.inf))
+    visible = np.minimum(1.0, np.minimum(exit_x, exit_y))
+    samples = (np.floor(steps * visible) + 1).astype(np.int64)
+
+    # Per-pixel step along each segment; the +0.5 makes truncation round
+    steps = np.maximum(steps, 1)
+    step_x = (delta_x / steps).astype(np.float32)
+    step_y = (delta_y / steps).astype(np.float32)
+    origin_x = np.asarray(start_x + 0.5, dtype=np.float32)
+    origin_y = np.asarray(start_y + 0.5, dtype=np.float32)
+    if weight is not None:
+        weight = np.asarray(weight, dtype=intensity.dtype)
+
+    flat = intensity.reshape(-1)
+    ends = np.cumsum(samples)
+    first = 0
+    while first < len(samples):
+        # As many segments as fit in one batch, but at least one
+        batch_start = ends[first] - samples[first]
+        batch_end = max(first + 1, int(np.searchsorted(ends, batch_start + RASTER_BATCH,
+                                                       side="right")))
+        batch = slice(first, batch_end)
+        counts = samples[batch]
+        run_starts = (np.cumsum(counts) - counts).astype(np.int32)
+        step = np.arange(int(counts.sum()), dtype=np.int32) - np.repeat(run_starts, counts)
+        step = step.astype(np.float32)
+        # Per-segment values stretched to one per sample; np.repeat is much
+        # faster than indexing with a segment number per sample
+        x = np.repeat(step_x[batch], counts) * step
+        x += np.repeat(origin_x[batch], counts) if origin_x.ndim else origin_x
+        y = np.repeat(step_y[batch], counts) * step
+        y += np.repeat(origin_y[batch], counts) if origin_y.ndim else origin_y
+        index = y.astype(np.int32)
+        index *= width
+        index += x.astype(np.int32)
+        if weight is None:
+            flat += np.bincount(index, minlength=flat.size)
+        else:
+            np.add.at(flat, index, np.repeat(weight[batch], counts))
+        first = batch_end
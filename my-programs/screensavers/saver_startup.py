@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+saver_startup.py - Lazy imports and startup timing for the pygame screensavers
+
+Not a conversion of any single .BAS file. A QBasic saver was on screen as
+soon as QB.EXE had loaded it. A Python saver first imports pygame, which
+pulls in NumPy and pkg_resources and costs more than everything else
+before the first frame put together, so even `--help`, a mistyped option
+or SQUBONC3.py's "how many figers" prompt used to wait for it.
+
+The savers now get pygame (and NumPy) from lazy_import(): the module
+object exists at once, but is only really imported the first time one of
+its attributes is used, which is after the arguments have been parsed
+and any questions answered. saver_main() then starts only SDL's video
+subsystem (pygame.display.init()) instead of pygame.init(), which would
+also bring up audio, joysticks and the rest that no saver uses.
+
+Run this file to check that it stays that way:
+
+  python saver_startup.py                  # every saver's --help
+  python saver_startup.py --budget-ms 40   # fail (exit 1) above 40 ms
+
+Each saver is started with `python -X importtime SAVER.py --help`; the
+import times it reports, minus those of a bare interpreter, are what the
+saver itself costs before it can print its help. Any saver over budget,
+or that imported pygame at all, fails the check.
+"""
+
+import importlib.util
+import os
+import sys
+
+
+# Import time a saver may spend before --help is printed
+STARTUP_BUDGET_MS = 75.0
+STARTUP_RUNS = 5
+# Heaviest imports listed for each saver
+TOP_IMPORTS = 3
+
+
+def lazy_import(name: str):
+    """
+    The module called name, imported the first time an attribute is used.
+
+    Returns the real module if it has already been imported. Raises
+    ModuleNotFoundError straight away if it is not installed at all.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def import_times(command: list) -> tuple[dict, set]:
+    """
+    Run `python -X importtime` on command.
+
+    Returns the cumulative microseconds of each top-level import, and the
+    names of every module imported at any depth.
+    """
+    import subprocess
+
+    result = subprocess.run([sys.executable, "-X", "importtime", *command],
+                            capture_output=True, text=True)
+    times = {}
+    names = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # the header
+        names.add(name.strip())
+        # Imports made by another import are indented under it
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times, names
+
+
+def sdl_init_ms(call: str) -> float:
+    """Milliseconds pygame takes to run call, such as "pygame.init()", in a fresh process."""
+    import subprocess
+
+    snippet = ("import time, pygame; started = time.perf_counter(); "
+               f"{call}; print(time.perf_counter() - started)")
+    result = subprocess.run([sys.executable, "-c", snippet], capture_output=True, text=True,
+                            env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"})
+    return 1000.0 * float(result.stdout.split()[-1])
+
+
+def measure_startup(budget_ms: float, runs: int) -> list:
+    """Print each saver's import cost before --help; returns the savers that failed."""
+    from pathlib import Path
+
+    here = Path(__file__).resolve().parent
+    savers = sorted(path for path in here.glob("*.py") if path.stem.isupper())
+    interpreter_modules = import_times(["-c", "pass"])[1]
+
+    print(f"Imports before --help, best of {runs} runs, "
+          f"bare interpreter excluded (budget {budget_ms:.0f} ms)")
+    print(f"{'saver':<12} {'ms':>7}  {'pygame':<7} heaviest imports")
+    failed = []
+    for path in savers:
+        best = None
+        for _ in range(runs):
+            times, names = import_times([str(path), "--help"])
+            total = sum(cumulative for name, cumulative in times.items()
+                        if name not in interpreter_modules) / 1000.0
+            if best is None or total < best[0]:
+                best = (total, times, names)
+        total, times, names = best
+
+        heaviest = sorted(((cumulative, name) for name, cumulative in times.items()
+                           if name not in interpreter_modules), reverse=True)[:TOP_IMPORTS]
+        pygame_loaded = "pygame" in names
+        if total > budget_ms or pygame_loaded:
+            failed.append(path.stem)
+        print(f"{path.stem:<12} {total:>7.1f}  {'yes' if pygame_loaded else 'no':<7} "
+              + ", ".join(f"{name} {cumulative / 1000:.1f}" for cumulative, name in heaviest))
+
+    print()
+    print("Starting SDL after the import (fresh process each):")
+    for call in ("pygame.display.init()", "pygame.init()"):
+        print(f"  {call:<22} {sdl_init_ms(call):7.1f} ms")
+    return failed
+
+
+def parse_args():
+    """Parse command line arguments."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Time each saver's imports before --help against a budget",
+    )
+    parser.add_argument(
+        "--budget-ms", type=float, default=STARTUP_BUDGET_MS,
+        help=f"Most import time a saver may spend before --help (default: {STARTUP_BUDGET_MS:.0f})",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=STARTUP_RUNS,
+        help=f"Runs per saver; the fastest counts (default: {STARTUP_RUNS})",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    failed = measure_startup(args.budget_ms, args.runs)
+    if failed:
+        print(f"\nOver budget or imported pygame: {', '.join(failed)}")
+        sys.exit(1)
+    print("\nAll savers within budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+saver_terminal.py - Terminal backend for the pygame screensavers
+
+Not a conversion of any single .BAS file. Lets any saver run in a text
+terminal, over SSH if need be, the way ASCII.py already does:
+
+  python BOUNCE.py --terminal                   # braille dots, 2x4 per cell
+  python LINES.py --terminal halfblock          # two square pixels per cell
+  python SCREEN.py --terminal --bandwidth 4000  # never send over 4 KB/s
+
+The scene is built at native size for the terminal's dot grid (each
+character cell holds 2x4 braille dots or two half blocks), so pygame's
+own line and circle rasterizers draw straight into dots and the scene
+scales its speeds and sizes the same way as with --native.
+
+Each frame only the cells under the scene's dirty rectangles are
+converted, and of those only the cells whose character or color actually
+changed are sent, with cursor-addressed ANSI sequences.
+Cells are sent in row order and a color escape is only written when the
+color changes, so runs of same-colored cells share one.
+
+With --bandwidth the output is held to that many bytes per second. A
+frame that would go over budget sends what fits and leaves the other
+cells marked stale; they go out in later frames, starting where the last
+frame stopped. A slow link therefore shows a picture that fills in late
+instead of a backlog of frames that keeps the saver seconds behind.
+
+Keys typed in the terminal are handed to the scene as pygame key events:
+arrows, SPACE, TAB, letters and + / -. ESC or Q quits. F3 shows the HUD's
+timings as text on the bottom row, which the drawing leaves free.
+"""
+
+import os
+import select
+import shutil
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from saver_hud import TEXT_REFRESH_FRAMES
+
+
+BRAILLE_BASE = 0x2800
+UPPER_HALF_BLOCK = 0x2580
+SPACE = 0x20
+
+# Braille dot bit for each (row, column) in a 4x2 cell
+BRAILLE_BITS = np.array([
+    [0x01, 0x08],
+    [0x02, 0x10],
+    [0x04, 0x20],
+    [0x40, 0x80],
+], dtype=np.uint16)
+
+# Cell shapes in dots: (width, height)
+CELL_SHAPES = {
+    "braille": (2, 4),
+    "halfblock": (1, 2),
+}
+
+# xterm 256-color cube index for black; used as every cell's background
+BLACK = 16
+
+# Channel value (0-255) to xterm color cube level (0-5)
+CUBE_LEVELS = np.array([0 if value < 48 else 1 if value < 115 else (value - 35) // 40
+                        for value in range(256)], dtype=np.int16)
+
+TYPED_KEYS = {
+    b" ": pygame.K_SPACE,
+    b"\t": pygame.K_TAB,
+    b"\033": pygame.K_ESCAPE,
+    b"q": pygame.K_ESCAPE,
+    b"Q": pygame.K_ESCAPE,
+}
+
+# Escape sequences for special keys (arrows, and F3 in its two usual forms)
+SEQUENCE_KEYS = {
+    b"\033[A": pygame.K_UP,
+    b"\033[B": pygame.K_DOWN,
+    b"\033[C": pygame.K_RIGHT,
+    b"\033[D": pygame.K_LEFT,
+    b"\033OR": pygame.K_F3,
+    b"\033[13~": pygame.K_F3,
+}
+
+ENTER_SCREEN = b"\033[?1049h\033[?25l\033[0;48;5;16m\033[2J"
+LEAVE_SCREEN = b"\033[0m\033[?25h\033[?1049l"
+
+# Most one cell can take: cursor move, both colors and a 3-byte character
+MAX_PIECE_BYTES = 40
+
+
+def to_xterm_colors(rgb: np.ndarray) -> np.ndarray:
+    """Map an (..., 3) array of RGB values to xterm 256-color cube indexes."""
+    levels = CUBE_LEVELS[rgb]
+    return 16 + 36 * levels[..., 0] + 6 * levels[..., 1] + levels[..., 2]
+
+
+def terminal_grid() -> tuple[int, int]:
+    """Columns and rows to draw on, leaving the bottom row so nothing scrolls."""
+    columns, rows = shutil.get_terminal_size((80, 24))
+    return (columns, max(1, rows - 1))
+
+
+class TerminalFramebuffer:
+    """
+    The surface a scene draws on, presented as character cells.
+
+    Has the same surface/size/clear/present interface as Framebuffer, so
+    run_scene() drives it unchanged. The terminal's current contents are
+    tracked per cell (character, foreground, background), which is what
+    lets present() send differences only.
+    """
+
+    factor = 1
+
+    def __init__(self, mode: str = "braille", bandwidth: int = 0,
+                 grid: tuple[int, int] | None = None, output=None):
+        self.mode = mode
+        self.columns, self.rows = grid or terminal_grid()
+        self.cell_width, self.cell_height = CELL_SHAPES[mode]
+        self.surface = pygame.Surface((self.columns * self.cell_width,
+                                       self.rows * self.cell_height))
+        # run_benchmark reports sizes against the "window"
+        self.window = self.surface
+        self.output = output or sys.stdout.buffer
+        self.bandwidth = bandwidth
+        self.allowance = float(bandwidth)
+        self.last_present = time.perf_counter()
+
+        shape = (self.rows, self.columns)
+        self.target_chars = np.full(shape, SPACE, dtype=np.int32)
+        self.target_fg = np.full(shape, BLACK, dtype=np.int16)
+        self.target_bg = np.full(shape, BLACK, dtype=np.int16)
+        self.shown_chars = self.target_chars.copy()
+        self.shown_fg = self.target_fg.copy()
+        self.shown_bg = self.target_bg.copy()
+        self.stale = np.zeros(shape, dtype=bool)
+        self.resume_row = 0
+
+        self.encoded = {}
+        self.bytes_sent = 0
+        self.cells_sent = 0
+        self.frames = 0
+        self.started = time.perf_counter()
+        self.input_settings = None
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.surface.get_size()
+
+    # -- terminal setup --------------------------------------------------
+
+    def open(self):
+        """Switch to the alternate screen and put the keyboard in cbreak mode."""
+        if sys.stdin.isatty():
+            import termios
+            import tty
+            self.input_settings = termios.tcgetattr(sys.stdin)
+            tty.setcbreak(sys.stdin.fileno())
+        self.write(ENTER_SCREEN)
+
+    def close(self):
+        """Restore the terminal and report what was sent."""
+        self.write(LEAVE_SCREEN)
+        if self.input_settings is not None:
+            import termios
+            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.input_settings)
+            self.input_settings = None
+
+        elapsed = time.perf_counter() - self.started
+        if self.frames and elapsed > 0:
+            budget = f"{self.bandwidth:,} B/s budget" if self.bandwidth else "no budget"
+            print(f"Terminal: {self.columns}x{self.rows} {self.mode} cells, "
+                  f"{self.frames} frames, {self.cells_sent / self.frames:,.1f} cells/frame, "
+                  f"{self.bytes_sent / self.frames:,.0f} bytes/frame, "
+                  f"{self.bytes_sent / elapsed:,.0f} bytes/s ({budget})", file=sys.stderr)
+
+    def write(self, data: bytes):
+        self.output.write(data)
+        self.output.flush()
+
+    # -- keyboard --------------------------------------------------------
+
+    def poll_keys(self):
+        """Turn whatever has been typed into pygame KEYDOWN events."""
+        if self.input_settings is None:
+            return
+        data = b""
+        while select.select([sys.stdin], [], [], 0)[0]:
+            chunk = os.read(sys.stdin.fileno(), 64)
+            if not chunk:
+                break
+            data += chunk
+
+        index = 0
+        while index < len(data):
+            byte = data[index:index + 1]
+            sequence = next((sequence for sequence in SEQUENCE_KEYS
+                             if data.startswith(sequence, index)), None)
+            if sequence is not None:
+                key = SEQUENCE_KEYS[sequence]
+                index += len(sequence)
+            elif byte in TYPED_KEYS:
+                key = TYPED_KEYS[byte]
+                index += 1
+            else:
+                index += 1
+                try:
+                    key = pygame.key.key_code(byte.decode("latin-1").lower())
+                except ValueError:
+                    continue
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    # -- rendering -------------------------------------------------------
+
+    def clear(self):
+        self.surface.fill((0, 0, 0))
+        self.write(b"\033[0;48;5;16m\033[2J")
+        self.shown_chars.fill(SPACE)
+        self.shown_fg.fill(BLACK)
+        self.shown_bg.fill(BLACK)
+        self.target_chars.fill(SPACE)
+        self.target_fg.fill(BLACK)
+        self.target_bg.fill(BLACK)
+        self.stale.fill(False)
+
+    def cell_range(self, rect) -> tuple[int, int, int, int] | None:
+        """Rows and columns of the cells a surface rectangle touches."""
+        rect = self.surface.get_rect().clip(rect)
+        if not rect.width or not rect.height:
+            return None
+        return (rect.top // self.cell_height, -(-rect.bottom // self.cell_height),
+                rect.left // self.cell_width, -(-rect.right // self.cell_width))
+
+    def convert(self, pixels: np.ndarray, top: int, bottom: int, left: int, right: int):
+        """Recompute the target cells in rows top:bottom, columns left:right."""
+        cell_width, cell_height = self.cell_width, self.cell_height
+        # surfarray is indexed [x][y]; cells want [row][dot row][column][dot column]
+        block = pixels[left * cell_width:right * cell_width,
+                       top * cell_height:bottom * cell_height].transpose(1, 0, 2)
+        block = block.reshape(bottom - top, cell_height, right - left, cell_width, 3)
+        cells = (slice(top, bottom), slice(left, right))
+
+        if self.mode == "braille":
+            lit = block.any(axis=4)
+            bits = (lit * BRAILLE_BITS[None, :, None, :]).sum(axis=(1, 3))
+            self.target_chars[cells] = np.where(bits > 0, BRAILLE_BASE + bits, SPACE)
+            self.target_fg[cells] = to_xterm_colors(block.max(axis=(1, 3)))
+        else:
+            upper = to_xterm_colors(block[:, 0, :, 0])
+            lower = to_xterm_colors(block[:, 1, :, 0])
+            self.target_chars[cells] = np.where((upper == BLACK) & (lower == BLACK),
+                                                SPACE, UPPER_HALF_BLOCK)
+            self.target_fg[cells] = upper
+            self.target_bg[cells] = lower
+
+    def character(self, code: int) -> bytes:
+        encoded = self.encoded.get(code)
+        if encoded is None:
+            encoded = self.encoded[code] = chr(code).encode("utf-8")
+        return encoded
+
+    def present(self, dirty_rects: list | None, stats=None, hud=None):
+        """Convert what changed to cells and send the cells that differ."""
+        self.poll_keys()
+        if hud is not None:
+            self.show_status(hud)
+
+        pixels = pygame.surfarray.pixels3d(self.surface)
+        if dirty_rects is None:
+            self.convert(pixels, 0, self.rows, 0, self.columns)
+            # Full refresh: resend every cell, changed or not
+            self.stale.fill(True)
+        else:
+            for rect in dirty_rects:
+                cells = self.cell_range(rect)
+                if cells is not None:
+                    self.convert(pixels, *cells)
+        del pixels
+
+        # A space only needs the black background; its foreground is invisible
+        blank = self.target_chars == SPACE
+        self.stale |= ((self.target_chars != self.shown_chars)
+                       | (self.target_bg != self.shown_bg)
+                       | (~blank & (self.target_fg != self.shown_fg)))
+
+        sent = self.send_stale()
+        self.frames += 1
+        if stats is not None:
+            stats.record_frame(sent * self.cell_width * self.cell_height)
+
+    def show_status(self, hud):
+        """Write the HUD's text on the bottom row, or blank it once F3 hides it."""
+        if hud.visible:
+            hud.frames_since_text += 1
+            if hud.frames_since_text < TEXT_REFRESH_FRAMES:
+                return
+            hud.frames_since_text = 0
+            text = " | ".join(hud.text())[:self.columns]
+        else:
+            hud.erase_pending = False
+            text = ""
+        self.write(b"\033[%d;1H\033[0;48;5;16m\033[2K\033[33m%s" % (self.rows + 1, text.encode()))
+
+    def send_stale(self) -> int:
+        """Write stale cells in row order, within the bandwidth budget."""
+        now = time.perf_counter()
+        if self.bandwidth:
+            # Allow at most a quarter second of burst, but never less than
+            # one cell, or a tiny budget would never send anything
+            self.allowance = min(self.allowance + (now - self.last_present) * self.bandwidth,
+                                 max(self.bandwidth / 4, MAX_PIECE_BYTES))
+        self.last_present = now
+
+        rows, columns = np.nonzero(self.stale)
+        if not rows.size:
+            return 0
+        # Start from where the last over-budget frame left off
+        first = np.searchsorted(rows, self.resume_row)
+        order = np.concatenate((np.arange(first, rows.size), np.arange(first)))
+
+        chars, fgs, bgs = self.target_chars, self.target_fg, self.target_bg
+        output = bytearray()
+        limit = self.allowance if self.bandwidth else float("inf")
+        # Colors and cursor position are unknown at the start of each frame
+        cursor = None
+        fg = bg = None
+        sent = 0
+        self.resume_row = 0
+
+        for index in order.tolist():
+            row, column = int(rows[index]), int(columns[index])
+            code = int(chars[row, column])
+            cell_fg, cell_bg = int(fgs[row, column]), int(bgs[row, column])
+
+            piece = bytearray()
+            if cursor != (row, column):
+                if cursor is not None and cursor[0] == row and column > cursor[1]:
+                    piece += b"\033[%dC" % (column - cursor[1])
+                else:
+                    piece += b"\033[%d;%dH" % (row + 1, column + 1)
+            wanted_fg = fg if code == SPACE else cell_fg
+            if wanted_fg != fg and cell_bg != bg:
+                piece += b"\033[38;5;%d;48;5;%dm" % (wanted_fg, cell_bg)
+            elif wanted_fg != fg:
+                piece += b"\033[38;5;%dm" % wanted_fg
+            elif cell_bg != bg:
+                piece += b"\033[48;5;%dm" % cell_bg
+            piece += self.character(code)
+
+            if len(output) + len(piece) > limit:
+                self.resume_row = row
+                break
+            output += piece
+            cursor = (row, column + 1)
+            fg, bg = wanted_fg, cell_bg
+            self.shown_chars[row, column] = code
+            self.shown_fg[row, column] = cell_fg
+            self.shown_bg[row, column] = cell_bg
+            self.stale[row, column] = False
+            sent += 1
+
+        if output:
+            self.write(bytes(output))
+            self.bytes_sent += len(output)
+            self.cells_sent += sent
+            if self.bandwidth:
+                self.allowance -= len(output)
+        return sent